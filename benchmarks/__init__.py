@@ -0,0 +1,18 @@
+"""
+性能基准测试
+
+不依赖图形界面的端到端基准测试，包括:
+- workbook_generator: 生成接近真实数据的双工作表测试工作簿
+- run_benchmarks: 对测试工作簿的副本调用analyze_workbook，报告其各阶段耗时（加载、预处理匹配原表、
+  匹配、标记颜色、写入结果、保存），并输出包含吞吐量和峰值内存的JSON报告
+- standardizer_benchmark: 标准化函数的微基准测试，以及与黄金文件比较的差异校验
+- baseline_standardizer: 冻结的最初标准化实现，黄金文件的期望输出由它生成
+- differential_check: 匹配引擎、匹配原表索引、重复检测和增量分析与参照实现的差异校验
+
+使用示例:
+    python -m benchmarks.run_benchmarks --sizes 10k 100k
+    python -m benchmarks.run_benchmarks --sizes 1m --match-mode batch --output report.json
+    python -m benchmarks.workbook_generator 测试.xlsx --rows 100000 --duplicates 0.1
+    python -m benchmarks.standardizer_benchmark --check-only
+    python -m benchmarks.differential_check --trials 100
+"""
@@ -0,0 +1,180 @@
+"""
+最初的标准化实现（参照实现）
+
+本模块冻结了优化之前（正则表达式级联和链式replace）的日期、客户名称和产品名称标准化，
+作为standardizer_benchmark差异校验的参照，黄金文件中的期望输出由本模块生成。
+不要修改本模块的行为：有意修改标准化规则时，在standardizer_benchmark中登记预期差异。
+
+与最初的实现相比只有两处改动:
+- 只写月份的日期使用的年份取自模块变量year（为None时使用当前年份），便于固定年份
+- 移除调试日志
+
+作者: 供应商数据智能匹配系统开发团队
+版本: 1.0
+"""
+
+import re
+from datetime import datetime
+from typing import Optional
+
+# 只写月份的日期使用的年份，为None时使用当前年份
+year: Optional[str] = None
+
+
+def standardize_data(value: str, column_index: int) -> str:
+    """
+    数据标准化主函数（参照实现）
+
+    参数:
+        value (str): 需要标准化的原始数据值
+        column_index (int): 列索引，1为日期，2为客户名称，3为产品名称，其他原样返回
+
+    返回:
+        str: 标准化后的数据值
+    """
+    if not value:
+        return ""
+
+    value = ''.join(value.split())
+
+    if column_index == 1:
+        return _standardize_date(value)
+    elif column_index == 2:
+        return _standardize_customer_name(value)
+    elif column_index == 3:
+        return _standardize_product_name(value)
+
+    return value
+
+
+def _standardize_date(value: str) -> str:
+    """
+    标准化日期数据（参照实现）
+
+    参数:
+        value (str): 已移除空白字符的日期字符串
+
+    返回:
+        str: YYYYMM格式的日期、逗号分隔的日期范围，或无法解析时处理后的原值
+    """
+    cn_num_map = {
+        '一': '1', '二': '2', '三': '3', '四': '4',
+        '五': '5', '六': '6', '七': '7', '八': '8',
+        '九': '9', '十': '10', '正': '1'
+    }
+
+    for cn, num in cn_num_map.items():
+        value = value.replace(cn, num)
+
+    date_range = _parse_date_range(value)
+    if date_range:
+        return date_range
+
+    value = value.replace('月', '').replace('年', '')
+
+    date_patterns = [
+        (r'(\d{4})[-/.]?(\d{1,2})', 2),
+        (r'(\d{2})(\d{2})', 2),
+        (r'(\d{1,2})', 1),
+    ]
+
+    for pattern, group_count in date_patterns:
+        match = re.match(pattern, value)
+        if match:
+            try:
+                groups = match.groups()
+
+                if group_count == 2:
+                    date_year, month = groups
+                    if len(date_year) == 2:
+                        date_year = '20' + date_year
+                else:
+                    date_year = year if year is not None else str(datetime.now().year)
+                    month = groups[0]
+
+                month = int(month)
+                if 1 <= month <= 12:
+                    month = str(month).zfill(2)
+                    return f"{date_year}{month}"
+            except (ValueError, IndexError):
+                pass
+
+    return value
+
+
+def _parse_date_range(value: str) -> Optional[str]:
+    """
+    解析日期范围（参照实现）
+
+    参数:
+        value (str): 日期范围字符串
+
+    返回:
+        Optional[str]: 逗号分隔的月份列表，不是日期范围时返回None
+    """
+    cn_range_patterns = [
+        r'(\d{2,4})年(\d{1,2})月[到至和-](\d{1,2})月',
+        r'(\d{2,4})年(\d{1,2})[到至和-](\d{1,2})月',
+    ]
+
+    for pattern in cn_range_patterns:
+        match = re.search(pattern, value)
+        if match:
+            range_year = match.group(1)
+            if len(range_year) == 2:
+                range_year = '20' + range_year
+
+            start_month = int(match.group(2))
+            end_month = int(match.group(3))
+
+            if 1 <= start_month <= 12 and 1 <= end_month <= 12:
+                months = [f"{range_year}{str(m).zfill(2)}"
+                          for m in range(start_month, end_month + 1)]
+                return ",".join(months)
+
+    num_range_pattern = r'(\d{4})(\d{1,2})-(\d{1,2})'
+    match = re.search(num_range_pattern, value)
+    if match:
+        range_year = match.group(1)
+        start_month = int(match.group(2))
+        end_month = int(match.group(3))
+
+        if 1 <= start_month <= 12 and 1 <= end_month <= 12:
+            months = [f"{range_year}{str(m).zfill(2)}"
+                      for m in range(start_month, end_month + 1)]
+            return ",".join(months)
+
+    return None
+
+
+def _standardize_customer_name(value: str) -> str:
+    """
+    标准化客户名称（参照实现）
+
+    参数:
+        value (str): 原始客户名称
+
+    返回:
+        str: 标准化后的客户名称
+    """
+    value = value.replace('（', '(').replace('）', ')')
+    value = value.replace('：', ':').replace('，', ',')
+    value = value.replace('"', '"').replace('"', '"')
+    value = value.replace('　', '')
+    return value
+
+
+def _standardize_product_name(value: str) -> str:
+    """
+    标准化产品名称（参照实现）
+
+    参数:
+        value (str): 原始产品名称
+
+    返回:
+        str: 标准化后的产品名称（大写）
+    """
+    value = value.replace('（', '(').replace('）', ')')
+    value = value.replace('，', ',').replace('：', ':')
+    value = value.replace('　', '')
+    return value.upper()
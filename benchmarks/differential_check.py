@@ -0,0 +1,663 @@
+"""
+匹配结果差异校验模块
+
+匹配引擎、匹配原表索引、重复检测和增量分析都做过性能优化，但结果必须与最初的
+逐行实现完全相同。本模块用固定随机种子生成的数据比较优化后的实现与参照实现，
+列出所有不一致之处，可以在每次修改匹配相关代码后运行:
+
+1. 重复检测：DuplicateTracker与最初的重复规则（已处理键集合加每个(客户, 产品)
+   最近一次的日期范围，见baseline_is_duplicate）逐行比较
+2. 匹配引擎和索引：以最初的逐行匹配（元组键字典，见baseline_match）为参照，比较
+   - MatchEngine + 内存索引ReferenceIndex
+   - MatchEngine + SQLite索引SqliteReferenceIndex
+   - BatchMatchEngine（需要NumPy，未安装时跳过）
+   - PartitionedMatchEngine（临时调低行数阈值和块大小，使数据跨越多个块）
+   比较每行的重复标记、日期范围标记、是否匹配和供应商（含顺序）以及两种索引的键数，
+   逐行、SQLite和分区并行引擎还比较相同搜索键省去的查找次数
+3. 增量分析：生成测试工作簿并完整分析后随机修改、插入、删除行（有时修改匹配原表），
+   比较增量分析与对同一文件的完整分析写出的工作表内容和颜色
+
+标准化规则由standardizer_benchmark的黄金文件单独校验，这里的参照实现使用当前的标准化。
+日期都写出年份，结果与当前年份无关。
+
+使用示例:
+    python -m benchmarks.differential_check
+    python -m benchmarks.differential_check --trials 100 --rows 5000
+    python -m benchmarks.differential_check --skip-partitioned --skip-incremental
+
+作者: 供应商数据智能匹配系统开发团队
+版本: 1.0
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from openpyxl import load_workbook
+
+import core.partitioned_match_engine as partitioned_match_engine
+from core.analysis_state import AnalysisStateStore
+from core.batch_match_engine import NUMPY_AVAILABLE, BatchMatchEngine
+from core.data_models import MatchResult
+from core.data_standardizer import standardize_row
+from core.duplicate_tracker import DuplicateTracker, SearchKey
+from core.match_engine import MatchEngine
+from core.partitioned_match_engine import PartitionedMatchEngine
+from core.reference_index import ReferenceIndex
+from core.sqlite_reference_index import SqliteReferenceIndex
+from core.workbook_analyzer import STYLE_CELLS, STYLE_CONDITIONAL, analyze_workbook
+
+from .workbook_generator import generate_workbook
+
+# 默认的随机种子
+DEFAULT_SEED = 0
+
+# 匹配引擎校验的默认轮数和每轮的待匹配行数（匹配原表行数为其一半）
+DEFAULT_TRIALS = 20
+DEFAULT_ROWS = 2000
+
+# 增量分析校验的默认工作簿数、每个工作簿的行数和修改轮数
+DEFAULT_INCREMENTAL_TRIALS = 4
+DEFAULT_INCREMENTAL_ROWS = 300
+_INCREMENTAL_ROUNDS = 3
+
+# 分区并行引擎校验使用的子进程数和块大小（较小的块使同一分区跨越多个块）
+_PARTITIONED_WORKERS = 2
+_PARTITIONED_CHUNK_ROWS = 97
+
+# 每项校验最多列出的不一致数
+_MAX_REPORTED = 10
+
+# 生成数据使用的年份（都写出年份，结果与当前年份无关）
+_YEARS = (2024, 2025)
+
+
+class Mismatch(NamedTuple):
+    """
+    一处不一致
+
+    属性:
+        check (str): 校验项名称
+        case (str): 不一致所在的数据（轮次、行号等）
+        expected (str): 参照实现的结果
+        actual (str): 被校验实现的结果
+    """
+    check: str
+    case: str
+    expected: str
+    actual: str
+
+
+def baseline_is_duplicate(
+    search_key: SearchKey,
+    processed_keys: Set[SearchKey],
+    date_range_map: Dict[Tuple[str, str], List[str]]
+) -> bool:
+    """
+    最初的重复规则（逐项比较）
+
+    参数:
+        search_key: 标准化后的(日期, 客户, 产品)
+        processed_keys: 已处理的搜索键
+        date_range_map: 每个(客户, 产品)最近一次出现的日期范围展开的月份
+
+    返回:
+        bool: 是否重复
+    """
+    if search_key in processed_keys:
+        return True
+
+    if ',' not in search_key[0]:
+        months = date_range_map.get(search_key[1:])
+        return months is not None and search_key[0] in months
+
+    return any((date,) + search_key[1:] in processed_keys for date in search_key[0].split(','))
+
+
+def baseline_match(
+    search_keys: Sequence[SearchKey],
+    reference: Sequence[Tuple[SearchKey, Any]]
+) -> List[MatchResult]:
+    """
+    最初的逐行匹配
+
+    匹配原表保存为以(日期, 客户, 产品)元组为键的字典，日期范围逐月查找。
+
+    参数:
+        search_keys: 按顺序排列的待匹配搜索键
+        reference: 匹配原表的(搜索键, 供应商)
+
+    返回:
+        List[MatchResult]: 与search_keys一一对应的匹配结果
+    """
+    sheet2_data: Dict[SearchKey, List[Any]] = {}
+    for key, supplier in reference:
+        sheet2_data.setdefault(key, []).append(supplier)
+
+    processed_keys: Set[SearchKey] = set()
+    date_range_map: Dict[Tuple[str, str], List[str]] = {}
+    results = []
+    for search_key in search_keys:
+        result = MatchResult()
+        result.is_duplicate = baseline_is_duplicate(search_key, processed_keys, date_range_map)
+
+        if ',' in search_key[0]:
+            result.is_date_range = True
+            dates = search_key[0].split(',')
+            date_range_map[search_key[1:]] = dates
+
+            all_matches = True
+            for date in dates:
+                suppliers = sheet2_data.get((date,) + search_key[1:])
+                if suppliers is None:
+                    all_matches = False
+                    continue
+                result.matched_suppliers.extend((date, supplier) for supplier in suppliers)
+            result.is_all_match = all_matches and bool(result.matched_suppliers)
+
+        elif not result.is_duplicate and search_key in sheet2_data:
+            result.is_match = True
+            result.matched_suppliers.extend((search_key[0], supplier) for supplier in sheet2_data[search_key])
+
+        processed_keys.add(search_key)
+        results.append(result)
+    return results
+
+
+def check_duplicate_tracker(trials: int, rows: int, seed: int) -> List[Mismatch]:
+    """
+    比较DuplicateTracker与最初的重复规则
+
+    参数:
+        trials: 轮数
+        rows: 每轮的行数
+        seed: 随机种子
+
+    返回:
+        List[Mismatch]: 不一致之处
+    """
+    mismatches = []
+    for trial in range(trials):
+        generator = random.Random(seed * 1000 + trial)
+        search_keys = [standardize_row(values) for values in _DataGenerator(generator).rows(rows)]
+
+        tracker = DuplicateTracker()
+        processed_keys: Set[SearchKey] = set()
+        date_range_map: Dict[Tuple[str, str], List[str]] = {}
+        for position, search_key in enumerate(search_keys):
+            expected = baseline_is_duplicate(search_key, processed_keys, date_range_map)
+            actual = tracker.check_and_add(search_key)
+            if expected != actual:
+                mismatches.append(Mismatch(
+                    'DuplicateTracker', f"第{trial}轮第{position}行 {search_key}", str(expected), str(actual)
+                ))
+
+            if ',' in search_key[0]:
+                date_range_map[search_key[1:]] = search_key[0].split(',')
+            processed_keys.add(search_key)
+    return mismatches
+
+
+def check_engines(trials: int, rows: int, seed: int, partitioned: bool = True) -> List[Mismatch]:
+    """
+    以最初的逐行匹配为参照比较各匹配引擎和索引
+
+    参数:
+        trials: 轮数
+        rows: 每轮的待匹配行数
+        seed: 随机种子
+        partitioned: 是否校验分区并行引擎（每轮启动子进程，较慢）
+
+    返回:
+        List[Mismatch]: 不一致之处
+    """
+    mismatches = []
+    for trial in range(trials):
+        generator = random.Random(seed * 1000 + trial)
+        data = _DataGenerator(generator)
+        sheet1_rows = data.rows(rows)
+        sheet2_rows = data.reference_rows(max(rows // 2, 1))
+        search_keys = [standardize_row(values) for values in sheet1_rows]
+        expected = baseline_match(
+            search_keys, [(standardize_row(values), values[3]) for values in sheet2_rows]
+        )
+
+        memory_index = ReferenceIndex.from_rows(sheet2_rows)
+        sqlite_index = SqliteReferenceIndex.from_rows(sheet2_rows)
+        try:
+            if len(memory_index) != len(sqlite_index):
+                mismatches.append(Mismatch(
+                    'SqliteReferenceIndex 键数', f"第{trial}轮", str(len(memory_index)), str(len(sqlite_index))
+                ))
+
+            engines = [('MatchEngine', MatchEngine(memory_index)), ('SqliteReferenceIndex', MatchEngine(sqlite_index))]
+            if NUMPY_AVAILABLE:
+                engines.append(('BatchMatchEngine', BatchMatchEngine(memory_index)))
+            if partitioned:
+                engines.append(('PartitionedMatchEngine', PartitionedMatchEngine(memory_index, _PARTITIONED_WORKERS)))
+
+            lookups_saved: Dict[str, int] = {}
+            for name, engine in engines:
+                with _small_partitions():
+                    results = [result for _, result in engine.match(search_keys)]
+                mismatches.extend(_compare_results(name, trial, search_keys, expected, results))
+                if not isinstance(engine, BatchMatchEngine):
+                    lookups_saved[name] = engine.lookups_saved
+
+            if len(set(lookups_saved.values())) > 1:
+                mismatches.append(Mismatch(
+                    'lookups_saved', f"第{trial}轮", str(lookups_saved['MatchEngine']), str(lookups_saved)
+                ))
+        finally:
+            sqlite_index.close()
+    return mismatches
+
+
+def check_incremental(trials: int, rows: int, seed: int, work_dir: str) -> List[Mismatch]:
+    """
+    比较增量分析与完整分析的输出
+
+    每个工作簿先完整分析一次（记录状态），之后每轮随机修改后复制一份，
+    原文件增量分析、副本完整分析，比较两者的所有工作表内容和待匹配表前三列的颜色。
+    奇数工作簿使用条件格式标记颜色。
+
+    参数:
+        trials: 工作簿数
+        rows: 每个工作簿的待匹配行数
+        seed: 随机种子
+        work_dir: 存放测试工作簿和分析状态的目录
+
+    返回:
+        List[Mismatch]: 不一致之处
+    """
+    os.makedirs(work_dir, exist_ok=True)
+    mismatches = []
+    for trial in range(trials):
+        generator = random.Random(seed * 1000 + trial)
+        style_mode = STYLE_CONDITIONAL if trial % 2 else STYLE_CELLS
+        state_store = AnalysisStateStore(os.path.join(work_dir, f'state_{trial}'))
+        incremental_path = os.path.join(work_dir, f'incremental_{trial}.xlsx')
+        full_path = os.path.join(work_dir, f'full_{trial}.xlsx')
+
+        generate_workbook(incremental_path, rows, max(rows // 2, 1), seed=seed * 1000 + trial)
+        analyze_workbook(incremental_path, style_mode=style_mode, state_store=state_store)
+
+        for round_index in range(_INCREMENTAL_ROUNDS):
+            edits = _edit_workbook(incremental_path, generator)
+            shutil.copyfile(incremental_path, full_path)
+
+            incremental_stats = analyze_workbook(incremental_path, style_mode=style_mode, state_store=state_store)
+            full_stats = analyze_workbook(full_path, style_mode=style_mode)
+
+            case = f"第{trial}个工作簿第{round_index}轮（{edits}）"
+            for name in ('total', 'matched', 'unmatched'):
+                if incremental_stats[name] != full_stats[name]:
+                    mismatches.append(Mismatch(
+                        f"增量分析 {name}", case, str(full_stats[name]), str(incremental_stats[name])
+                    ))
+            mismatches.extend(_compare_workbooks(case, _snapshot(full_path), _snapshot(incremental_path)))
+    return mismatches
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    命令行入口
+
+    参数:
+        argv: 命令行参数列表，默认为sys.argv[1:]
+
+    返回:
+        int: 退出码，有不一致时返回1
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.differential_check',
+        description='匹配结果差异校验：比较优化后的匹配引擎、索引、重复检测和增量分析与参照实现'
+    )
+    parser.add_argument('--trials', type=int, default=DEFAULT_TRIALS,
+                        help=f'匹配引擎和重复检测校验的轮数，默认{DEFAULT_TRIALS}')
+    parser.add_argument('--rows', type=int, default=DEFAULT_ROWS,
+                        help=f'每轮的待匹配行数，默认{DEFAULT_ROWS}')
+    parser.add_argument('--incremental-trials', type=int, default=DEFAULT_INCREMENTAL_TRIALS,
+                        help=f'增量分析校验的工作簿数，默认{DEFAULT_INCREMENTAL_TRIALS}')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help=f'随机种子，默认{DEFAULT_SEED}')
+    parser.add_argument('--skip-partitioned', action='store_true', help='不校验分区并行引擎（需要启动子进程）')
+    parser.add_argument('--skip-incremental', action='store_true', help='不校验增量分析（需要读写工作簿）')
+    parser.add_argument('--work-dir', default=None, help='增量分析校验的工作目录，默认使用临时目录并在结束后删除')
+    args = parser.parse_args(argv)
+
+    if args.trials < 0 or args.rows < 1 or args.incremental_trials < 0:
+        print("--trials 和 --incremental-trials 不能为负数，--rows 必须大于0", file=sys.stderr)
+        return 1
+
+    checks = [
+        ('重复检测', lambda: check_duplicate_tracker(args.trials, args.rows, args.seed)),
+        ('匹配引擎和索引', lambda: check_engines(args.trials, args.rows, args.seed, not args.skip_partitioned)),
+    ]
+    if not args.skip_incremental:
+        checks.append(('增量分析', lambda: _check_incremental_in(args.work_dir, args.incremental_trials, args.seed)))
+    if not NUMPY_AVAILABLE:
+        print("未安装NumPy，跳过BatchMatchEngine")
+
+    failed = False
+    for title, check in checks:
+        mismatches = check()
+        _print_mismatches(title, mismatches)
+        failed = failed or bool(mismatches)
+    return 1 if failed else 0
+
+
+class _DataGenerator:
+    """
+    生成待匹配表和匹配原表的原始数据行
+
+    客户、产品和日期取自较小的集合，使重复、日期范围覆盖和匹配原表命中频繁出现。
+    日期包括单个月份、递增和递减的日期范围、无效月份和无法解析的文本，
+    名称包括全角和空白写法（标准化后相同）。
+    """
+
+    def __init__(self, generator: random.Random):
+        """
+        初始化数据生成器
+
+        参数:
+            generator: 随机数生成器
+        """
+        self.generator = generator
+        self.customers = [f"客户{letter}" for letter in 'ABCDEF'[:generator.randint(2, 6)]]
+        self.products = [f"产品{number}" for number in range(generator.randint(2, 8))]
+
+    def rows(self, count: int) -> List[Tuple[str, str, str]]:
+        """
+        生成待匹配表的数据行
+
+        参数:
+            count: 行数
+
+        返回:
+            List[Tuple[str, str, str]]: (日期, 客户, 产品)
+        """
+        return [(self._date(), self._name(self.customers), self._name(self.products)) for _ in range(count)]
+
+    def reference_rows(self, count: int) -> List[Tuple[str, str, str, Any]]:
+        """
+        生成匹配原表的数据行（只有单个日期，供应商混用文本、整数和空值）
+
+        参数:
+            count: 行数
+
+        返回:
+            List[Tuple[str, str, str, Any]]: (日期, 客户, 产品, 供应商)
+        """
+        generator = self.generator
+        rows = []
+        for _ in range(count):
+            roll = generator.random()
+            supplier: Any = f"供应商{generator.randint(1, 9)}"
+            if roll < 0.05:
+                supplier = None
+            elif roll < 0.1:
+                supplier = generator.randint(1, 99)
+            rows.append((self._single_date(), self._name(self.customers), self._name(self.products), supplier))
+        return rows
+
+    def _single_date(self) -> str:
+        """
+        生成单个日期（少量为无效月份或无法解析的文本）
+
+        返回:
+            str: 日期文本
+        """
+        generator = self.generator
+        roll = generator.random()
+        if roll < 0.03:
+            return generator.choice(('abc', '待定', '2024年13月'))
+        year, month = generator.choice(_YEARS), generator.randint(1, 12)
+        if roll < 0.5:
+            return f"{year}年{month}月"
+        if roll < 0.8:
+            return f"{year}{month:02d}"
+        return f"{year}-{month:02d}"
+
+    def _date(self) -> str:
+        """
+        生成待匹配表的日期：单个日期或日期范围
+
+        返回:
+            str: 日期文本
+        """
+        generator = self.generator
+        if generator.random() < 0.7:
+            return self._single_date()
+
+        year = generator.choice(_YEARS)
+        start = generator.randint(1, 12)
+        end = generator.randint(1, 12)
+        if generator.random() < 0.5:
+            return f"{year}年{start}月-{end}月"
+        return f"{year}年{start}-{end}月"
+
+    def _name(self, names: List[str]) -> str:
+        """
+        取一个名称，随机使用全角或加入空格（标准化后相同）
+
+        参数:
+            names: 名称集合
+
+        返回:
+            str: 名称文本
+        """
+        generator = self.generator
+        name = generator.choice(names)
+        roll = generator.random()
+        if roll < 0.1:
+            return ''.join(chr(ord(char) + 0xFEE0) if '!' <= char <= '~' else char for char in name)
+        if roll < 0.2:
+            return f" {name}　"
+        return name
+
+
+@contextmanager
+def _small_partitions() -> Iterator[None]:
+    """
+    临时调低分区并行匹配的行数阈值和块大小，使少量数据也分块并行匹配
+    """
+    saved = partitioned_match_engine.MIN_PARALLEL_ROWS, partitioned_match_engine.CHUNK_ROWS
+    partitioned_match_engine.MIN_PARALLEL_ROWS = 1
+    partitioned_match_engine.CHUNK_ROWS = _PARTITIONED_CHUNK_ROWS
+    try:
+        yield
+    finally:
+        partitioned_match_engine.MIN_PARALLEL_ROWS, partitioned_match_engine.CHUNK_ROWS = saved
+
+
+def _compare_results(
+    name: str,
+    trial: int,
+    search_keys: Sequence[SearchKey],
+    expected: Sequence[MatchResult],
+    actual: Sequence[MatchResult]
+) -> List[Mismatch]:
+    """
+    逐行比较匹配结果
+
+    参数:
+        name: 被校验实现的名称
+        trial: 轮次
+        search_keys: 搜索键
+        expected: 参照实现的结果
+        actual: 被校验实现的结果
+
+    返回:
+        List[Mismatch]: 不一致之处
+    """
+    if len(expected) != len(actual):
+        return [Mismatch(name, f"第{trial}轮", f"{len(expected)} 行", f"{len(actual)} 行")]
+
+    mismatches = []
+    for position, (search_key, left, right) in enumerate(zip(search_keys, expected, actual)):
+        if _describe_result(left) != _describe_result(right):
+            mismatches.append(Mismatch(
+                name, f"第{trial}轮第{position}行 {search_key}", _describe_result(left), _describe_result(right)
+            ))
+    return mismatches
+
+
+def _describe_result(result: MatchResult) -> str:
+    """
+    把匹配结果转换为便于比较和输出的文本
+
+    参数:
+        result: 匹配结果
+
+    返回:
+        str: 各标记和供应商列表
+    """
+    return (
+        f"duplicate={result.is_duplicate} range={result.is_date_range} "
+        f"all_match={result.is_all_match} match={result.is_match} suppliers={list(result.matched_suppliers)}"
+    )
+
+
+def _edit_workbook(file_path: str, generator: random.Random) -> str:
+    """
+    随机修改工作簿的待匹配表（有时也修改匹配原表）
+
+    修改、插入和追加的行复制其他行的值，使重复和日期范围的关系发生变化。
+
+    参数:
+        file_path: 工作簿路径
+        generator: 随机数生成器
+
+    返回:
+        str: 所做修改的说明
+    """
+    workbook = load_workbook(file_path)
+    sheet1, sheet2 = workbook.worksheets[0], workbook.worksheets[1]
+    edits = []
+
+    for _ in range(generator.choice((0, 1, 3, 8))):
+        last_row = sheet1.max_row
+        source = [sheet1.cell(row=generator.randint(2, last_row), column=column).value for column in range(1, 4)]
+        operation = generator.choice(('modify', 'modify', 'insert', 'delete', 'append'))
+        row = generator.randint(2, last_row)
+        if operation == 'modify':
+            column = generator.randint(1, 3)
+            sheet1.cell(row=row, column=column, value=source[column - 1])
+        elif operation == 'insert':
+            sheet1.insert_rows(row)
+            for column, value in enumerate(source, start=1):
+                sheet1.cell(row=row, column=column, value=value)
+        elif operation == 'delete' and last_row > 3:
+            sheet1.delete_rows(row)
+        else:
+            sheet1.append(source)
+        edits.append(f"{operation}@{row}")
+
+    if generator.random() < 0.2:
+        row = generator.randint(2, sheet2.max_row)
+        sheet2.cell(row=row, column=4, value=f"供应商{generator.randint(1, 9)}")
+        edits.append(f"匹配原表@{row}")
+
+    workbook.save(file_path)
+    return '，'.join(edits) or '未修改'
+
+
+def _snapshot(file_path: str) -> Dict[str, List[Any]]:
+    """
+    读取工作簿中所有工作表的值，以及待匹配表前三列的填充和字体颜色
+
+    参数:
+        file_path: 工作簿路径
+
+    返回:
+        Dict[str, List[Any]]: 工作表名称 -> 各行的值，"颜色" -> 待匹配表各单元格的颜色
+    """
+    workbook = load_workbook(file_path)
+    snapshot: Dict[str, List[Any]] = {
+        sheet.title: [list(values) for values in sheet.iter_rows(values_only=True)]
+        for sheet in workbook.worksheets
+    }
+    snapshot['颜色'] = [
+        [(cell.fill.fgColor.rgb, cell.font.color.rgb if cell.font.color else None) for cell in cells]
+        for cells in workbook.worksheets[0].iter_rows(min_row=2, max_col=3)
+    ]
+    return snapshot
+
+
+def _compare_workbooks(case: str, expected: Dict[str, List[Any]], actual: Dict[str, List[Any]]) -> List[Mismatch]:
+    """
+    比较完整分析和增量分析后的工作簿
+
+    参数:
+        case: 校验的数据说明
+        expected: 完整分析后的快照
+        actual: 增量分析后的快照
+
+    返回:
+        List[Mismatch]: 不一致之处，每个工作表最多一处（第一个不同的行）
+    """
+    mismatches = []
+    for name in sorted(set(expected) | set(actual)):
+        left, right = expected.get(name), actual.get(name)
+        if left == right:
+            continue
+        if left is None or right is None:
+            mismatches.append(Mismatch(f"增量分析 {name}", case, str(left is not None), str(right is not None)))
+            continue
+        position = next(
+            (index for index, (x, y) in enumerate(zip(left, right)) if x != y), min(len(left), len(right))
+        )
+        mismatches.append(Mismatch(
+            f"增量分析 {name}", f"{case} 第{position + 1}行",
+            str(left[position] if position < len(left) else '（无）'),
+            str(right[position] if position < len(right) else '（无）')
+        ))
+    return mismatches
+
+
+def _check_incremental_in(work_dir: Optional[str], trials: int, seed: int) -> List[Mismatch]:
+    """
+    在指定目录或临时目录中校验增量分析
+
+    参数:
+        work_dir: 工作目录，为None时使用临时目录并在结束后删除
+        trials: 工作簿数
+        seed: 随机种子
+
+    返回:
+        List[Mismatch]: 不一致之处
+    """
+    if work_dir is not None:
+        return check_incremental(trials, DEFAULT_INCREMENTAL_ROWS, seed, work_dir)
+    with tempfile.TemporaryDirectory(prefix='PanDataone_differential_') as temp_dir:
+        return check_incremental(trials, DEFAULT_INCREMENTAL_ROWS, seed, temp_dir)
+
+
+def _print_mismatches(title: str, mismatches: List[Mismatch]):
+    """
+    输出一项校验的结果
+
+    参数:
+        title: 校验项标题
+        mismatches: 不一致之处
+    """
+    if not mismatches:
+        print(f"{title}: 全部一致")
+        return
+
+    print(f"{title}: {len(mismatches)} 处不一致")
+    for mismatch in mismatches[:_MAX_REPORTED]:
+        print(f"  [{mismatch.check}] {mismatch.case}")
+        print(f"    参照: {mismatch.expected}")
+        print(f"    实际: {mismatch.actual}")
+    if len(mismatches) > _MAX_REPORTED:
+        print(f"  ……另有 {len(mismatches) - _MAX_REPORTED} 处")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
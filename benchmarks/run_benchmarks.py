@@ -0,0 +1,350 @@
+"""
+端到端性能基准测试模块
+
+按规模生成测试工作簿（见workbook_generator，已生成的文件直接复用），
+不启动图形界面，对测试工作簿的副本调用与"开始分析"和命令行批处理相同的
+core.workbook_analyzer.analyze_workbook，报告其统计信息中的各阶段耗时（见core.instrumentation）:
+
+- load: 打开工作簿（写回原文件为完整模式，单独输出为只读模式，数据在之后的阶段中按需读取）
+- preprocess: 标准化匹配原表并构建索引（不使用索引缓存）
+- match: 读取、标准化待匹配表并匹配
+- style: 在待匹配表上标记颜色（逐个单元格或条件格式，单独输出时为0）
+- write: 写入"匹配到的数据"和"未找到的数据"两个结果工作表
+- save: 保存工作簿
+
+输出方式、索引存储方式、匹配方式、颜色标记方式、流水线和进程数与命令行批处理的同名选项相同，
+不使用索引缓存和增量分析，每次都是完整分析。分析写回的是副本，生成的测试文件保持不变。
+
+每种规模在单独的子进程中测试，峰值内存（RSS）互不影响。
+结果写入JSON报告，包括各阶段耗时、总吞吐量（行/秒）、匹配阶段吞吐量和峰值内存。
+
+峰值内存在Linux和macOS上由resource模块读取，Windows上需要安装psutil，
+无法读取时报告中为null。
+
+使用示例:
+    python -m benchmarks.run_benchmarks --sizes 10k 100k
+    python -m benchmarks.run_benchmarks --sizes 1m --match-mode batch --output report.json
+    python -m benchmarks.run_benchmarks --sizes 100k --separate-output --pipeline
+
+作者: 供应商数据智能匹配系统开发团队
+版本: 1.0
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from core.instrumentation import PHASES
+from core.parallel_standardizer import ParallelStandardizer
+from core.workbook_analyzer import (
+    MATCH_BATCH, MATCH_PARTITIONED, MATCH_ROW, OUTPUT_IN_PLACE, OUTPUT_SEPARATE, REFERENCE_MEMORY,
+    REFERENCE_SQLITE, STYLE_CELLS, STYLE_CONDITIONAL, analyze_workbook
+)
+
+from .workbook_generator import DEFAULT_DUPLICATE_RATIO, generate_workbook, parse_row_count
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# 默认测试的规模（1m需要数GB内存和较长时间，需要时显式指定）
+DEFAULT_SIZES = ('10k', '100k')
+
+# 报告格式版本
+REPORT_VERSION = 2
+
+
+def default_work_dir() -> str:
+    """
+    获取默认的工作目录（存放生成的测试工作簿和分析用的副本）
+
+    返回:
+        str: 工作目录路径（可能尚未创建）
+    """
+    return os.path.join(tempfile.gettempdir(), 'PanDataone_benchmarks')
+
+
+def benchmark_file(
+    file_path: str,
+    output_mode: str = OUTPUT_IN_PLACE,
+    reference_backend: str = REFERENCE_MEMORY,
+    match_mode: str = MATCH_ROW,
+    style_mode: str = STYLE_CELLS,
+    pipeline: bool = False,
+    match_workers: Optional[int] = None,
+    normalize_workers: int = 1
+) -> Dict[str, Any]:
+    """
+    分析一个工作簿并整理各阶段耗时
+
+    参数:
+        file_path: 待分析的工作簿路径（写回原文件模式下会被修改，应传入副本），
+            第一个工作表为待匹配表，第二个为匹配原表
+        output_mode: 输出模式，OUTPUT_IN_PLACE或OUTPUT_SEPARATE
+        reference_backend: 匹配原表索引的存储方式，REFERENCE_MEMORY或REFERENCE_SQLITE
+        match_mode: 匹配方式，MATCH_ROW、MATCH_BATCH或MATCH_PARTITIONED
+        style_mode: 颜色标记方式，STYLE_CELLS或STYLE_CONDITIONAL
+        pipeline: 单独输出时是否使用流水线
+        match_workers: MATCH_PARTITIONED使用的进程数，为None时使用CPU核心数
+        normalize_workers: 标准化使用的进程数，大于1时创建并行标准化器
+
+    返回:
+        Dict[str, Any]: 包括rows, reference_keys, matched, unmatched, range_rows, duplicate_rows,
+        lookups_saved, phases（各阶段秒数）, total_seconds, rows_per_second,
+        match_rows_per_second, peak_rss_bytes
+    """
+    standardizer = ParallelStandardizer(normalize_workers) if normalize_workers > 1 else None
+    try:
+        stats = analyze_workbook(
+            file_path, output_mode=output_mode, reference_backend=reference_backend,
+            match_mode=match_mode, style_mode=style_mode, standardizer=standardizer,
+            match_workers=match_workers, pipeline=pipeline
+        )
+    finally:
+        if standardizer is not None:
+            standardizer.close()
+
+    phases = stats['phase_seconds']
+    rows = stats['total']
+    return {
+        'rows': rows,
+        'reference_keys': stats['reference_keys'],
+        'matched': stats['matched'],
+        'unmatched': stats['unmatched'],
+        'range_rows': stats['range_rows'],
+        'duplicate_rows': stats['duplicate_rows'],
+        'lookups_saved': stats['lookups_saved'],
+        'phases': {name: phases.get(name, 0.0) for name in PHASES},
+        'total_seconds': stats['elapsed'],
+        'rows_per_second': stats['rows_per_second'],
+        'match_rows_per_second': round(rows / phases['match'], 1) if phases.get('match') else None,
+        'peak_rss_bytes': peak_rss_bytes(),
+    }
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """
+    获取当前进程的峰值内存占用（RSS）
+
+    返回:
+        Optional[int]: 字节数，无法读取时返回None
+    """
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux以KB为单位，macOS以字节为单位
+        return peak if sys.platform == 'darwin' else peak * 1024
+    if psutil is not None:
+        memory = psutil.Process().memory_info()
+        return getattr(memory, 'peak_wset', memory.rss)
+    return None
+
+
+def run_benchmarks(
+    sizes: Sequence[str],
+    work_dir: str,
+    match_mode: str = MATCH_ROW,
+    style_mode: str = STYLE_CELLS,
+    duplicate_ratio: float = DEFAULT_DUPLICATE_RATIO,
+    seed: int = 0,
+    output_mode: str = OUTPUT_IN_PLACE,
+    reference_backend: str = REFERENCE_MEMORY,
+    pipeline: bool = False,
+    match_workers: Optional[int] = None,
+    normalize_workers: int = 1
+) -> Dict[str, Any]:
+    """
+    按规模依次生成测试工作簿并测试
+
+    参数:
+        sizes: 规模列表，如['10k', '100k', '1m']
+        work_dir: 工作目录
+        match_mode: 匹配方式
+        style_mode: 颜色标记方式
+        duplicate_ratio: 测试工作簿中重复行的比例
+        seed: 生成测试工作簿的随机种子
+        output_mode: 输出模式
+        reference_backend: 匹配原表索引的存储方式
+        pipeline: 单独输出时是否使用流水线
+        match_workers: 分区并行匹配的进程数，为None时使用CPU核心数
+        normalize_workers: 标准化使用的进程数
+
+    返回:
+        Dict[str, Any]: 完整的报告
+    """
+    os.makedirs(work_dir, exist_ok=True)
+    results: List[Dict[str, Any]] = []
+
+    for size in sizes:
+        rows = parse_row_count(size)
+        file_path = os.path.join(
+            work_dir, f"benchmark_{rows}_dup{duplicate_ratio:g}_seed{seed}.xlsx"
+        )
+        if not os.path.exists(file_path):
+            print(f"生成测试工作簿: {file_path}")
+            start = time.perf_counter()
+            generate_workbook(file_path, rows, duplicate_ratio=duplicate_ratio, seed=seed)
+            print(f"  用时 {time.perf_counter() - start:.1f}s")
+
+        print(f"测试 {size}（{rows} 行）...")
+        # 写回原文件模式会修改工作簿，分析副本；单独输出的结果工作簿与副本位于同一目录
+        run_dir = tempfile.mkdtemp(prefix=f"benchmark_{rows}_", dir=work_dir)
+        try:
+            run_path = os.path.join(run_dir, os.path.basename(file_path))
+            shutil.copyfile(file_path, run_path)
+            # 每种规模使用新的子进程，峰值内存只反映该规模
+            with ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context('spawn')
+            ) as executor:
+                result = executor.submit(
+                    benchmark_file, run_path, output_mode, reference_backend, match_mode, style_mode,
+                    pipeline, match_workers, normalize_workers
+                ).result()
+        finally:
+            shutil.rmtree(run_dir, ignore_errors=True)
+
+        results.append({'size': size, **result})
+        _print_result(result)
+
+    return {
+        'version': REPORT_VERSION,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'settings': {
+            'output_mode': output_mode,
+            'reference_backend': reference_backend,
+            'match_mode': match_mode,
+            'style_mode': style_mode,
+            'pipeline': pipeline,
+            'match_workers': match_workers,
+            'normalize_workers': normalize_workers,
+            'duplicate_ratio': duplicate_ratio,
+            'seed': seed,
+        },
+        'results': results,
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    命令行入口
+
+    参数:
+        argv: 命令行参数列表，默认为sys.argv[1:]
+
+    返回:
+        int: 退出码
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.run_benchmarks',
+        description='供应商数据智能匹配系统 - 端到端性能基准测试'
+    )
+    parser.add_argument(
+        '--sizes', nargs='+', default=list(DEFAULT_SIZES),
+        help=f'待匹配表的行数，支持k和m后缀，默认{" ".join(DEFAULT_SIZES)}'
+    )
+    parser.add_argument(
+        '-s', '--separate-output', action='store_true',
+        help='结果写入单独的工作簿（只读模式读取，不标记颜色），默认写回原文件'
+    )
+    parser.add_argument(
+        '--pipeline', action='store_true',
+        help='单独输出时在后台线程中读取、标准化和写出（只用于--separate-output）'
+    )
+    parser.add_argument(
+        '--reference-backend', choices=(REFERENCE_MEMORY, REFERENCE_SQLITE), default=REFERENCE_MEMORY,
+        help='匹配原表索引的存储方式，默认memory'
+    )
+    parser.add_argument(
+        '--match-mode', choices=(MATCH_ROW, MATCH_BATCH, MATCH_PARTITIONED), default=MATCH_ROW,
+        help='匹配方式，默认row'
+    )
+    parser.add_argument(
+        '--match-workers', type=int, default=None,
+        help='partitioned匹配方式使用的进程数，默认为CPU核心数'
+    )
+    parser.add_argument(
+        '--normalize-workers', type=int, default=1,
+        help='标准化两个工作表使用的进程数，默认1（在当前进程中标准化）'
+    )
+    parser.add_argument(
+        '--style-mode', choices=(STYLE_CELLS, STYLE_CONDITIONAL), default=STYLE_CELLS,
+        help='颜色标记方式，默认cells'
+    )
+    parser.add_argument(
+        '--duplicates', type=float, default=DEFAULT_DUPLICATE_RATIO,
+        help=f'测试工作簿中重复行的比例，默认{DEFAULT_DUPLICATE_RATIO}'
+    )
+    parser.add_argument('--seed', type=int, default=0, help='生成测试工作簿的随机种子，默认0')
+    parser.add_argument(
+        '--work-dir', default=default_work_dir(),
+        help=f'存放测试工作簿的目录，默认为 {default_work_dir()}'
+    )
+    parser.add_argument(
+        '-o', '--output', default='benchmark_report.json',
+        help='JSON报告路径，默认为当前目录下的benchmark_report.json'
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        for size in args.sizes:
+            if parse_row_count(size) < 1:
+                raise ValueError(f"行数必须大于0: {size}")
+    except ValueError as e:
+        print(f"无效的规模: {str(e)}", file=sys.stderr)
+        return 1
+    if args.normalize_workers < 1 or (args.match_workers is not None and args.match_workers < 1):
+        print("--normalize-workers 和 --match-workers 必须大于0", file=sys.stderr)
+        return 1
+
+    report = run_benchmarks(
+        args.sizes, args.work_dir, args.match_mode, args.style_mode, args.duplicates, args.seed,
+        output_mode=OUTPUT_SEPARATE if args.separate_output else OUTPUT_IN_PLACE,
+        reference_backend=args.reference_backend, pipeline=args.pipeline,
+        match_workers=args.match_workers, normalize_workers=args.normalize_workers
+    )
+    with open(args.output, 'w', encoding='utf-8') as report_file:
+        json.dump(report, report_file, ensure_ascii=False, indent=2)
+    print(f"报告已写入: {args.output}")
+    return 0
+
+
+def _print_result(result: Dict[str, Any]):
+    """
+    输出一种规模的测试结果
+
+    参数:
+        result: benchmark_file返回的结果
+    """
+    phases = '，'.join(f"{name} {result['phases'][name]:.2f}s" for name in PHASES)
+    peak = result['peak_rss_bytes']
+    peak_text = f"{peak / (1024 * 1024):.0f}MB" if peak is not None else "未知"
+    match_rate = result['match_rows_per_second']
+    match_text = f"{match_rate:,.0f} 行/秒" if match_rate is not None else "未知"
+    print(f"  {phases}")
+    print(
+        f"  总计 {result['total_seconds']:.2f}s，{result['rows_per_second']:,.0f} 行/秒，"
+        f"匹配阶段 {match_text}，峰值内存 {peak_text}"
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
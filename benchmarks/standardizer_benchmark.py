@@ -0,0 +1,836 @@
+"""
+标准化微基准测试与差异校验模块
+
+更换或优化标准化实现之前，需要证明新实现得到的搜索键与现有实现完全相同。
+本模块有两个用途:
+
+1. 差异校验：黄金文件（benchmarks/golden/standardizer_golden.json）记录以下函数在一组
+   真实风格输入上的期望输出，每次运行都用当前实现重新计算并比较，列出所有不一致的输入:
+   - _standardize_date、_parse_date_range、_standardize_customer_name、
+     _standardize_product_name（输入已移除空白字符，与standardize_data调用时相同）
+   - standardize_data（原始输入，包括移除空白字符的步骤）
+
+   期望输出由最初的实现（见baseline_standardizer）生成，而不是当前实现。
+   有意修改的标准化规则登记在INTENDED_CHANGES中，每条规则是一个输入变换：
+   当前输出与最初的实现不同时，只有当"最初的实现(变换后的输入)"等于当前输出，
+   才记为该规则的预期差异。黄金文件中逐条列出每个预期差异及其规则，
+   无法由规则解释的差异不会写入黄金文件。目前登记的规则:
+   - fullwidth_folding: 全角ASCII字符、全角空格和弯引号先折叠为半角
+   - cn_numerals: 日期中的中文数字整体转换（十一月、十二月不再读作十月，
+     二十三、二〇二四等复合写法，〇和零作为数字0）
+
+   只写月份的日期按当前年份补全，生成和校验时都固定使用GOLDEN_YEAR。
+
+2. 微基准测试：在大量真实风格的输入上测量每种列类型每秒处理的值数，
+   分别测量不经过缓存的标准化函数和带LRU缓存的standardize_data。
+
+输入由固定随机种子生成，覆盖各种日期写法（中文数字、全角、日期范围、无效月份、
+Excel日期单元格转换的文本等）以及全角、弯引号、全角空格混用的客户和产品名称。
+
+使用示例:
+    python -m benchmarks.standardizer_benchmark                  # 校验并测量
+    python -m benchmarks.standardizer_benchmark --check-only     # 只校验
+    python -m benchmarks.standardizer_benchmark --check-only --show-intended  # 同时列出每个预期差异
+    python -m benchmarks.standardizer_benchmark --update-golden  # 扩充输入或登记新的预期差异后重新生成黄金文件
+
+作者: 供应商数据智能匹配系统开发团队
+版本: 1.0
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from core import data_standardizer, date_parser
+from core.data_standardizer import (
+    NORMALIZER_VERSION, clear_standardize_cache, get_standardize_cache_stats, standardize_data
+)
+
+from . import baseline_standardizer
+
+# 默认的黄金文件路径
+DEFAULT_GOLDEN_PATH = os.path.join(os.path.dirname(__file__), 'golden', 'standardizer_golden.json')
+
+# 黄金文件格式版本
+GOLDEN_VERSION = 2
+
+# 只写月份的日期补全使用的年份（生成和校验时固定，与运行时的年份无关）
+GOLDEN_YEAR = '2024'
+
+# 黄金文件中每种列类型随机生成的输入数（另加固定的边界输入）
+DEFAULT_GOLDEN_VALUES = 1000
+
+# 微基准测试中每种列类型的输入数
+DEFAULT_BENCHMARK_VALUES = 200000
+
+# 生成黄金文件输入的随机种子（与微基准测试的输入不同）
+_GOLDEN_SEED = 20240301
+
+# 列类型与standardize_data的列索引
+_COLUMNS = (('date', 1), ('customer', 2), ('product', 3))
+
+# 微基准测试中各列类型不经过缓存的标准化函数
+_UNCACHED_FUNCTIONS = {
+    'date': '_standardize_date',
+    'customer': '_standardize_customer_name',
+    'product': '_standardize_product_name',
+}
+
+# 中文数字写法（月份按序号取，0和13为无效月份）
+_CN_DIGITS = '〇一二三四五六七八九'
+_CN_MONTHS = ('〇', '一', '二', '三', '四', '五', '六', '七', '八', '九', '十', '十一', '十二')
+
+# 半角可见字符到全角字符的码位差
+_FULLWIDTH_OFFSET = 0xFEE0
+
+# 固定的边界输入，保证黄金文件覆盖各分支
+_EDGE_DATES = (
+    '', 'None', 'abc', '2024年3月', '2024年03月', '２０２４年３月', '2403', '24年3月', '三月', '正月',
+    '十月', '十一月', '十二月', '十三月', '0月', '13月', '2024-03', '2024/3', '2024.7', '2024-3-15',
+    '202403', '2024年13月', '2024年3月-5月', '2024年3月到5月', '2024年3月至5月', '2024年3月和5月',
+    '2024年3-5月', '202403-05', '202405-03', '2024年5月-3月', '2024年3月-13月', '二〇二四年三月',
+    '二〇二四年三月到五月', '2024年3月－5月', '3月到5月', '3-5月', '45352', '2024-03-0100:00:00',
+    '2024年3月15日', '24.3', '2024年', '月', '-', '年月', '99', '1', '2024年0月', '2024年十二月',
+)
+_EDGE_NAMES = (
+    '', 'None', '客户A（中国）', '客户B：北京，上海', '客户C　测试', 'ＡＢＣ公司', '客户“D”', '‘E’商行',
+    'product abc', '产品（测试）', 'item：测试，demo', 'Ｗｉｄｇｅｔ', 'p-1', 'Ａ１２３－４', '【客户】',
+    'Co.,Ltd.', 'ｃｏ．，ｌｔｄ．', '客户 A', '１２３', '～', '￥100', '！？', 'ß', 'ǅ', 'ﬁ',
+)
+
+
+# 全角ASCII区段的首尾码位，以及需要删除的全角空格和折叠为半角引号的弯引号
+_FULLWIDTH_FIRST = 0xFF01
+_FULLWIDTH_LAST = 0xFF5E
+_DOUBLE_QUOTES = '“”„‟〝〞'
+_SINGLE_QUOTES = '‘’‚‛'
+
+# 中文数字（"正"指正月），以及含"十"的复合数字
+_CN_DIGIT_VALUES = {
+    '〇': 0, '零': 0, '一': 1, '二': 2, '三': 3, '四': 4,
+    '五': 5, '六': 6, '七': 7, '八': 8, '九': 9, '正': 1
+}
+_CN_TENS_PATTERN = re.compile('([一二三四五六七八九]?)十([一二三四五六七八九]?)')
+
+
+class IntendedChange(NamedTuple):
+    """
+    有意修改的标准化规则
+
+    属性:
+        name (str): 规则名称，写入黄金文件中对应的预期差异
+        description (str): 修改内容
+        columns (Tuple[str, ...]): 适用的列类型
+        transform (Callable[[str], str]): 输入变换，最初的实现处理变换后的输入应得到当前的输出
+    """
+    name: str
+    description: str
+    columns: Tuple[str, ...]
+    transform: Callable[[str], str]
+
+
+class Divergence(NamedTuple):
+    """
+    与黄金文件不一致的一个输入
+
+    属性:
+        function (str): 函数名称
+        value (str): 输入值
+        expected (Optional[str]): 黄金文件中的输出
+        actual (Optional[str]): 当前实现的输出
+    """
+    function: str
+    value: str
+    expected: Optional[str]
+    actual: Optional[str]
+
+
+class IntendedDivergence(NamedTuple):
+    """
+    黄金文件中登记的一个预期差异
+
+    属性:
+        change (str): 规则名称，多条规则以"+"连接
+        function (str): 函数名称
+        value (str): 输入值
+        baseline (Optional[str]): 最初的实现的输出
+        expected (Optional[str]): 修改后的期望输出
+    """
+    change: str
+    function: str
+    value: str
+    baseline: Optional[str]
+    expected: Optional[str]
+
+
+def _standardize_any(column_index: int) -> Callable[[str], str]:
+    """
+    生成按列索引调用standardize_data的函数
+
+    参数:
+        column_index: 列索引
+
+    返回:
+        Callable[[str], str]: 标准化函数
+    """
+    return lambda value: standardize_data(value, column_index)
+
+
+def _baseline_any(column_index: int) -> Callable[[str], str]:
+    """
+    生成按列索引调用最初的standardize_data的函数
+
+    参数:
+        column_index: 列索引
+
+    返回:
+        Callable[[str], str]: 标准化函数
+    """
+    return lambda value: baseline_standardizer.standardize_data(value, column_index)
+
+
+# 黄金文件中的函数：名称 -> (列类型, 当前实现, 最初的实现)
+# 前四个函数的输入为移除空白字符后的值，standardize_data的输入为原始值
+_FUNCTIONS: Dict[str, Tuple[str, Callable[[str], Optional[str]], Callable[[str], Optional[str]]]] = {
+    '_standardize_date': (
+        'date', data_standardizer._standardize_date, baseline_standardizer._standardize_date
+    ),
+    '_parse_date_range': (
+        'date', data_standardizer._parse_date_range, baseline_standardizer._parse_date_range
+    ),
+    '_standardize_customer_name': (
+        'customer', data_standardizer._standardize_customer_name,
+        baseline_standardizer._standardize_customer_name
+    ),
+    '_standardize_product_name': (
+        'product', data_standardizer._standardize_product_name,
+        baseline_standardizer._standardize_product_name
+    ),
+    'standardize_data:1': ('date', _standardize_any(1), _baseline_any(1)),
+    'standardize_data:2': ('customer', _standardize_any(2), _baseline_any(2)),
+    'standardize_data:3': ('product', _standardize_any(3), _baseline_any(3)),
+}
+
+
+def _fold_fullwidth(value: str) -> str:
+    """
+    全角ASCII字符折叠为半角，删除全角空格，弯引号统一为半角引号
+
+    参数:
+        value: 原始值
+
+    返回:
+        str: 折叠后的值
+    """
+    chars = []
+    for char in value:
+        code = ord(char)
+        if _FULLWIDTH_FIRST <= code <= _FULLWIDTH_LAST:
+            chars.append(chr(code - _FULLWIDTH_OFFSET))
+        elif char in _DOUBLE_QUOTES:
+            chars.append('"')
+        elif char in _SINGLE_QUOTES:
+            chars.append("'")
+        elif char != '　':
+            chars.append(char)
+    return ''.join(chars)
+
+
+def _convert_cn_numerals(value: str) -> str:
+    """
+    中文数字整体转换为阿拉伯数字（十一 -> 11，二十三 -> 23，二〇二四 -> 2024，零 -> 0）
+
+    参数:
+        value: 原始值
+
+    返回:
+        str: 转换后的值
+    """
+    value = _CN_TENS_PATTERN.sub(
+        lambda match: str(
+            _CN_DIGIT_VALUES.get(match.group(1), 1) * 10 + _CN_DIGIT_VALUES.get(match.group(2), 0)
+        ),
+        value
+    )
+    return ''.join(str(_CN_DIGIT_VALUES[char]) if char in _CN_DIGIT_VALUES else char for char in value)
+
+
+# 有意修改的标准化规则，按顺序应用于输入
+INTENDED_CHANGES: Tuple[IntendedChange, ...] = (
+    IntendedChange(
+        'fullwidth_folding',
+        '全角ASCII字符（标点、数字、字母）折叠为半角，删除全角空格，弯引号统一为半角引号',
+        ('date', 'customer', 'product'),
+        _fold_fullwidth
+    ),
+    IntendedChange(
+        'cn_numerals',
+        '日期中的中文数字整体转换：十一月、十二月不再读作十月，二十三、二〇二四等复合写法和〇、零按数字处理',
+        ('date',),
+        _convert_cn_numerals
+    ),
+)
+
+
+def build_corpus(count: int, seed: int) -> Dict[str, List[str]]:
+    """
+    生成真实风格的原始输入
+
+    参数:
+        count: 每种列类型的输入数
+        seed: 随机种子
+
+    返回:
+        Dict[str, List[str]]: 列类型('date', 'customer', 'product') -> 原始输入列表
+    """
+    generator = random.Random(seed)
+    return {
+        'date': [_random_date(generator) for _ in range(count)],
+        'customer': [_random_customer(generator) for _ in range(count)],
+        'product': [_random_product(generator) for _ in range(count)],
+    }
+
+
+def build_golden(values_per_column: int = DEFAULT_GOLDEN_VALUES) -> Tuple[Dict[str, Any], List[Divergence]]:
+    """
+    用最初的实现生成黄金文件内容，并登记当前实现的预期差异
+
+    每个输入记录为[输入, 最初的实现的输出]；当前实现的输出不同且能由INTENDED_CHANGES解释时，
+    记录为[输入, 最初的实现的输出, 当前的输出, 规则名称]。
+
+    参数:
+        values_per_column: 每种列类型随机生成的输入数
+
+    返回:
+        Tuple[Dict[str, Any], List[Divergence]]: (黄金文件内容, 无法由规则解释的差异)，
+        有无法解释的差异时不应写入黄金文件
+    """
+    corpus = build_corpus(values_per_column, _GOLDEN_SEED)
+    raw_values = {
+        'date': _unique(list(_EDGE_DATES) + corpus['date']),
+        'customer': _unique(list(_EDGE_NAMES) + corpus['customer']),
+        'product': _unique(list(_EDGE_NAMES) + corpus['product']),
+    }
+
+    cases: Dict[str, List[List[Optional[str]]]] = {}
+    unexplained: List[Divergence] = []
+    with _pinned_year(GOLDEN_YEAR):
+        for name, (column, function, baseline) in _FUNCTIONS.items():
+            inputs = raw_values[column] if name.startswith('standardize_data') else _unique(
+                _compact(value) for value in raw_values[column]
+            )
+            cases[name] = []
+            for value in inputs:
+                expected, actual = baseline(value), function(value)
+                if actual == expected:
+                    cases[name].append([value, expected])
+                    continue
+
+                change = _explain(column, baseline, value, actual)
+                if change is None:
+                    unexplained.append(Divergence(name, value, expected, actual))
+                else:
+                    cases[name].append([value, expected, actual, change])
+
+    golden = {
+        'version': GOLDEN_VERSION,
+        'normalizer_version': NORMALIZER_VERSION,
+        'year': GOLDEN_YEAR,
+        'cases': cases,
+    }
+    return golden, unexplained
+
+
+def check_golden(golden: Dict[str, Any]) -> List[Divergence]:
+    """
+    用当前实现重新计算黄金文件中的所有输入并比较
+
+    登记了预期差异的输入与修改后的期望输出比较，其余输入与最初的实现的输出比较。
+
+    参数:
+        golden: 黄金文件内容
+
+    返回:
+        List[Divergence]: 所有不一致的输入，完全一致时为空列表
+    """
+    divergences: List[Divergence] = []
+    with _pinned_year(golden['year']):
+        for name, cases in golden['cases'].items():
+            _, function, _ = _FUNCTIONS[name]
+            for case in cases:
+                value, expected = case[0], case[2] if len(case) > 2 else case[1]
+                actual = function(value)
+                if actual != expected:
+                    divergences.append(Divergence(name, value, expected, actual))
+    return divergences
+
+
+def intended_divergences(golden: Dict[str, Any]) -> List[IntendedDivergence]:
+    """
+    列出黄金文件中登记的所有预期差异
+
+    参数:
+        golden: 黄金文件内容
+
+    返回:
+        List[IntendedDivergence]: 预期差异，按函数和输入的顺序排列
+    """
+    return [
+        IntendedDivergence(case[3], name, case[0], case[1], case[2])
+        for name, cases in golden['cases'].items()
+        for case in cases if len(case) > 2
+    ]
+
+
+def _explain(
+    column: str, baseline: Callable[[str], Optional[str]], value: str, actual: Optional[str]
+) -> Optional[str]:
+    """
+    用有意修改的规则解释一个差异
+
+    依次应用适用于该列类型的规则变换输入，只有最初的实现处理变换后的输入得到当前的输出时才算解释成功。
+
+    参数:
+        column: 列类型
+        baseline: 最初的实现
+        value: 输入值
+        actual: 当前实现的输出
+
+    返回:
+        Optional[str]: 改变了输入的规则名称（多条以"+"连接），无法解释时返回None
+    """
+    applied = []
+    for change in INTENDED_CHANGES:
+        if column not in change.columns:
+            continue
+        transformed = change.transform(value)
+        if transformed != value:
+            applied.append(change.name)
+            value = transformed
+
+    if applied and baseline(value) == actual:
+        return '+'.join(applied)
+    return None
+
+
+def benchmark(count: int = DEFAULT_BENCHMARK_VALUES, repeat: int = 3, seed: int = 0) -> Dict[str, Any]:
+    """
+    测量每种列类型的标准化速度
+
+    参数:
+        count: 每种列类型的输入数
+        repeat: 重复测量的次数，取最快的一次
+        seed: 生成输入的随机种子
+
+    返回:
+        Dict[str, Any]: 列类型 -> {values, unique, uncached_values_per_second,
+        cached_values_per_second, cache_hit_rate}，日期列另有date_range_values_per_second
+    """
+    corpus = build_corpus(count, seed)
+    results: Dict[str, Any] = {}
+
+    for column, column_index in _COLUMNS:
+        raw_values = corpus[column]
+        compact_values = [_compact(value) for value in raw_values]
+        _, function, _ = _FUNCTIONS[_UNCACHED_FUNCTIONS[column]]
+
+        uncached = _best_time(lambda: [function(value) for value in compact_values], repeat)
+
+        def run_cached():
+            clear_standardize_cache()
+            for value in raw_values:
+                standardize_data(value, column_index)
+        cached = _best_time(run_cached, repeat)
+        cache = get_standardize_cache_stats()
+
+        results[column] = {
+            'values': count,
+            'unique': len(set(raw_values)),
+            'uncached_values_per_second': round(count / uncached, 1),
+            'cached_values_per_second': round(count / cached, 1),
+            'cache_hit_rate': round(cache.hit_rate, 4),
+        }
+        if column == 'date':
+            parse_range = data_standardizer._parse_date_range
+            date_range = _best_time(lambda: [parse_range(value) for value in compact_values], repeat)
+            results[column]['date_range_values_per_second'] = round(count / date_range, 1)
+
+    clear_standardize_cache()
+    return results
+
+
+def load_golden(path: str) -> Dict[str, Any]:
+    """
+    读取黄金文件
+
+    参数:
+        path: 黄金文件路径
+
+    返回:
+        Dict[str, Any]: 黄金文件内容
+
+    异常:
+        ValueError: 格式版本不符
+    """
+    with open(path, 'r', encoding='utf-8') as golden_file:
+        golden = json.load(golden_file)
+    if golden.get('version') != GOLDEN_VERSION:
+        raise ValueError(f"黄金文件格式版本不符: {golden.get('version')}")
+    return golden
+
+
+def save_golden(golden: Dict[str, Any], path: str):
+    """
+    写入黄金文件，每个输入占一行，便于查看差异
+
+    参数:
+        golden: 黄金文件内容
+        path: 黄金文件路径
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    dump = lambda value: json.dumps(value, ensure_ascii=False)
+    lines = ['{']
+    for key in ('version', 'normalizer_version', 'year'):
+        lines.append(f'  {dump(key)}: {dump(golden[key])},')
+    lines.append('  "cases": {')
+    names = list(golden['cases'])
+    for position, name in enumerate(names):
+        cases = golden['cases'][name]
+        lines.append(f'    {dump(name)}: [')
+        lines.extend(
+            f'      {dump(case)}{"," if index < len(cases) - 1 else ""}'
+            for index, case in enumerate(cases)
+        )
+        lines.append(f'    ]{"," if position < len(names) - 1 else ""}')
+    lines.append('  }')
+    lines.append('}')
+    with open(path, 'w', encoding='utf-8', newline='\n') as golden_file:
+        golden_file.write('\n'.join(lines) + '\n')
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    命令行入口
+
+    参数:
+        argv: 命令行参数列表，默认为sys.argv[1:]
+
+    返回:
+        int: 退出码，与黄金文件有差异时返回1
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.standardizer_benchmark',
+        description='标准化微基准测试与黄金文件差异校验'
+    )
+    parser.add_argument('--golden', default=DEFAULT_GOLDEN_PATH,
+                        help='黄金文件路径，默认为benchmarks/golden/standardizer_golden.json')
+    parser.add_argument('--update-golden', action='store_true',
+                        help='用最初的实现重新生成黄金文件并登记预期差异（扩充输入或在INTENDED_CHANGES中'
+                             '登记新规则后使用），有无法由规则解释的差异时不写入')
+    parser.add_argument('--check-only', action='store_true', help='只校验，不测量速度')
+    parser.add_argument('--show-intended', action='store_true', help='列出黄金文件中登记的每个预期差异')
+    parser.add_argument('--values', type=int, default=DEFAULT_BENCHMARK_VALUES,
+                        help=f'微基准测试中每种列类型的输入数，默认{DEFAULT_BENCHMARK_VALUES}')
+    parser.add_argument('--repeat', type=int, default=3, help='重复测量的次数，取最快的一次，默认3')
+    parser.add_argument('-o', '--output', default=None, help='可选的JSON报告路径')
+    args = parser.parse_args(argv)
+
+    if args.values < 1 or args.repeat < 1:
+        print("--values 和 --repeat 必须大于0", file=sys.stderr)
+        return 1
+
+    if args.update_golden:
+        golden, unexplained = build_golden()
+        if unexplained:
+            for divergence in unexplained:
+                print(
+                    f"无法解释的差异 {divergence.function}({divergence.value!r}): "
+                    f"最初的实现 {divergence.expected!r}，当前 {divergence.actual!r}"
+                )
+            print(f"{len(unexplained)} 个差异无法由INTENDED_CHANGES解释，未写入黄金文件", file=sys.stderr)
+            return 1
+        save_golden(golden, args.golden)
+        total = sum(len(cases) for cases in golden['cases'].values())
+        intended = len(intended_divergences(golden))
+        print(
+            f"黄金文件已生成: {args.golden}（{total} 个输入，其中 {intended} 个预期差异，年份 {golden['year']}）"
+        )
+        return 0
+
+    try:
+        golden = load_golden(args.golden)
+    except (OSError, ValueError) as e:
+        print(f"无法读取黄金文件: {str(e)}", file=sys.stderr)
+        return 1
+
+    divergences = check_golden(golden)
+    intended = intended_divergences(golden)
+    _print_intended(intended, args.show_intended)
+    _print_divergences(golden, divergences)
+
+    report: Dict[str, Any] = {
+        'golden': {
+            'cases': sum(len(cases) for cases in golden['cases'].values()),
+            'intended': dict(Counter(divergence.change for divergence in intended)),
+            'divergences': [divergence._asdict() for divergence in divergences],
+        }
+    }
+    if not args.check_only:
+        report['benchmark'] = benchmark(args.values, args.repeat)
+        _print_benchmark(report['benchmark'])
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as report_file:
+            json.dump(report, report_file, ensure_ascii=False, indent=2)
+        print(f"报告已写入: {args.output}")
+
+    return 1 if divergences else 0
+
+
+@contextmanager
+def _pinned_year(year: str) -> Iterator[None]:
+    """
+    临时固定只写月份的日期补全使用的年份
+
+    替换date_parser的当前年份缓存和最初的实现使用的年份，并清空标准化缓存，退出时恢复。
+
+    参数:
+        year: 四位年份
+    """
+    saved = date_parser._current_year_cache, baseline_standardizer.year
+    date_parser._current_year_cache = (year, float('inf'))
+    baseline_standardizer.year = year
+    clear_standardize_cache()
+    try:
+        yield
+    finally:
+        date_parser._current_year_cache, baseline_standardizer.year = saved
+        clear_standardize_cache()
+
+
+def _random_date(generator: random.Random) -> str:
+    """
+    生成一个真实风格的日期输入
+
+    参数:
+        generator: 随机数生成器
+
+    返回:
+        str: 日期文本
+    """
+    year = generator.randint(2019, 2030)
+    month = generator.randint(0, 13) if generator.random() < 0.05 else generator.randint(1, 12)
+    end = min(month + generator.randint(1, 4), 13)
+    style = generator.randrange(20)
+
+    if style == 0:
+        text = f"{year}年{month}月"
+    elif style == 1:
+        text = f"{year % 100:02d}{month:02d}"
+    elif style == 2:
+        text = f"{_CN_MONTHS[month] if month <= 12 else '十三'}月"
+    elif style == 3:
+        text = f"{year}{generator.choice('-/.')}{month:0{generator.choice((1, 2))}d}"
+    elif style == 4:
+        text = f"{year}{month:02d}"
+    elif style == 5:
+        text = f"{year}年{month}月{generator.choice('-到至和')}{end}月"
+    elif style == 6:
+        text = f"{year}年{month}-{end}月"
+    elif style == 7:
+        text = f"{year}{month:02d}-{end:02d}"
+    elif style == 8:
+        text = ''.join(_CN_DIGITS[int(digit)] for digit in str(year)) + f"年{_CN_MONTHS[min(month, 12)]}月"
+    elif style == 9:
+        text = f"{year % 100}年{month}月"
+    elif style == 10:
+        text = f"{month}月"
+    elif style == 11:
+        text = f"{month}月{generator.choice('-到')}{end}月"
+    elif style == 12:
+        # Excel日期单元格被转换为文本
+        text = f"{year}-{max(month, 1):02d}-{generator.randint(1, 28):02d} 00:00:00"
+    elif style == 13:
+        text = str(generator.randint(40000, 47000))
+    elif style == 14:
+        text = f"{year}年{month}月{generator.randint(1, 28)}日"
+    elif style == 15:
+        text = generator.choice(('', 'None', '待定', '全年', 'N/A', '-'))
+    else:
+        text = f"{year}年{month}月"
+
+    return _decorate(generator, text)
+
+
+def _random_customer(generator: random.Random) -> str:
+    """
+    生成一个真实风格的客户名称输入
+
+    参数:
+        generator: 随机数生成器
+
+    返回:
+        str: 客户名称
+    """
+    city = generator.choice(('北京', '上海', '广州', '深圳', '杭州', '成都', '武汉', '南京'))
+    trade = generator.choice(('贸易', '科技', '电子', '物流', '医药', 'Global ', 'ABC '))
+    suffix = generator.choice(('有限公司', '股份有限公司', '（集团）有限公司', 'Co.,Ltd.', '商行', ''))
+    branch = generator.choice(('', '（华东）', '(华南)', '：分公司', '，总部', '“旗舰店”', '‘一部’'))
+    return _decorate(generator, f"{city}{trade}{suffix}{generator.randint(1, 999)}{branch}")
+
+
+def _random_product(generator: random.Random) -> str:
+    """
+    生成一个真实风格的产品名称输入
+
+    参数:
+        generator: 随机数生成器
+
+    返回:
+        str: 产品名称
+    """
+    word = generator.choice(('Widget', 'cable', 'SENSOR', 'Valve', '滤芯', '轴承', '阀门', 'item：x'))
+    spec = generator.choice(('A', 'b', 'Pro', 'mini', 'φ10', '10×20', '（测试）', '-1', '/2'))
+    return _decorate(generator, f"{word} {spec}{generator.randint(0, 99)}")
+
+
+def _decorate(generator: random.Random, text: str) -> str:
+    """
+    随机加入全角字符、全角空格和多余空白
+
+    参数:
+        generator: 随机数生成器
+        text: 原始文本
+
+    返回:
+        str: 处理后的文本
+    """
+    roll = generator.random()
+    if roll < 0.15:
+        text = ''.join(
+            chr(ord(char) + _FULLWIDTH_OFFSET) if '!' <= char <= '~' else char for char in text
+        )
+    elif roll < 0.25 and len(text) > 1:
+        position = generator.randrange(1, len(text))
+        text = text[:position] + generator.choice(('　', ' ', '\t')) + text[position:]
+    elif roll < 0.3:
+        text = f" {text} "
+    return text
+
+
+def _compact(value: str) -> str:
+    """
+    移除所有空白字符（与standardize_data相同）
+
+    参数:
+        value: 原始值
+
+    返回:
+        str: 移除空白字符后的值
+    """
+    return ''.join(value.split())
+
+
+def _unique(values: Iterable[str]) -> List[str]:
+    """
+    按首次出现顺序去重
+
+    参数:
+        values: 值的迭代器
+
+    返回:
+        List[str]: 去重后的列表
+    """
+    return list(dict.fromkeys(values))
+
+
+def _best_time(function: Callable[[], Any], repeat: int) -> float:
+    """
+    多次执行并返回最短的耗时
+
+    参数:
+        function: 被测函数
+        repeat: 执行次数
+
+    返回:
+        float: 最短耗时（秒）
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _print_divergences(golden: Dict[str, Any], divergences: List[Divergence]):
+    """
+    输出差异校验结果
+
+    参数:
+        golden: 黄金文件内容
+        divergences: 不一致的输入
+    """
+    total = sum(len(cases) for cases in golden['cases'].values())
+    for divergence in divergences:
+        print(
+            f"不一致 {divergence.function}({divergence.value!r}): "
+            f"黄金文件 {divergence.expected!r}，当前 {divergence.actual!r}"
+        )
+    if divergences:
+        print(f"差异校验: {total} 个输入中有 {len(divergences)} 个不一致")
+    else:
+        print(f"差异校验: {total} 个输入全部一致（年份 {golden['year']}）")
+
+
+def _print_intended(intended: List[IntendedDivergence], show_each: bool):
+    """
+    输出黄金文件中登记的预期差异
+
+    参数:
+        intended: 预期差异
+        show_each: 是否逐个列出，否则只输出每条规则的数量
+    """
+    descriptions = {change.name: change.description for change in INTENDED_CHANGES}
+    counts = Counter(divergence.change for divergence in intended)
+    for change, count in counts.items():
+        names = change.split('+')
+        print(f"预期差异 {change}: {count} 个（{'；'.join(descriptions.get(name, name) for name in names)}）")
+    if show_each:
+        for divergence in intended:
+            print(
+                f"  [{divergence.change}] {divergence.function}({divergence.value!r}): "
+                f"最初的实现 {divergence.baseline!r}，期望 {divergence.expected!r}"
+            )
+    elif intended:
+        print("  使用 --show-intended 列出每个预期差异")
+
+
+def _print_benchmark(results: Dict[str, Any]):
+    """
+    输出微基准测试结果
+
+    参数:
+        results: benchmark返回的结果
+    """
+    for column, result in results.items():
+        line = (
+            f"{column}: {result['values']} 个值（{result['unique']} 个不同），"
+            f"不经过缓存 {result['uncached_values_per_second']:,.0f} 个/秒，"
+            f"standardize_data {result['cached_values_per_second']:,.0f} 个/秒"
+            f"（缓存命中率 {result['cache_hit_rate'] * 100:.1f}%）"
+        )
+        if 'date_range_values_per_second' in result:
+            line += f"，_parse_date_range {result['date_range_values_per_second']:,.0f} 个/秒"
+        print(line)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,370 @@
+"""
+测试工作簿生成模块
+
+生成与真实数据特征相近的双工作表工作簿，用于性能基准测试:
+- 待匹配表（第1个工作表）: 日期、客户名称、产品名称
+- 匹配原表（第2个工作表）: 日期、客户名称、产品名称、供应商
+
+数据特征:
+- 日期混用标准化支持的各种写法：2024年3月、2403、三月、2024-03、2024/03、
+  202403、2024年3月-5月、2024年3-5月、202403-05、全角的２０２４年３月等
+  （年份使用当前年份，只写月份的日期也能匹配）
+- 同一客户有半角、全角和带全角空格等多种写法，标准化后相同
+- 产品按长尾分布重复出现，大小写和全角写法混用
+- 可配置比例的行是之前某一行的重复（同一客户、产品和月份，日期写法可能不同）
+- 大部分(客户, 产品)在匹配原表中有供应商，其余找不到
+
+同样的参数和随机种子总是生成相同的数据。工作簿以write_only模式写出，
+一百万行时也不需要把所有单元格保存在内存中。
+
+使用示例:
+    python -m benchmarks.workbook_generator 测试.xlsx --rows 100000 --duplicates 0.1
+
+作者: 供应商数据智能匹配系统开发团队
+版本: 1.0
+"""
+
+import argparse
+import random
+import sys
+from collections import deque
+from datetime import datetime
+from typing import Deque, Iterator, List, Optional, Sequence, Tuple
+
+from openpyxl import Workbook
+
+# 默认的重复行比例
+DEFAULT_DUPLICATE_RATIO = 0.1
+
+# 默认的可匹配(客户, 产品)比例
+DEFAULT_MATCH_RATIO = 0.7
+
+# 中文月份写法（"正月"即一月）
+_CN_MONTHS = ('正', '二', '三', '四', '五', '六', '七', '八', '九', '十', '十一', '十二')
+
+# 半角可见字符到全角字符的码位差
+_FULLWIDTH_OFFSET = 0xFEE0
+
+# 全角空格
+_IDEOGRAPHIC_SPACE = '　'
+
+# 客户名称的组成部分
+_CITIES = ('北京', '上海', '广州', '深圳', '杭州', '成都', '武汉', '南京', '苏州', '天津')
+_TRADES = ('贸易', '科技', '电子', '物流', '医药', '食品', '建材', '机械')
+
+# 产品名称的组成部分
+_PRODUCT_WORDS = ('Widget', 'Cable', 'Sensor', 'Valve', 'Panel', 'Motor', '滤芯', '轴承', '阀门', '面板')
+_PRODUCT_SPECS = ('A', 'B', 'Pro', 'Mini', 'X', 'S')
+
+# 待匹配表一行的内容：(年份, 月份, 客户编号, 产品编号)
+_RowKey = Tuple[int, int, int, int]
+
+
+def generate_workbook(
+    file_path: str,
+    rows: int,
+    reference_rows: Optional[int] = None,
+    duplicate_ratio: float = DEFAULT_DUPLICATE_RATIO,
+    match_ratio: float = DEFAULT_MATCH_RATIO,
+    seed: int = 0
+):
+    """
+    生成测试工作簿
+
+    参数:
+        file_path: 输出的Excel文件路径
+        rows: 待匹配表的数据行数（不含标题行）
+        reference_rows: 匹配原表的数据行数，默认为rows的一半（至少1000行）
+        duplicate_ratio: 待匹配表中重复行的比例，0到1之间
+        match_ratio: 在匹配原表中有供应商的(客户, 产品)比例，0到1之间
+        seed: 随机种子
+
+    异常:
+        ValueError: 行数或比例无效
+    """
+    if rows < 1:
+        raise ValueError(f"行数必须大于0: {rows}")
+    if reference_rows is None:
+        reference_rows = max(rows // 2, 1000)
+    if reference_rows < 1:
+        raise ValueError(f"匹配原表行数必须大于0: {reference_rows}")
+    if not 0 <= duplicate_ratio <= 1:
+        raise ValueError(f"重复行比例必须在0到1之间: {duplicate_ratio}")
+    if not 0 <= match_ratio <= 1:
+        raise ValueError(f"可匹配比例必须在0到1之间: {match_ratio}")
+
+    generator = _DataGenerator(rows, duplicate_ratio, match_ratio, seed)
+
+    workbook = Workbook(write_only=True)
+    sheet1 = workbook.create_sheet("待匹配")
+    sheet1.append(["日期", "客户名称", "产品名称"])
+    for values in generator.sheet1_rows(rows):
+        sheet1.append(values)
+
+    sheet2 = workbook.create_sheet("匹配原表")
+    sheet2.append(["日期", "客户名称", "产品名称", "供应商"])
+    for values in generator.reference_rows(reference_rows):
+        sheet2.append(values)
+
+    workbook.save(file_path)
+
+
+class _DataGenerator:
+    """
+    按固定随机种子生成待匹配表和匹配原表的数据行
+    """
+
+    def __init__(self, rows: int, duplicate_ratio: float, match_ratio: float, seed: int):
+        """
+        初始化生成器
+
+        客户、产品和(客户, 产品)的数量随行数增长，保持与真实数据相近的重复程度。
+
+        参数:
+            rows: 待匹配表的数据行数
+            duplicate_ratio: 重复行的比例
+            match_ratio: 可匹配(客户, 产品)的比例
+            seed: 随机种子
+        """
+        self.random = random.Random(seed)
+        self.year = datetime.now().year
+        self.duplicate_ratio = duplicate_ratio
+
+        self.customers = [
+            f"{_CITIES[i % len(_CITIES)]}{_TRADES[i // len(_CITIES) % len(_TRADES)]}有限公司{i:05d}（华东）"
+            for i in range(max(50, rows // 200))
+        ]
+        self.products = [
+            f"{_PRODUCT_WORDS[i % len(_PRODUCT_WORDS)]} {_PRODUCT_SPECS[i // len(_PRODUCT_WORDS) % len(_PRODUCT_SPECS)]}-{i:04d}"
+            for i in range(max(20, rows // 500))
+        ]
+        # 产品按长尾分布出现：靠前的产品出现得更多
+        self.product_weights = [1 / (rank + 1) for rank in range(len(self.products))]
+
+        pair_count = max(100, rows // 20)
+        self.pairs = [
+            (self.random.randrange(len(self.customers)), self._random_product())
+            for _ in range(pair_count)
+        ]
+        matchable = self.random.sample(range(pair_count), round(pair_count * match_ratio))
+        self.matchable_pairs = [self.pairs[position] for position in sorted(matchable)]
+
+    def sheet1_rows(self, rows: int) -> Iterator[List[str]]:
+        """
+        生成待匹配表的数据行
+
+        参数:
+            rows: 行数
+
+        返回:
+            生成器，每次产出[日期, 客户名称, 产品名称]
+        """
+        # 只从最近的行中选择重复行，与实际表格中重复行通常相距不远一致
+        recent: Deque[_RowKey] = deque(maxlen=1000)
+        for _ in range(rows):
+            if recent and self.random.random() < self.duplicate_ratio:
+                key = self.random.choice(recent)
+            else:
+                customer, product = self.random.choice(self.pairs)
+                key = (self.year, self.random.randint(1, 12), customer, product)
+                recent.append(key)
+
+            year, month, customer, product = key
+            yield [
+                self._date_text(year, month),
+                self._customer_text(customer),
+                self._product_text(product)
+            ]
+
+    def reference_rows(self, rows: int) -> Iterator[List[str]]:
+        """
+        生成匹配原表的数据行
+
+        依次为每个可匹配的(客户, 产品)生成若干个月份的供应商，直到达到行数。
+        没有可匹配的(客户, 产品)时使用不会出现在待匹配表中的客户。
+
+        参数:
+            rows: 行数
+
+        返回:
+            生成器，每次产出[日期, 客户名称, 产品名称, 供应商]
+        """
+        pairs = self.matchable_pairs or [(-1, 0)]
+        produced = 0
+        while produced < rows:
+            for customer, product in pairs:
+                for month in self.random.sample(range(1, 13), self.random.randint(1, 6)):
+                    if produced >= rows:
+                        return
+                    supplier = f"供应商{self.random.randrange(200):03d}"
+                    customer_text = self._customer_text(customer) if customer >= 0 else "无匹配客户"
+                    yield [
+                        f"{self.year}{month:02d}" if self.random.random() < 0.5
+                        else f"{self.year}年{month}月",
+                        customer_text,
+                        self._product_text(product),
+                        supplier
+                    ]
+                    produced += 1
+
+    def _random_product(self) -> int:
+        """
+        按长尾分布选择一个产品
+
+        返回:
+            int: 产品编号
+        """
+        return self.random.choices(range(len(self.products)), self.product_weights)[0]
+
+    def _date_text(self, year: int, month: int) -> str:
+        """
+        随机选择一种日期写法
+
+        参数:
+            year: 年份
+            month: 月份
+
+        返回:
+            str: 日期文本，部分为日期范围
+        """
+        style = self.random.randrange(10)
+        if style == 0:
+            return f"{year}年{month}月"
+        if style == 1:
+            return f"{year % 100:02d}{month:02d}"
+        if style == 2:
+            return f"{_CN_MONTHS[month - 1]}月"
+        if style == 3:
+            return f"{year}-{month:02d}"
+        if style == 4:
+            return f"{year}/{month:02d}"
+        if style == 5:
+            return f"{year}{month:02d}"
+        if style == 6:
+            return _to_fullwidth(f"{year}年{month}月")
+
+        # 日期范围
+        end = min(month + self.random.randint(1, 3), 12)
+        if end == month:
+            return f"{year}年{month}月"
+        if style == 7:
+            return f"{year}年{month}月-{end}月"
+        if style == 8:
+            return f"{year}年{month}-{end}月"
+        return f"{year}{month:02d}-{end:02d}"
+
+    def _customer_text(self, customer: int) -> str:
+        """
+        随机选择一种客户名称写法
+
+        参数:
+            customer: 客户编号
+
+        返回:
+            str: 客户名称，标准化后与其他写法相同
+        """
+        name = self.customers[customer]
+        style = self.random.randrange(4)
+        if style == 1:
+            return _to_fullwidth(name)
+        if style == 2:
+            return name[:2] + _IDEOGRAPHIC_SPACE + name[2:]
+        return name.replace('（', '(').replace('）', ')') if style == 3 else name
+
+    def _product_text(self, product: int) -> str:
+        """
+        随机选择一种产品名称写法
+
+        参数:
+            product: 产品编号
+
+        返回:
+            str: 产品名称，标准化后与其他写法相同
+        """
+        name = self.products[product]
+        style = self.random.randrange(4)
+        if style == 1:
+            return name.lower()
+        if style == 2:
+            return _to_fullwidth(name)
+        return name.upper() if style == 3 else name
+
+
+def _to_fullwidth(text: str) -> str:
+    """
+    把半角可见字符（不含空格）转换为全角字符
+
+    参数:
+        text: 文本
+
+    返回:
+        str: 转换后的文本
+    """
+    return ''.join(
+        chr(ord(char) + _FULLWIDTH_OFFSET) if '!' <= char <= '~' else char
+        for char in text
+    )
+
+
+def parse_row_count(text: str) -> int:
+    """
+    解析行数，支持k（千）和m（百万）后缀
+
+    参数:
+        text: 行数文本，如"10000"、"100k"、"1m"
+
+    返回:
+        int: 行数
+
+    异常:
+        ValueError: 无法解析
+    """
+    value = text.strip().lower()
+    multiplier = 1
+    if value.endswith('k'):
+        value, multiplier = value[:-1], 1000
+    elif value.endswith('m'):
+        value, multiplier = value[:-1], 1000000
+    return int(float(value) * multiplier)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    命令行入口：生成一个测试工作簿
+
+    参数:
+        argv: 命令行参数列表，默认为sys.argv[1:]
+
+    返回:
+        int: 退出码
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.workbook_generator',
+        description='生成性能基准测试使用的双工作表工作簿'
+    )
+    parser.add_argument('output', help='输出的Excel文件路径')
+    parser.add_argument('--rows', type=parse_row_count, default=10000,
+                        help='待匹配表的行数，支持k和m后缀，默认10k')
+    parser.add_argument('--reference-rows', type=parse_row_count, default=None,
+                        help='匹配原表的行数，默认为待匹配表行数的一半（至少1000行）')
+    parser.add_argument('--duplicates', type=float, default=DEFAULT_DUPLICATE_RATIO,
+                        help=f'重复行的比例，默认{DEFAULT_DUPLICATE_RATIO}')
+    parser.add_argument('--match-ratio', type=float, default=DEFAULT_MATCH_RATIO,
+                        help=f'在匹配原表中有供应商的(客户, 产品)比例，默认{DEFAULT_MATCH_RATIO}')
+    parser.add_argument('--seed', type=int, default=0, help='随机种子，默认0')
+    args = parser.parse_args(argv)
+
+    try:
+        generate_workbook(
+            args.output, args.rows, args.reference_rows, args.duplicates, args.match_ratio, args.seed
+        )
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+
+    print(f"已生成: {args.output}（待匹配表 {args.rows} 行）")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
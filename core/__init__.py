@@ -1,22 +1,112 @@
 """
 核心业务逻辑模块
 
-包含数据模型、数据标准化、Excel处理和日志配置。
+包含数据模型、日期解析、数据标准化（含进程池并行标准化）、Excel处理、搜索键编码、重复检测、匹配原表索引（内存/SQLite）及其磁盘缓存、增量分析状态、匹配引擎（逐行/批量/分区并行）、后台线程流水线、工作簿分析流程、分阶段计时、性能分析和日志配置。
 """
 
-from .data_models import MatchResult, CellStyle, CellStyles
-from .data_standardizer import standardize_data
-from .excel_processor import get_sheet_data, clear_sheet, copy_title_row, init_result_sheet
+from .data_models import MatchResult, CellStyle, CellStyles, MatchStatus
+from .date_parser import MonthMask, parse_date, parse_date_range, month_ordinal, month_mask
+from .data_standardizer import (
+    standardize_data, standardize_row,
+    configure_standardize_cache, get_standardize_cache_stats, clear_standardize_cache, expire_standardize_cache
+)
+from .parallel_standardizer import ParallelStandardizer, iter_keyed_rows
+from .excel_processor import (
+    SheetRow, open_workbook, iter_sheet_rows, iter_sheet_values, iter_reference_rows, standardize_sheet_values,
+    get_sheet_data, clear_sheet, copy_title_row, init_result_sheet, CellStyler,
+    find_column, find_or_add_column, set_status_formatting, remove_status_formatting
+)
 from .logging_config import setup_logging
+from .profiling import AnalysisProfiler
+from .key_codec import KeyCodec
+from .duplicate_tracker import DuplicateTracker
+from .reference_index import ReferenceIndex
+from .sqlite_reference_index import SqliteReferenceIndex
+from .index_cache import (
+    CacheDirectory, ReferenceIndexCache, default_index_cache_dir, reference_fingerprint
+)
+from .analysis_state import AnalysisState, AnalysisStateStore, RowState, default_state_dir
+from .match_engine import MatchEngine, determine_cell_style, determine_status
+from .batch_match_engine import NUMPY_AVAILABLE, BatchMatchEngine
+from .partitioned_match_engine import PartitionedMatchEngine
+from .pipeline import ThreadedReader, ThreadedWriter
+from .instrumentation import PHASES, PHASE_LABELS, PhaseTimer, format_phase_seconds, format_summary
+from .workbook_analyzer import (
+    OUTPUT_IN_PLACE, OUTPUT_SEPARATE, REFERENCE_MEMORY, REFERENCE_SQLITE, MATCH_ROW, MATCH_BATCH,
+    MATCH_PARTITIONED, STYLE_CELLS, STYLE_CONDITIONAL, AnalysisCancelled, AnalysisProgress, analyze_workbook, result_file_path
+)
 
 __all__ = [
     'MatchResult',
     'CellStyle',
     'CellStyles',
+    'MatchStatus',
+    'parse_date',
+    'parse_date_range',
+    'MonthMask',
+    'month_ordinal',
+    'month_mask',
     'standardize_data',
+    'standardize_row',
+    'configure_standardize_cache',
+    'get_standardize_cache_stats',
+    'clear_standardize_cache',
+    'expire_standardize_cache',
+    'ParallelStandardizer',
+    'iter_keyed_rows',
+    'SheetRow',
+    'open_workbook',
+    'iter_sheet_rows',
+    'iter_sheet_values',
+    'iter_reference_rows',
+    'standardize_sheet_values',
     'get_sheet_data',
     'clear_sheet',
     'copy_title_row',
     'init_result_sheet',
+    'CellStyler',
+    'find_column',
+    'find_or_add_column',
+    'set_status_formatting',
+    'remove_status_formatting',
     'setup_logging',
+    'AnalysisProfiler',
+    'KeyCodec',
+    'DuplicateTracker',
+    'ReferenceIndex',
+    'SqliteReferenceIndex',
+    'CacheDirectory',
+    'ReferenceIndexCache',
+    'default_index_cache_dir',
+    'reference_fingerprint',
+    'AnalysisState',
+    'RowState',
+    'AnalysisStateStore',
+    'default_state_dir',
+    'MatchEngine',
+    'determine_cell_style',
+    'determine_status',
+    'BatchMatchEngine',
+    'NUMPY_AVAILABLE',
+    'PartitionedMatchEngine',
+    'ThreadedReader',
+    'ThreadedWriter',
+    'PHASES',
+    'PHASE_LABELS',
+    'PhaseTimer',
+    'format_phase_seconds',
+    'format_summary',
+    'AnalysisCancelled',
+    'AnalysisProgress',
+    'analyze_workbook',
+    'result_file_path',
+    'OUTPUT_IN_PLACE',
+    'OUTPUT_SEPARATE',
+    'REFERENCE_MEMORY',
+    'REFERENCE_SQLITE',
+    'MATCH_ROW',
+    'MATCH_BATCH',
+    'MATCH_PARTITIONED',
+    'STYLE_CELLS',
+    'STYLE_CONDITIONAL',
 ]
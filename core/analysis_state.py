@@ -0,0 +1,199 @@
+"""
+增量分析状态模块
+
+用户修改少量数据行后再次分析时，大部分行的结果与上次相同。本模块把上次分析时
+每一行的内容指纹、(客户, 产品)指纹、状态码和写入"匹配到的数据"的供应商保存到
+用户缓存目录（按工作簿路径区分），下次分析时据此只重新匹配可能变化的行。
+
+一行的匹配结果只取决于它自己的搜索键、同一(客户, 产品)中排在它前面的行
+（重复检测），以及匹配原表中该(客户, 产品)的数据。因此匹配原表不变时，
+只要某个(客户, 产品)的所有行都没有变化，这些行的结果就与上次完全相同；
+有任何一行新增、删除或修改时，该(客户, 产品)的所有行都重新匹配。
+
+状态保存在工作簿之外：保存在工作簿中的隐藏工作表会随工作簿一起加载和保存，
+十万行时读写状态的时间就超过了重新匹配的时间。
+
+主要功能:
+- 计算行指纹和(客户, 产品)指纹 (row_fingerprint, pair_fingerprint)
+- 按工作簿路径读取和保存分析状态 (AnalysisStateStore)
+
+注意:
+    状态文件使用pickle格式，只应存放在当前用户自己的缓存目录中。
+
+作者: 供应商数据智能匹配系统开发团队
+版本: 1.0
+"""
+
+import hashlib
+import os
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
+
+from .index_cache import CacheDirectory, default_index_cache_dir
+
+# 状态文件扩展名
+STATE_FILE_SUFFIX = '.state'
+
+# 状态目录的默认容量上限（字节）
+DEFAULT_STATE_MAX_BYTES = 256 * 1024 * 1024
+
+# 状态文件格式版本，修改AnalysisState的结构时递增
+_STATE_FORMAT_VERSION = 1
+
+# 指纹中各值之间的分隔符，Excel单元格中不允许出现该控制字符
+_SEPARATOR = '\x1f'
+
+
+def default_state_dir() -> str:
+    """
+    获取默认的增量分析状态目录（与索引缓存目录位于同一父目录下）
+
+    返回:
+        str: 状态目录路径（可能尚未创建）
+    """
+    return os.path.join(os.path.dirname(default_index_cache_dir()), 'analysis_state')
+
+
+class RowState(NamedTuple):
+    """
+    一行数据的分析结果
+
+    属性:
+        fingerprint (int): 前三列原始值的指纹
+        pair (int): 标准化后的(客户, 产品)指纹
+        status (str): MatchStatus中的状态码
+        suppliers (Tuple): 写入"匹配到的数据"的供应商，未匹配时为空
+    """
+    fingerprint: int
+    pair: int
+    status: str
+    suppliers: Tuple[Any, ...]
+
+
+class AnalysisState:
+    """
+    一次分析的状态
+
+    属性:
+        reference (str): 匹配原表指纹（见core.index_cache.reference_fingerprint）
+        rows (List[RowState]): 按待匹配表顺序排列的行状态
+    """
+
+    def __init__(self, reference: str, rows: List[RowState]):
+        """
+        初始化分析状态
+
+        参数:
+            reference: 匹配原表指纹
+            rows: 行状态列表
+        """
+        self.version = _STATE_FORMAT_VERSION
+        self.reference = reference
+        self.rows = rows
+
+
+class AnalysisStateStore(CacheDirectory):
+    """
+    增量分析状态的存储
+
+    每个工作簿（按绝对路径区分）保存最近一次分析的状态。状态只在匹配原表指纹
+    和各行指纹都一致时才被沿用，因此工作簿被替换或修改后不会用错。
+
+    示例:
+        >>> store = AnalysisStateStore()
+        >>> previous = store.load_state(file_path)
+        >>> store.store_state(file_path, AnalysisState(reference, rows))
+    """
+
+    file_suffix = STATE_FILE_SUFFIX
+    entry_type = AnalysisState
+    description = '增量分析状态'
+
+    def __init__(self, state_dir: Optional[str] = None, max_bytes: int = DEFAULT_STATE_MAX_BYTES):
+        """
+        初始化状态存储
+
+        参数:
+            state_dir: 状态目录，默认为default_state_dir()
+            max_bytes: 状态目录的容量上限（字节）
+        """
+        super().__init__(state_dir or default_state_dir(), max_bytes)
+
+    def load_state(self, file_path: str) -> Optional[AnalysisState]:
+        """
+        读取工作簿上次分析的状态
+
+        参数:
+            file_path: 工作簿路径
+
+        返回:
+            Optional[AnalysisState]: 上次分析的状态，没有或格式版本不符时返回None
+        """
+        state = self.load(self._workbook_key(file_path))
+        if state is None or getattr(state, 'version', None) != _STATE_FORMAT_VERSION:
+            return None
+        return state
+
+    def store_state(self, file_path: str, state: AnalysisState):
+        """
+        保存工作簿本次分析的状态
+
+        参数:
+            file_path: 工作簿路径
+            state: 分析状态
+        """
+        self.store(self._workbook_key(file_path), state)
+
+    @staticmethod
+    def _workbook_key(file_path: str) -> str:
+        """
+        计算工作簿路径对应的键
+
+        参数:
+            file_path: 工作簿路径
+
+        返回:
+            str: 十六进制键
+        """
+        path = os.path.normcase(os.path.abspath(file_path))
+        return hashlib.blake2b(path.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+
+
+def row_fingerprint(values: Sequence[str]) -> int:
+    """
+    计算一行原始值的指纹
+
+    参数:
+        values: 前三列的原始值（转换为字符串）
+
+    返回:
+        int: 64位整数指纹
+    """
+    return _fingerprint(_SEPARATOR.join(values))
+
+
+def pair_fingerprint(customer: str, product: str) -> int:
+    """
+    计算标准化后的(客户, 产品)指纹
+
+    参数:
+        customer: 标准化后的客户名称
+        product: 标准化后的产品名称
+
+    返回:
+        int: 64位整数指纹
+    """
+    return _fingerprint(customer + _SEPARATOR + product)
+
+
+def _fingerprint(text: str) -> int:
+    """
+    计算字符串的64位整数指纹
+
+    参数:
+        text: 字符串
+
+    返回:
+        int: 64位整数指纹
+    """
+    digest = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big')
@@ -0,0 +1,454 @@
+"""
+批量匹配引擎模块
+
+MatchEngine逐行检查重复、查找索引，每行都要付出解释器开销。本模块提供按整列处理的
+BatchMatchEngine：先把全部待匹配数据编码为NumPy整数数组（(客户, 产品)编号、月份序号、
+日期范围编号），再用排序和np.searchsorted一次完成重复检测和匹配原表查找，
+日期范围按月份向量化展开。匹配结果（包括重复规则）与MatchEngine完全相同。
+
+以下数据所在的(客户, 产品)组按原有的逐行方式处理，保证结果一致:
+- 日期不是YYYYMM格式的单条数据（无法换算为月份序号）
+- 不是按月份递增连续排列的日期范围
+
+NumPy是可选依赖，未安装NumPy或索引不是内存中的ReferenceIndex时，
+BatchMatchEngine自动退回逐行匹配。
+
+作者: 供应商数据智能匹配系统开发团队
+版本: 1.0
+"""
+
+import logging
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, TypeVar
+
+from .data_models import MatchResult
+from .date_parser import MONTH_ORDINAL_BASE_YEAR, MONTH_ORDINAL_YEARS, month_ordinal
+from .duplicate_tracker import DuplicateTracker, SearchKey
+from .key_codec import MONTH_BITS, PRODUCT_BITS, KeyCodec
+from .match_engine import MatchEngine
+from .reference_index import ReferenceIndex
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+T = TypeVar('T')
+
+# NumPy是否可用
+NUMPY_AVAILABLE = np is not None
+
+# 每个(客户, 产品)编号占用的月份序号空间
+_MONTH_SPACE = 1 << MONTH_BITS
+
+# 整数键放入int64时客户编号的上限
+_CUSTOMER_LIMIT = 1 << (63 - PRODUCT_BITS - MONTH_BITS)
+
+# 数据类型：可换算为月份序号的单条数据 / 其他单条数据 / 可向量化的日期范围 / 其他日期范围 /
+# 逐行处理的数据
+_KIND_SINGLE = 0
+_KIND_SINGLE_OTHER = 1
+_KIND_RANGE = 2
+_KIND_RANGE_OTHER = 3
+_KIND_FALLBACK = 4
+
+# 月份序号对应的标准化日期
+_MONTH_STRINGS = [
+    f"{MONTH_ORDINAL_BASE_YEAR + ordinal // 12}{ordinal % 12 + 1:02d}"
+    for ordinal in range(MONTH_ORDINAL_YEARS * 12)
+]
+
+
+class _BatchOutcome(NamedTuple):
+    """
+    向量化计算的结果，各列表按行号索引（日期范围的匹配明细除外）
+    """
+    duplicate: List[bool]
+    matched: List[bool]
+    values: List[Any]
+    match_end: List[int]
+    match_months: List[int]
+    match_values: List[Any]
+
+
+class BatchMatchEngine(MatchEngine):
+    """
+    基于NumPy的批量匹配引擎
+
+    接口与MatchEngine相同。match()先读入全部数据行并整列计算，
+    再按输入顺序逐行生成MatchResult，结果对象不会同时全部留在内存中。
+    整列计算期间不产出结果，读入数据后、编码、逐行处理的组、重复检测和查找之间
+    调用cancel_check，使计算可以被取消。
+    匹配原表的排序键数组在第一次匹配时建立，之后复用。
+
+    示例:
+        >>> engine = BatchMatchEngine.from_rows(sheet2_rows)
+        >>> for row, result in engine.match(rows, key=standardize_row):
+        ...     print(row, result.is_matched)
+    """
+
+    def __init__(self, reference: ReferenceIndex, cancel_check: Optional[Callable[[], None]] = None):
+        """
+        初始化批量匹配引擎
+
+        参数:
+            reference: 已构建好的匹配原表索引
+            cancel_check: 可选的取消检查函数，需要取消时抛出异常
+        """
+        super().__init__(reference, cancel_check)
+        self._reference_arrays: Optional[Tuple[Any, Any]] = None
+
+    def match(
+        self,
+        rows: Iterable[T],
+        key: Optional[Callable[[T], SearchKey]] = None
+    ) -> Iterator[Tuple[T, MatchResult]]:
+        """
+        匹配全部待匹配数据
+
+        参数:
+            rows: 待匹配的数据行
+            key: 从数据行中取出标准化搜索键的函数，默认数据行本身就是搜索键
+
+        返回:
+            生成器，按输入顺序产出(数据行, MatchResult)元组
+        """
+        if not self._can_vectorize():
+            yield from super().match(rows, key)
+            return
+
+        self.lookups_saved = 0
+
+        rows = list(rows)
+        self._check_cancelled()
+        search_keys = [key(row) for row in rows] if key is not None else rows
+        yield from zip(rows, self._iter_results(search_keys))
+
+    def match_keys(self, search_keys: List[SearchKey]) -> List[MatchResult]:
+        """
+        整列匹配搜索键
+
+        参数:
+            search_keys: 按顺序排列的标准化搜索键
+
+        返回:
+            List[MatchResult]: 与search_keys一一对应的匹配结果
+        """
+        return [result for _, result in self.match(search_keys)]
+
+    def _can_vectorize(self) -> bool:
+        """
+        是否可以使用向量化匹配
+
+        返回:
+            bool: 已安装NumPy且索引为内存中的ReferenceIndex时返回True
+        """
+        if np is None:
+            logging.info("未安装NumPy，使用逐行匹配")
+            return False
+        if not isinstance(self.reference, ReferenceIndex):
+            logging.info("批量匹配只支持内存索引，使用逐行匹配")
+            return False
+        if len(self.reference.codec) >= _CUSTOMER_LIMIT:
+            logging.info("匹配原表的客户数量超出批量匹配的编码范围，使用逐行匹配")
+            return False
+        return True
+
+    def _get_reference_arrays(self) -> Tuple[Any, Any]:
+        """
+        获取匹配原表的排序键数组和对应的供应商数组
+
+        返回:
+            Tuple[ndarray, ndarray]: (升序排列的整数键, 供应商)
+        """
+        if self._reference_arrays is None:
+            suppliers = self.reference.suppliers
+            keys = np.fromiter(suppliers.keys(), dtype=np.int64, count=len(suppliers))
+            values = np.fromiter(suppliers.values(), dtype=object, count=len(suppliers))
+            order = np.argsort(keys)
+            self._reference_arrays = (keys[order], values[order])
+        return self._reference_arrays
+
+    def _iter_results(self, search_keys: List[SearchKey]) -> Iterator[MatchResult]:
+        """
+        整列计算后按顺序生成匹配结果
+
+        参数:
+            search_keys: 按顺序排列的标准化搜索键
+
+        返回:
+            生成器，产出与search_keys一一对应的MatchResult
+        """
+        if not search_keys:
+            return
+
+        columns = _encode_keys(search_keys, self.reference.codec)
+        kind = columns['kind']
+        self._check_cancelled()
+
+        # 含有无法向量化数据的(客户, 产品)组逐行处理
+        fallback_results: Dict[int, MatchResult] = {}
+        fallback = _fallback_rows(columns)
+        if fallback.size:
+            tracker = DuplicateTracker()
+            memo: Dict[SearchKey, Any] = {}
+            for row_index in fallback.tolist():
+                search_key = search_keys[row_index]
+                fallback_results[row_index] = self._analyze_match(
+                    search_key, tracker.check_and_add(search_key), memo
+                )
+            kind = kind.copy()
+            kind[fallback] = _KIND_FALLBACK
+            self._check_cancelled()
+
+        outcome = self._evaluate(columns, kind)
+        duplicate = outcome.duplicate
+        matched = outcome.matched
+        values = outcome.values
+        match_end = outcome.match_end
+        match_months = outcome.match_months
+        match_values = outcome.match_values
+
+        start = 0
+        for row_index, row_kind in enumerate(kind.tolist()):
+            if row_kind == _KIND_SINGLE:
+                if not matched[row_index]:
+                    yield MatchResult(duplicate[row_index])
+                    continue
+
+                date = search_keys[row_index][0]
+                value = values[row_index]
+                if type(value) is list:
+                    suppliers = [(date, supplier) for supplier in value]
+                else:
+                    suppliers = [(date, value)]
+                yield MatchResult(duplicate[row_index], False, False, True, suppliers)
+
+            elif row_kind == _KIND_RANGE:
+                end = match_end[row_index]
+                suppliers = []
+                for position in range(start, end):
+                    date = _MONTH_STRINGS[match_months[position]]
+                    value = match_values[position]
+                    if type(value) is list:
+                        suppliers.extend((date, supplier) for supplier in value)
+                    else:
+                        suppliers.append((date, value))
+                start = end
+                yield MatchResult(duplicate[row_index], True, matched[row_index], False, suppliers)
+
+            else:
+                yield fallback_results.pop(row_index)
+
+    def _evaluate(self, columns: Dict[str, Any], kind: Any) -> _BatchOutcome:
+        """
+        向量化计算重复标记和匹配结果
+
+        参数:
+            columns: _encode_keys返回的整数列
+            kind: 各行的数据类型，逐行处理的行为_KIND_FALLBACK
+
+        返回:
+            _BatchOutcome: 各行的重复标记、是否匹配、供应商，以及日期范围的匹配明细
+        """
+        reference_keys, reference_values = self._get_reference_arrays()
+        row_count = len(kind)
+        pair = columns['pair']
+        first = columns['first']
+        last = columns['last']
+        reference_pair = columns['reference_pair']
+
+        singles = np.flatnonzero(kind == _KIND_SINGLE)
+        ranges = np.flatnonzero(kind == _KIND_RANGE)
+        duplicate = np.zeros(row_count, dtype=bool)
+
+        # 单条数据：同一(客户, 产品, 月份)之前出现过
+        single_keys = pair[singles] * _MONTH_SPACE + first[singles]
+        unique_keys, first_index, inverse = np.unique(
+            single_keys, return_index=True, return_inverse=True
+        )
+        first_position = singles[first_index]
+        duplicate[singles] = first_position[inverse.reshape(-1)] != singles
+
+        # 单条数据：落在同一(客户, 产品)之前最近一次出现的日期范围内
+        # 按(客户, 产品)和行号排序后，向前传递最近一个日期范围的位置
+        candidates = np.concatenate((singles, ranges))
+        sorted_rows = candidates[np.lexsort((candidates, pair[candidates]))]
+        is_range = kind[sorted_rows] == _KIND_RANGE
+        last_slot = np.maximum.accumulate(
+            np.where(is_range, np.arange(len(sorted_rows)), -1)
+        )[~is_range]
+        single_rows = sorted_rows[~is_range]
+        range_rows = sorted_rows[np.maximum(last_slot, 0)]
+        in_last_range = (
+            (last_slot >= 0)
+            & (pair[range_rows] == pair[single_rows])
+            & (first[range_rows] <= first[single_rows])
+            & (first[single_rows] <= last[range_rows])
+        )
+        duplicate[single_rows[in_last_range]] = True
+
+        # 日期范围：完全相同的日期范围之前出现过
+        range_keys = pair[ranges] * columns['date_count'] + columns['date_id'][ranges]
+        _, first_range_index, range_inverse = np.unique(
+            range_keys, return_index=True, return_inverse=True
+        )
+        range_duplicate = ranges[first_range_index][range_inverse.reshape(-1)] != ranges
+
+        # 日期范围按月份展开
+        lengths = last[ranges] - first[ranges] + 1
+        offsets = np.cumsum(lengths) - lengths
+        owner = np.repeat(np.arange(len(ranges)), lengths)
+        months = first[ranges][owner] + np.arange(len(owner)) - offsets[owner]
+
+        # 日期范围：展开的某个月份之前作为单个月份出现过
+        if len(months) and len(unique_keys):
+            probe_keys = pair[ranges][owner] * _MONTH_SPACE + months
+            position = np.minimum(np.searchsorted(unique_keys, probe_keys), len(unique_keys) - 1)
+            earliest = np.where(unique_keys[position] == probe_keys, first_position[position], row_count)
+            range_duplicate |= np.minimum.reduceat(earliest, offsets) < ranges
+        duplicate[ranges] = range_duplicate
+        self._check_cancelled()
+
+        # 查找匹配原表：单条数据不重复时才匹配，日期范围所有月份都找到时为全部匹配
+        matched = np.zeros(row_count, dtype=bool)
+        values = np.full(row_count, None, dtype=object)
+        single_found, values[singles] = _lookup(
+            reference_keys, reference_values, reference_pair[singles], first[singles]
+        )
+        matched[singles] = single_found & ~duplicate[singles]
+
+        match_end = np.zeros(row_count, dtype=np.int64)
+        month_found, month_values = _lookup(
+            reference_keys, reference_values, reference_pair[ranges][owner], months
+        )
+        if len(months):
+            matched[ranges] = np.logical_and.reduceat(month_found, offsets)
+            match_end[ranges] = np.cumsum(np.add.reduceat(month_found.astype(np.int64), offsets))
+
+        return _BatchOutcome(
+            duplicate.tolist(), matched.tolist(), values.tolist(), match_end.tolist(),
+            months[month_found].tolist(), month_values[month_found].tolist()
+        )
+
+
+def _encode_keys(search_keys: List[SearchKey], reference_codec: KeyCodec) -> Dict[str, Any]:
+    """
+    将搜索键编码为整数列
+
+    每个不同的(客户, 产品)和日期只编码一次，每行只记录两者的编号，
+    各列再按编号从编码表中一次取出。
+
+    参数:
+        search_keys: 标准化搜索键
+        reference_codec: 匹配原表索引的字典编码，用于换算匹配原表中的(客户, 产品)编号
+
+    返回:
+        Dict[str, Any]: 以下各列（ndarray）及日期数量
+            pair: 待匹配数据内从0开始连续的(客户, 产品)编号
+            reference_pair: 匹配原表中的(客户, 产品)编号，匹配原表中没有时为-1
+            kind: 数据类型（_KIND_*）
+            first / last: 单条数据的月份序号（两列相同），或日期范围的起止月份序号
+            date_id: 日期编号，相同的日期编号相同
+            date_count: 不同日期的数量
+    """
+    pairs: Dict[Tuple[str, str], int] = {}
+    dates: Dict[str, int] = {}
+    reference_pairs: List[int] = []
+    date_table: List[Tuple[int, int, int]] = []
+    pair_ids: List[int] = []
+    date_ids: List[int] = []
+
+    for date, customer, product in search_keys:
+        pair_key = (customer, product)
+        pair_id = pairs.get(pair_key)
+        if pair_id is None:
+            pair_id = pairs[pair_key] = len(pairs)
+            reference_pair = reference_codec.find_pair(customer, product)
+            reference_pairs.append(-1 if reference_pair is None else reference_pair)
+        pair_ids.append(pair_id)
+
+        date_id = dates.get(date)
+        if date_id is None:
+            date_id = dates[date] = len(dates)
+            date_table.append(_describe_date(date))
+        date_ids.append(date_id)
+
+    pair = np.array(pair_ids, dtype=np.int64)
+    date_id = np.array(date_ids, dtype=np.int64)
+    date_columns = np.array(date_table, dtype=np.int64).reshape(-1, 3)[date_id]
+    return {
+        'pair': pair,
+        'reference_pair': np.array(reference_pairs, dtype=np.int64)[pair],
+        'kind': date_columns[:, 0].astype(np.int8),
+        'first': date_columns[:, 1].copy(),
+        'last': date_columns[:, 2].copy(),
+        'date_id': date_id,
+        'date_count': len(dates),
+    }
+
+
+def _describe_date(date: str) -> Tuple[int, int, int]:
+    """
+    描述一个标准化日期
+
+    参数:
+        date: 标准化后的单个日期或逗号分隔的日期范围
+
+    返回:
+        Tuple[int, int, int]: (数据类型, 起始月份序号, 结束月份序号)
+    """
+    if ',' not in date:
+        ordinal = month_ordinal(date)
+        if ordinal is None:
+            return _KIND_SINGLE_OTHER, 0, 0
+        return _KIND_SINGLE, ordinal, ordinal
+
+    # 只有按月份递增连续排列的日期范围可以按起止月份向量化展开
+    ordinals = [month_ordinal(month) for month in date.split(',')]
+    first = ordinals[0]
+    if first is None or ordinals != list(range(first, first + len(ordinals))):
+        return _KIND_RANGE_OTHER, 0, 0
+    return _KIND_RANGE, first, ordinals[-1]
+
+
+def _fallback_rows(columns: Dict[str, Any]) -> Any:
+    """
+    找出需要逐行处理的行
+
+    重复检测的状态按(客户, 产品)相互独立，因此含有无法向量化数据的(客户, 产品)组
+    整组逐行处理，其他组向量化处理，结果与全部逐行处理相同。
+
+    参数:
+        columns: _encode_keys返回的整数列
+
+    返回:
+        ndarray: 升序排列的行号
+    """
+    kind = columns['kind']
+    special = (kind == _KIND_SINGLE_OTHER) | (kind == _KIND_RANGE_OTHER)
+    if not special.any():
+        return np.empty(0, dtype=np.int64)
+    pair = columns['pair']
+    return np.flatnonzero(np.isin(pair, pair[special]))
+
+
+def _lookup(reference_keys: Any, reference_values: Any, reference_pair: Any, ordinal: Any) -> Tuple[Any, Any]:
+    """
+    在匹配原表的排序键数组中查找
+
+    参数:
+        reference_keys: 升序排列的匹配原表整数键
+        reference_values: 与整数键对应的供应商
+        reference_pair: 匹配原表中的(客户, 产品)编号，-1表示匹配原表中没有
+        ordinal: 月份序号
+
+    返回:
+        Tuple[ndarray, ndarray]: (是否找到, 供应商)，没有找到的位置供应商无意义
+    """
+    if not len(reference_keys) or not len(ordinal):
+        return np.zeros(len(ordinal), dtype=bool), np.full(len(ordinal), None, dtype=object)
+
+    probe_keys = (reference_pair << MONTH_BITS) | ordinal
+    position = np.minimum(np.searchsorted(reference_keys, probe_keys), len(reference_keys) - 1)
+    found = (reference_pair >= 0) & (reference_keys[position] == probe_keys)
+    return found, reference_values[position]
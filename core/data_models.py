@@ -7,12 +7,14 @@
 - 定义匹配结果数据结构 (MatchResult)
 - 定义单元格样式配置 (CellStyle)
 - 提供预定义的单元格样式集合 (CellStyles)
+- 定义匹配状态码及其对应的颜色 (MatchStatus)
 
 作者: 供应商数据智能匹配系统开发团队
 版本: 1.0
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Tuple
 from openpyxl.styles import PatternFill, Font
 
@@ -68,6 +70,19 @@ class MatchResult:
         if self.matched_suppliers is None:
             self.matched_suppliers = []
 
+    @property
+    def is_matched(self) -> bool:
+        """
+        是否计入已匹配
+
+        单条数据匹配成功，或日期范围内的所有月份全部匹配成功时，
+        该行数据计入已匹配，写入"匹配到的数据"工作表。
+
+        返回:
+            bool: 计入已匹配返回True，否则返回False
+        """
+        return self.is_match or (self.is_date_range and self.is_all_match)
+
 
 @dataclass
 class CellStyle:
@@ -84,6 +99,7 @@ class CellStyle:
     方法:
         to_pattern_fill(): 将样式转换为openpyxl的PatternFill对象
         to_font(): 将样式转换为openpyxl的Font对象
+        fill / font: 同一颜色共享的PatternFill和Font对象，按引用赋值给单元格
 
     示例:
         >>> # 创建黄色背景的样式
@@ -135,6 +151,60 @@ class CellStyle:
         """
         return Font(color=self.font_color)
 
+    @property
+    def fill(self) -> PatternFill:
+        """
+        共享的填充样式对象
+
+        同一填充颜色只创建一次PatternFill，所有单元格共享同一个对象。
+        共享对象不应被修改，需要修改时使用to_pattern_fill()创建新对象。
+
+        返回:
+            PatternFill: 纯色填充样式对象
+        """
+        return _shared_fill(self.fill_color)
+
+    @property
+    def font(self) -> Font:
+        """
+        共享的字体样式对象
+
+        同一字体颜色只创建一次Font，所有单元格共享同一个对象。
+        共享对象不应被修改，需要修改时使用to_font()创建新对象。
+
+        返回:
+            Font: 字体样式对象
+        """
+        return _shared_font(self.font_color)
+
+
+@lru_cache(maxsize=None)
+def _shared_fill(fill_color: str) -> PatternFill:
+    """
+    获取指定颜色的共享填充样式对象
+
+    参数:
+        fill_color: 填充颜色
+
+    返回:
+        PatternFill: 纯色填充样式对象
+    """
+    return CellStyle(fill_color).to_pattern_fill()
+
+
+@lru_cache(maxsize=None)
+def _shared_font(font_color: str) -> Font:
+    """
+    获取指定颜色的共享字体样式对象
+
+    参数:
+        font_color: 字体颜色
+
+    返回:
+        Font: 字体样式对象
+    """
+    return CellStyle('', font_color).to_font()
+
 
 class CellStyles:
     """
@@ -155,9 +225,10 @@ class CellStyles:
         >>> duplicate_style = CellStyles.YELLOW
         >>> fill = duplicate_style.to_pattern_fill()
 
-        >>> # 获取匹配成功样式
+        >>> # 获取匹配成功样式（共享对象，直接赋值给单元格）
         >>> matched_style = CellStyles.GREEN
-        >>> fill = matched_style.to_pattern_fill()
+        >>> cell.fill = matched_style.fill
+        >>> cell.font = matched_style.font
 
     颜色方案:
         - 黄色 ('FFFF00'): 重复数据警告
@@ -172,3 +243,40 @@ class CellStyles:
     BROWN = CellStyle('8B4513', 'FFFFFF')
     GREEN = CellStyle('90EE90')
     RED = CellStyle('FFB6C1')
+
+
+class MatchStatus:
+    """
+    匹配状态码
+
+    条件格式模式下写入待匹配表状态列的文字，每个状态码对应CellStyles中的一种颜色，
+    由工作表的条件格式规则按状态码显示颜色，不再逐个单元格设置样式。
+
+    状态码:
+        DUPLICATE ('重复'): 重复数据，黄色
+        ALL_MATCH ('全部匹配'): 日期范围全部匹配成功，紫色
+        PARTIAL_MATCH ('部分匹配'): 日期范围部分匹配成功，棕色
+        MATCH ('匹配'): 单条数据匹配成功，绿色
+        NO_MATCH ('未匹配'): 单条数据匹配失败，红色
+
+    属性:
+        STYLES (Dict[str, CellStyle]): 状态码到单元格样式的映射
+
+    使用示例:
+        >>> MatchStatus.STYLES[MatchStatus.MATCH] is CellStyles.GREEN
+        True
+    """
+
+    DUPLICATE = '重复'
+    ALL_MATCH = '全部匹配'
+    PARTIAL_MATCH = '部分匹配'
+    MATCH = '匹配'
+    NO_MATCH = '未匹配'
+
+    STYLES = {
+        DUPLICATE: CellStyles.YELLOW,
+        ALL_MATCH: CellStyles.PURPLE,
+        PARTIAL_MATCH: CellStyles.BROWN,
+        MATCH: CellStyles.GREEN,
+        NO_MATCH: CellStyles.RED,
+    }
@@ -7,14 +7,15 @@
 主要功能:
 - 日期数据的标准化（支持多种日期格式）
 - 日期范围数据的解析和扩展
-- 客户名称的标准化（处理全角半角、标点符号等）
-- 产品名称的标准化（处理大小写、特殊符号等）
+- 客户名称的标准化（单次str.translate折叠全角字符、标点符号等）
+- 产品名称的标准化（同上，并统一为大写）
+- 标准化结果的有界LRU缓存及命中率统计（跨年后清空，见expire_standardize_cache）
 
 支持的日期格式:
 - 完整日期: 2024-03、2024/03、2024.03
 - 简写日期: 2403、24年3月、3月
 - 日期范围: 2024年3月-5月、202403-05、3月到5月
-- 中文月份: 正月、三月、十月等
+- 中文月份: 正月、三月、十月、十一月等（由date_parser解析）
 
 作者: 供应商数据智能匹配系统开发团队
 版本: 1.0
@@ -23,7 +24,40 @@
 import re
 import logging
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, NamedTuple, Optional, Sequence, Tuple
+
+from .date_parser import parse_date, parse_date_range
+
+# 标准化规则版本号，修改标准化规则（包括core.date_parser）时递增，
+# 使磁盘上缓存的匹配原表索引失效（见core.index_cache）
+NORMALIZER_VERSION = 1
+
+# 标准化结果缓存的默认容量（条目数）
+# 表格中的客户、产品和月份写法高度重复，几万条足以覆盖常见数据
+DEFAULT_CACHE_SIZE = 65536
+
+
+class CacheStats(NamedTuple):
+    """
+    标准化缓存统计信息
+
+    属性:
+        hits (int): 命中次数
+        misses (int): 未命中次数（实际执行标准化的次数）
+        maxsize (Optional[int]): 缓存容量，None表示不限容量
+        currsize (int): 当前缓存条目数
+    """
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """命中率（0-1），没有任何调用时为0"""
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
 
 
 def standardize_data(value: str, column_index: int) -> str:
@@ -33,6 +67,9 @@ def standardize_data(value: str, column_index: int) -> str:
     根据列索引调用相应的标准化函数，对不同类型的数据进行标准化处理。
     这是数据标准化的统一入口，根据数据的位置自动选择合适的标准化策略。
 
+    标准化结果按(原始值, 列索引)缓存在有界LRU缓存中，重复出现的值只需一次字典查找。
+    缓存容量可以通过configure_standardize_cache调整，跨年后由expire_standardize_cache清空。
+
     参数:
         value (str): 需要标准化的原始数据值
         column_index (int): 列索引，用于判断数据类型
@@ -62,6 +99,20 @@ def standardize_data(value: str, column_index: int) -> str:
         >>> standardize_data("product abc", 3)
         'PRODUCT ABC'
     """
+    return _cached_standardize(value, column_index)
+
+
+def _standardize_uncached(value: str, column_index: int) -> str:
+    """
+    执行数据标准化（不经过缓存）
+
+    参数:
+        value (str): 需要标准化的原始数据值
+        column_index (int): 列索引，含义同standardize_data
+
+    返回:
+        str: 标准化后的数据值
+    """
     # 如果输入值为空，返回空字符串
     if not value:
         return ""
@@ -84,113 +135,162 @@ def standardize_data(value: str, column_index: int) -> str:
     return value
 
 
+# 带缓存的标准化函数，由configure_standardize_cache重建
+_cached_standardize: Callable[[str, int], str] = lru_cache(
+    maxsize=DEFAULT_CACHE_SIZE
+)(_standardize_uncached)
+
+
+# 缓存中的结果对应的年份（只有月份的日期按当前年份补全），由expire_standardize_cache更新
+_cache_year = ''
+
+
+def expire_standardize_cache() -> bool:
+    """
+    跨年后清空标准化缓存
+
+    "3月"、"三月"等只有月份的日期按当前年份补全，缓存的结果只在同一年内有效。
+    图形界面可能跨年一直运行，因此每次分析开始时调用，年份变化时清空缓存，
+    同一年内的多次分析仍然共享缓存。
+
+    返回:
+        bool: 清空了缓存返回True
+    """
+    global _cache_year
+    year = str(datetime.now().year)
+    if year == _cache_year:
+        return False
+
+    expired = bool(_cache_year)
+    _cached_standardize.cache_clear()
+    _cache_year = year
+    if expired:
+        logging.info(f"年份已变为{year}，清空标准化缓存")
+    return True
+
+
+def configure_standardize_cache(maxsize: Optional[int]) -> None:
+    """
+    设置标准化缓存的容量
+
+    重建缓存并清空已有条目和统计。超出容量时淘汰最久未使用的条目。
+
+    参数:
+        maxsize (Optional[int]): 缓存容量（条目数），0表示关闭缓存，None表示不限容量
+
+    示例:
+        >>> configure_standardize_cache(100000)
+    """
+    global _cached_standardize
+    if maxsize is not None and maxsize < 0:
+        raise ValueError(f"缓存容量不能为负数: {maxsize}")
+
+    _cached_standardize = lru_cache(maxsize=maxsize)(_standardize_uncached)
+    logging.info(f"标准化缓存容量已设置为: {maxsize}")
+
+
+def get_standardize_cache_stats() -> CacheStats:
+    """
+    获取标准化缓存的累计统计信息
+
+    统计从上次重建或清空缓存开始累计。需要统计单次分析时，
+    可以在分析前后各取一次，用cache_stats_delta计算差值。
+
+    返回:
+        CacheStats: 命中次数、未命中次数、容量和当前条目数
+    """
+    info = _cached_standardize.cache_info()
+    return CacheStats(info.hits, info.misses, info.maxsize, info.currsize)
+
+
+def cache_stats_delta(before: CacheStats, after: CacheStats) -> CacheStats:
+    """
+    计算两次缓存统计之间的差值
+
+    参数:
+        before (CacheStats): 较早的统计
+        after (CacheStats): 较晚的统计
+
+    返回:
+        CacheStats: 期间的命中和未命中次数，容量和条目数取较晚的值
+    """
+    return CacheStats(
+        after.hits - before.hits,
+        after.misses - before.misses,
+        after.maxsize,
+        after.currsize
+    )
+
+
+def clear_standardize_cache() -> None:
+    """
+    清空标准化缓存及其统计信息
+    """
+    _cached_standardize.cache_clear()
+
+
+def standardize_row(row: Sequence[Any]) -> Tuple[str, str, str]:
+    """
+    标准化一行数据的前三列
+
+    将日期、客户名称、产品名称三列的原始值转换为字符串后分别标准化，
+    得到用于匹配的搜索键。空单元格(None)与原有逻辑一致，按字符串"None"处理。
+
+    参数:
+        row (Sequence[Any]): 一行原始数据，至少包含3个值
+
+    返回:
+        Tuple[str, str, str]: 标准化后的(日期, 客户名称, 产品名称)
+
+    示例:
+        >>> standardize_row(("2024年3月", "客户A（中国）", "product abc"))
+        ('202403', '客户A(中国)', 'PRODUCT ABC')
+    """
+    return (
+        standardize_data(str(row[0]), 1),
+        standardize_data(str(row[1]), 2),
+        standardize_data(str(row[2]), 3)
+    )
+
+
 def _standardize_date(value: str) -> str:
     """
     标准化日期数据
 
     将各种格式的日期数据统一转换为YYYYMM格式（如202403表示2024年3月）。
-    支持中文数字、日期范围等多种格式。
+    支持中文数字、日期范围等多种格式，具体解析由core.date_parser完成。
 
     参数:
         value (str): 原始日期字符串
 
     返回:
         str: 标准化后的日期字符串，格式为YYYYMM。
-             如果无法解析，返回原始值。
+             如果无法解析，返回移除"年"、"月"并转换中文数字后的值。
 
     处理步骤:
-        1. 记录调试日志
-        2. 将中文数字转换为阿拉伯数字（一->1, 二->2, ..., 正->1）
-        3. 尝试解析为日期范围格式
-        4. 移除"月"和"年"字符
-        5. 使用正则表达式匹配各种日期格式
-        6. 转换为标准格式并验证月份有效性
+        1. 将全角数字和符号折叠为半角
+        2. 转换中文数字（一->1, 十一->11, 正->1），切分为数字串和字符记号
+        3. 尝试识别日期范围
+        4. 依次尝试完整日期、简写日期和单独月份，并验证月份有效性
 
     支持的日期格式:
         - 完整格式: 2024-03、2024/03、2024.03
         - 年份简写: 2403 -> 202403
         - 单独月份: 3月 -> 202403（使用当前年份）
-        - 中文月份: 正月、三月、十月等
+        - 中文月份: 正月、三月、十月、十一月等
 
     示例:
         >>> _standardize_date("2024年3月")
         '202403'
 
-        >>> _standardize_date("24年3月")
-        '202403'
-
-        >>> _standardize_date("3月")
-        '202403'  # 假设当前年份为2024
+        >>> _standardize_date("十一月")
+        '202411'  # 假设当前年份为2024
 
         >>> _standardize_date("2024年3月-5月")
         '202403,202404,202405'  # 日期范围由_parse_date_range处理
     """
-    logging.debug(f"处理日期值: {value}")
-
-    # 定义中文数字到阿拉伯数字的映射
-    cn_num_map = {
-        '一': '1', '二': '2', '三': '3', '四': '4',
-        '五': '5', '六': '6', '七': '7', '八': '8',
-        '九': '9', '十': '10', '正': '1'  # 正月指一月
-    }
-
-    # 将中文数字替换为阿拉伯数字
-    for cn, num in cn_num_map.items():
-        value = value.replace(cn, num)
-
-    # 尝试解析日期范围（如"3月-5月"）
-    date_range = _parse_date_range(value)
-    if date_range:
-        return date_range
-
-    # 移除"月"和"年"字符，简化后续处理
-    value = value.replace('月', '').replace('年', '')
-
-    # 定义日期格式的正则表达式模式列表
-    # 每个模式包含(正则表达式, 提取组数量)
-    date_patterns = [
-        # 完整日期: 2024-03 或 2024/03 或 2024.03
-        (r'(\d{4})[-/.]?(\d{1,2})', 2),
-        # 简写日期: 2403
-        (r'(\d{2})(\d{2})', 2),
-        # 单独月份: 3 或 03
-        (r'(\d{1,2})', 1),
-    ]
-
-    # 按顺序尝试匹配日期格式
-    for pattern, group_count in date_patterns:
-        match = re.match(pattern, value)
-        if match:
-            try:
-                groups = match.groups()
-
-                # 根据提取组数量处理年月
-                if group_count == 2:
-                    # 完整日期或简写日期格式
-                    year, month = groups
-                    # 如果年份是两位数，补全为四位数（24 -> 2024）
-                    if len(year) == 2:
-                        year = '20' + year
-                else:
-                    # 只有月份的格式，使用当前年份
-                    year = str(datetime.now().year)
-                    month = groups[0]
-
-                # 验证月份有效性并格式化
-                month = int(month)
-                if 1 <= month <= 12:
-                    # 将月份补零为两位数
-                    month = str(month).zfill(2)
-                    result = f"{year}{month}"
-                    logging.debug(f"日期标准化结果: {result}")
-                    return result
-            except (ValueError, IndexError):
-                # 如果解析失败，继续尝试下一个模式
-                pass
-
-    # 所有模式都匹配失败，返回原始值
-    logging.debug(f"日期标准化结果: {value} (未改变)")
-    return value
+    # 全角数字和符号折叠为半角（如"２０２４年３月"、"3月－5月"）
+    return parse_date(_fold_fullwidth(value))
 
 
 def _parse_date_range(value: str) -> Optional[str]:
@@ -212,73 +312,80 @@ def _parse_date_range(value: str) -> Optional[str]:
         - 中文格式2: 2024年3-5月
         - 数字格式: 202403-05
 
-    处理逻辑:
-        1. 尝试匹配中文日期范围格式
-        2. 如果匹配成功，提取年份、起始月份、结束月份
-        3. 生成月份列表（包含起始月到结束月的所有月份）
-        4. 尝试匹配数字日期范围格式（备用格式）
-        5. 验证月份的有效性（1-12）
-
     示例:
         >>> _parse_date_range("2024年3月到5月")
         '202403,202404,202405'
 
-        >>> _parse_date_range("2024年3-5月")
-        '202403,202404,202405'
-
         >>> _parse_date_range("202403-05")
         '202403,202404,202405'
 
         >>> _parse_date_range("3月")
         None  # 不是日期范围
     """
-    # 定义中文日期范围的正则表达式模式
-    cn_range_patterns = [
-        # 模式1: 2024年3月到5月（完整格式）
-        r'(\d{2,4})年(\d{1,2})月[到至和-](\d{1,2})月',
-        # 模式2: 2024年3-5月（简化格式）
-        r'(\d{2,4})年(\d{1,2})[到至和-](\d{1,2})月',
-    ]
-
-    # 尝试匹配中文日期范围格式
-    for pattern in cn_range_patterns:
-        match = re.search(pattern, value)
-        if match:
-            # 提取年份和月份
-            year = match.group(1)
-            # 如果年份是两位数，补全为四位数
-            if len(year) == 2:
-                year = '20' + year
-
-            # 提取起始月份和结束月份
-            start_month = int(match.group(2))
-            end_month = int(match.group(3))
-
-            # 验证月份有效性
-            if 1 <= start_month <= 12 and 1 <= end_month <= 12:
-                # 生成月份列表，每个月份格式为YYYYMM
-                months = [f"{year}{str(m).zfill(2)}"
-                         for m in range(start_month, end_month + 1)]
-                return ",".join(months)
-
-    # 尝试匹配数字日期范围格式（如202403-05）
-    num_range_pattern = r'(\d{4})(\d{1,2})-(\d{1,2})'
-    match = re.search(num_range_pattern, value)
-    if match:
-        # 提取年份和月份
-        year = match.group(1)
-        start_month = int(match.group(2))
-        end_month = int(match.group(3))
-
-        # 验证月份有效性
-        if 1 <= start_month <= 12 and 1 <= end_month <= 12:
-            # 生成月份列表
-            months = [f"{year}{str(m).zfill(2)}"
-                     for m in range(start_month, end_month + 1)]
-            return ",".join(months)
-
-    # 所有模式都匹配失败
-    return None
+    return parse_date_range(value)
+
+
+# 全角ASCII区段及其与半角字符的码位差
+_FULLWIDTH_FIRST = 0xFF01
+_FULLWIDTH_LAST = 0xFF5E
+_FULLWIDTH_OFFSET = 0xFEE0
+_IDEOGRAPHIC_SPACE = 0x3000
+
+
+def _build_fullwidth_table() -> Dict[int, Optional[str]]:
+    """
+    构建全角字符折叠转换表
+
+    转换表在模块导入时构建一次，之后每个值只需一次str.translate调用，
+    取代逐个字符的链式replace。
+
+    折叠规则:
+        1. 全角ASCII区段 U+FF01-U+FF5E（全角标点、数字、字母）转换为对应的半角字符
+        2. 全角空格（表意空格 U+3000）删除
+        3. 中文弯引号统一为半角引号：“ ” „ ‟ 〝 〞 -> "，‘ ’ ‚ ‛ -> '
+
+    返回:
+        Dict[int, Optional[str]]: 可直接用于str.translate的转换表
+    """
+    table: Dict[int, Optional[str]] = {
+        code: chr(code - _FULLWIDTH_OFFSET)
+        for code in range(_FULLWIDTH_FIRST, _FULLWIDTH_LAST + 1)
+    }
+    table[_IDEOGRAPHIC_SPACE] = None
+    for quote in '“”„‟〝〞':
+        table[ord(quote)] = '"'
+    for quote in '‘’‚‛':
+        table[ord(quote)] = "'"
+    return table
+
+
+# 全角折叠转换表，以及用于快速判断是否需要转换的字符集正则
+_FULLWIDTH_TABLE = _build_fullwidth_table()
+_FULLWIDTH_PATTERN = re.compile(
+    '[' + ''.join(re.escape(chr(code)) for code in sorted(_FULLWIDTH_TABLE)) + ']'
+)
+
+
+def _fold_fullwidth(value: str) -> str:
+    """
+    将全角字符折叠为半角
+
+    纯ASCII的值和不含可折叠字符的值直接返回原字符串，不产生复制；
+    其余的值通过一次str.translate完成全部折叠。
+
+    参数:
+        value (str): 原始字符串
+
+    返回:
+        str: 折叠后的字符串
+
+    示例:
+        >>> _fold_fullwidth("ＡＢＣ（中国）")
+        'ABC(中国)'
+    """
+    if value.isascii() or _FULLWIDTH_PATTERN.search(value) is None:
+        return value
+    return value.translate(_FULLWIDTH_TABLE)
 
 
 def _standardize_customer_name(value: str) -> str:
@@ -294,12 +401,10 @@ def _standardize_customer_name(value: str) -> str:
     返回:
         str: 标准化后的客户名称
 
-    标准化规则:
-        1. 全角括号转换为半角括号：（ -> (, ） -> )
-        2. 全角冒号转换为半角冒号：： -> :
-        3. 全角逗号转换为半角逗号：， -> ,
-        4. 全角引号转换为半角引号：" -> ", " -> "
-        5. 移除全角空格：
+    标准化规则（见_fold_fullwidth，一次str.translate完成）:
+        1. 全角标点、数字、字母转换为半角：（ -> (, ： -> :, ， -> ,, Ａ -> A, １ -> 1
+        2. 中文弯引号转换为半角引号：“ -> ", ” -> ", ‘ -> ', ’ -> '
+        3. 移除全角空格：　
 
     示例:
         >>> _standardize_customer_name("客户A（中国）")
@@ -310,16 +415,11 @@ def _standardize_customer_name(value: str) -> str:
 
         >>> _standardize_customer_name("客户C　测试")
         '客户C测试'
+
+        >>> _standardize_customer_name("ＡＢＣ公司")
+        'ABC公司'
     """
-    # 全角括号转半角
-    value = value.replace('（', '(').replace('）', ')')
-    # 全角冒号转半角
-    value = value.replace('：', ':').replace('，', ',')
-    # 全角引号转半角
-    value = value.replace('"', '"').replace('"', '"')
-    # 移除全角空格
-    value = value.replace('　', '')
-    return value
+    return _fold_fullwidth(value)
 
 
 def _standardize_product_name(value: str) -> str:
@@ -336,11 +436,8 @@ def _standardize_product_name(value: str) -> str:
         str: 标准化后的产品名称（大写格式）
 
     标准化规则:
-        1. 全角括号转换为半角括号：（ -> (, ） -> )
-        2. 全角逗号转换为半角逗号：， -> ,
-        3. 全角冒号转换为半角冒号：： -> :
-        4. 移除全角空格：
-        5. 转换为大写：统一使用大写字母，便于比较
+        1. 与客户名称相同的全角折叠（全角标点、数字、字母、引号、全角空格）
+        2. 转换为大写：统一使用大写字母，便于比较
 
     示例:
         >>> _standardize_product_name("Product A")
@@ -350,17 +447,13 @@ def _standardize_product_name(value: str) -> str:
         '产品(测试)'
 
         >>> _standardize_product_name("item：测试，demo")
-        'ITEM:TEST,DEMO'
+        'ITEM:测试,DEMO'
+
+        >>> _standardize_product_name("Ｗｉｄｇｅｔ")
+        'WIDGET'
 
     注意:
         产品名称转换为大写后，可以避免因大小写不同导致的匹配失败。
         这在处理用户提供的产品名称时特别有用。
     """
-    # 全角括号转半角
-    value = value.replace('（', '(').replace('）', ')')
-    # 全角逗号转半角
-    value = value.replace('，', ',').replace('：', ':')
-    # 移除全角空格
-    value = value.replace('　', '')
-    # 转换为大写
-    return value.upper()
+    return _fold_fullwidth(value).upper()
@@ -0,0 +1,418 @@
+"""
+日期解析模块
+
+本模块将日期单元格的文本解析为统一的YYYYMM格式，或逗号分隔的月份列表（日期范围）。
+中文数字先整体转换为阿拉伯数字；只有含范围分隔符的文本才会用一个正则切分为
+"数字串"和"单个字符"两类记号，在记号列表上识别日期范围；单个日期只需检查开头的连续数字。
+
+主要功能:
+- 中文数字转换，正确处理复合数字（十一 -> 11，十二 -> 12，二十三 -> 23）
+- 日期范围识别与展开 (parse_date_range)
+- 单个日期识别 (parse_date)
+- 标准化月份与月份序号、月份位图之间的换算 (month_ordinal, month_mask)
+
+支持的格式:
+- 日期范围: 2024年3月-5月、2024年3月到5月、2024年3-5月、202403-05
+- 完整日期: 2024-03、2024/03、2024.03、202403、2024年3月
+- 简写日期: 2403、24年03月
+- 单独月份: 3月、三月、十一月、正月（使用当前年份）
+
+说明:
+    输入应已移除空白字符并折叠全角字符（由data_standardizer负责）。
+    识别顺序和边界情况与原先的正则表达式级联完全一致，
+    例如结束月份小于起始月份的范围不展开，而是按单个日期处理。
+
+作者: 供应商数据智能匹配系统开发团队
+版本: 1.0
+"""
+
+import re
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import FrozenSet, List, NamedTuple, Optional, Tuple
+
+# 中文数字到阿拉伯数字的映射，"正"指正月（一月）
+_CN_DIGITS = {
+    '〇': '0', '零': '0', '一': '1', '二': '2', '三': '3', '四': '4',
+    '五': '5', '六': '6', '七': '7', '八': '8', '九': '9', '正': '1'
+}
+_CN_DIGIT_TABLE = str.maketrans(_CN_DIGITS)
+_CN_NUMERAL_PATTERN = re.compile('[〇零一二三四五六七八九十正]')
+
+# 含"十"的复合中文数字：十、十一、二十、二十三等
+_CN_TENS_PATTERN = re.compile('([一二三四五六七八九]?)十([一二三四五六七八九]?)')
+
+# 记号：连续的数字组成一个记号，其余每个字符各为一个记号
+_DATE_TOKEN_PATTERN = re.compile(r'\d+|.', re.DOTALL)
+
+# 开头的连续数字
+_LEADING_DIGITS_PATTERN = re.compile(r'\d*')
+
+# 中文日期范围的起止分隔符，数字范围只使用其中的"-"
+_RANGE_SEPARATORS = frozenset('到至和-')
+
+# 完整日期中年份与月份之间的分隔符
+_DATE_SEPARATORS = ('-', '/', '.')
+
+# 月份序号的起始年份和覆盖年数：序号0为1990年1月，共覆盖200年（2400个月）
+# 超出范围的月份仍可正常匹配，只是不进入位图而是逐个精确比较
+MONTH_ORDINAL_BASE_YEAR = 1990
+MONTH_ORDINAL_YEARS = 200
+
+# 月份序号和月份位图的缓存容量，不同的日期写法数量有限
+_MONTH_CACHE_SIZE = 4096
+
+# 当前年份缓存：(年份, 失效时刻)，失效时刻为下一年1月1日0点的时间戳
+_current_year_cache: Tuple[str, float] = ('', 0.0)
+
+
+class MonthMask(NamedTuple):
+    """
+    一组标准化月份的位图表示
+
+    属性:
+        bits (int): 月份位图，第n位为1表示包含月份序号为n的月份
+        others (FrozenSet[str]): 无法换算为月份序号的日期（非YYYYMM格式或超出范围），
+                                 需要逐个精确比较
+    """
+    bits: int
+    others: FrozenSet[str]
+
+
+def parse_date(value: str) -> str:
+    """
+    解析日期文本
+
+    依次尝试日期范围和单个日期，返回标准化后的日期。
+
+    参数:
+        value (str): 已移除空白并折叠全角字符的日期文本
+
+    返回:
+        str: 日期范围返回逗号分隔的YYYYMM列表，单个日期返回YYYYMM；
+             无法解析时返回移除"年"、"月"并转换中文数字后的文本
+
+    示例:
+        >>> parse_date("2024年3月")
+        '202403'
+
+        >>> parse_date("十一月")
+        '202411'  # 假设当前年份为2024
+
+        >>> parse_date("2024年3月-5月")
+        '202403,202404,202405'
+    """
+    # 纯数字（如202403、2403）是最常见的写法，不可能是范围，直接按单个日期处理
+    if value.isdecimal():
+        return _single_date(value, value)
+
+    value = _convert_cn_numerals(value)
+
+    # 所有范围格式都至少包含一个范围分隔符，没有时无需切分记号
+    if not _RANGE_SEPARATORS.isdisjoint(value):
+        date_range = _range_from_tokens(_DATE_TOKEN_PATTERN.findall(value))
+        if date_range:
+            return date_range
+
+    # 移除"年"和"月"，其两侧的数字视为连续（如"2024年3月" -> "20243"）
+    if '年' in value or '月' in value:
+        value = value.replace('年', '').replace('月', '')
+
+    return _single_date(value, _LEADING_DIGITS_PATTERN.match(value).group())
+
+
+def parse_date_range(value: str) -> Optional[str]:
+    """
+    解析日期范围
+
+    参数:
+        value (str): 已移除空白并折叠全角字符的日期文本
+
+    返回:
+        Optional[str]: 识别为日期范围时返回逗号分隔的月份列表（如"202403,202404,202405"），
+                      结束月份小于起始月份时返回空字符串，不是日期范围时返回None
+
+    示例:
+        >>> parse_date_range("2024年3-5月")
+        '202403,202404,202405'
+
+        >>> parse_date_range("3月")
+        None  # 不是日期范围
+    """
+    return _range_from_tokens(_DATE_TOKEN_PATTERN.findall(_convert_cn_numerals(value)))
+
+
+def _convert_cn_numerals(value: str) -> str:
+    """
+    将中文数字转换为阿拉伯数字
+
+    含"十"的复合数字整体转换（十一 -> 11），其余数字逐字转换（二〇二四 -> 2024）。
+
+    参数:
+        value (str): 日期文本
+
+    返回:
+        str: 转换后的文本，不含中文数字时返回原字符串
+
+    示例:
+        >>> _convert_cn_numerals("2024年十一月")
+        '2024年11月'
+    """
+    if value.isascii() or _CN_NUMERAL_PATTERN.search(value) is None:
+        return value
+    if '十' in value:
+        value = _CN_TENS_PATTERN.sub(_replace_cn_tens, value)
+    return value.translate(_CN_DIGIT_TABLE)
+
+
+def _replace_cn_tens(match: 're.Match[str]') -> str:
+    """
+    将含"十"的复合中文数字转换为两位阿拉伯数字
+
+    参数:
+        match: _CN_TENS_PATTERN的匹配结果，分组为十位和个位（可为空）
+
+    返回:
+        str: 两位数字，如"十" -> "10"，"十一" -> "11"，"二十三" -> "23"
+    """
+    tens, ones = match.groups()
+    return (_CN_DIGITS[tens] if tens else '1') + (_CN_DIGITS[ones] if ones else '0')
+
+
+def _range_from_tokens(tokens: List[str]) -> Optional[str]:
+    """
+    在记号列表中识别日期范围
+
+    按以下顺序尝试，前一种格式的月份无效时才尝试下一种:
+        1. 2024年3月到5月（起止月份后都有"月"）
+        2. 2024年3-5月（只有结束月份后有"月"）
+        3. 202403-05（纯数字）
+
+    参数:
+        tokens (List[str]): 记号列表
+
+    返回:
+        Optional[str]: 同parse_date_range
+    """
+    if '年' in tokens:
+        for start_marked in (True, False):
+            months = _match_cn_range(tokens, start_marked)
+            if months is not None:
+                return months
+
+    if '-' in tokens:
+        return _match_numeric_range(tokens)
+
+    return None
+
+
+def _match_cn_range(tokens: List[str], start_marked: bool) -> Optional[str]:
+    """
+    识别中文日期范围
+
+    找到第一个符合"年份 年 起始月 [月] 分隔符 结束月 月"结构的位置，
+    年份取"年"之前数字串的最后2-4位，起止月份为1-2位数字。
+
+    参数:
+        tokens (List[str]): 记号列表
+        start_marked (bool): 起始月份后是否带"月"
+
+    返回:
+        Optional[str]: 找到且月份有效时返回月份列表，否则返回None
+    """
+    offset = 1 if start_marked else 0
+    last = len(tokens) - 5 - offset
+    position = 0
+
+    while True:
+        try:
+            position = tokens.index('年', position + 1)
+        except ValueError:
+            return None
+        if position > last:
+            return None
+
+        year = tokens[position - 1]
+        start = tokens[position + 1]
+        end = tokens[position + 3 + offset]
+        if (
+            len(year) >= 2 and year.isdecimal()
+            and len(start) <= 2 and start.isdecimal()
+            and (not start_marked or tokens[position + 2] == '月')
+            and tokens[position + 2 + offset] in _RANGE_SEPARATORS
+            and len(end) <= 2 and end.isdecimal()
+            and tokens[position + 4 + offset] == '月'
+        ):
+            year = year[-4:]
+            # 两位年份补全为四位（24 -> 2024）
+            if len(year) == 2:
+                year = '20' + year
+            return _expand_months(year, start, end)
+
+
+def _match_numeric_range(tokens: List[str]) -> Optional[str]:
+    """
+    识别纯数字日期范围（如202403-05）
+
+    找到第一个"至少5位数字串 - 数字串"的位置。数字串最后6位（不足6位时为全部5位）
+    中，前4位为年份，其余为起始月份；"-"之后的前1-2位为结束月份。
+
+    参数:
+        tokens (List[str]): 记号列表
+
+    返回:
+        Optional[str]: 找到且月份有效时返回月份列表，否则返回None
+    """
+    last = len(tokens) - 2
+    position = 0
+
+    while True:
+        try:
+            position = tokens.index('-', position + 1)
+        except ValueError:
+            return None
+        if position > last:
+            return None
+
+        digits = tokens[position - 1]
+        end = tokens[position + 1]
+        if len(digits) >= 5 and digits.isdecimal() and end.isdecimal():
+            digits = digits[-6:]
+            return _expand_months(digits[:4], digits[4:], end[:2])
+
+
+def _expand_months(year: str, start: str, end: str) -> Optional[str]:
+    """
+    展开起止月份之间的所有月份
+
+    参数:
+        year (str): 年份
+        start (str): 起始月份
+        end (str): 结束月份
+
+    返回:
+        Optional[str]: 月份有效时返回逗号分隔的YYYYMM列表
+                      （结束月份小于起始月份时为空字符串），月份无效时返回None
+    """
+    start_month = int(start)
+    end_month = int(end)
+    if 1 <= start_month <= 12 and 1 <= end_month <= 12:
+        return ",".join(f"{year}{month:02d}" for month in range(start_month, end_month + 1))
+    return None
+
+
+def _single_date(value: str, digits: str) -> str:
+    """
+    识别单个日期
+
+    开头的连续数字按以下顺序尝试，月份无效时尝试下一种:
+        1. 前4位为年份，其后1-2位为月份，中间可以有一个"-"、"/"或"."
+        2. 前2位为年份（补全为20xx），第3-4位为月份
+        3. 前1-2位为月份，年份取当前年份
+
+    参数:
+        value (str): 已移除"年"、"月"的日期文本
+        digits (str): value开头的连续数字
+
+    返回:
+        str: YYYYMM格式的日期，无法识别时返回value
+    """
+    length = len(digits)
+
+    if length >= 4:
+        month = digits[4:6]
+        if not month and value[4:5] in _DATE_SEPARATORS:
+            month = _LEADING_DIGITS_PATTERN.match(value, 5).group()[:2]
+        if month and 1 <= int(month) <= 12:
+            return f"{digits[:4]}{int(month):02d}"
+
+        month = int(digits[2:4])
+        if 1 <= month <= 12:
+            return f"20{digits[:2]}{month:02d}"
+
+    if length:
+        month = int(digits[:2])
+        if 1 <= month <= 12:
+            return f"{_current_year()}{month:02d}"
+
+    return value
+
+
+def _current_year() -> str:
+    """
+    获取当前年份
+
+    年份在跨年之前保持不变，因此只在缓存失效（到达下一年1月1日）时
+    才调用datetime.now()，避免每个值都获取一次当前时间。
+
+    返回:
+        str: 当前年份，如"2024"
+    """
+    global _current_year_cache
+    year, expires_at = _current_year_cache
+    if time.time() >= expires_at:
+        current = datetime.now().year
+        year = str(current)
+        _current_year_cache = (year, datetime(current + 1, 1, 1).timestamp())
+    return year
+
+
+@lru_cache(maxsize=_MONTH_CACHE_SIZE)
+def month_ordinal(date: str) -> Optional[int]:
+    """
+    计算标准化月份的序号
+
+    序号从MONTH_ORDINAL_BASE_YEAR年1月开始连续编号，相邻月份的序号相差1，
+    可以直接作为位图中的位置。
+
+    参数:
+        date (str): 标准化后的单个日期，如"202403"
+
+    返回:
+        Optional[int]: 月份序号；不是YYYYMM格式或超出覆盖范围时返回None
+
+    示例:
+        >>> month_ordinal("199001")
+        0
+
+        >>> month_ordinal("202403")
+        410
+
+        >>> month_ordinal("2024-3") is None
+        True
+    """
+    if len(date) != 6 or not date.isascii() or not date.isdigit():
+        return None
+
+    year = int(date[:4]) - MONTH_ORDINAL_BASE_YEAR
+    month = int(date[4:])
+    if 0 <= year < MONTH_ORDINAL_YEARS and 1 <= month <= 12:
+        return year * 12 + month - 1
+    return None
+
+
+@lru_cache(maxsize=_MONTH_CACHE_SIZE)
+def month_mask(dates: str) -> MonthMask:
+    """
+    将逗号分隔的标准化月份转换为月份位图
+
+    参数:
+        dates (str): 标准化后的日期，单个日期或逗号分隔的日期范围
+
+    返回:
+        MonthMask: 能换算为序号的月份合并为位图，其余日期保存在others中
+
+    示例:
+        >>> month_mask("202403,202404").bits == (1 << 410) | (1 << 411)
+        True
+    """
+    bits = 0
+    others = []
+    for date in dates.split(','):
+        ordinal = month_ordinal(date)
+        if ordinal is None:
+            others.append(date)
+        else:
+            bits |= 1 << ordinal
+    return MonthMask(bits, frozenset(others))
@@ -0,0 +1,161 @@
+"""
+重复数据检测模块
+
+本模块提供按(客户, 产品)索引的重复数据检测器，取代逐项扫描日期范围映射的做法。
+客户和产品通过KeyCodec编码为整数编号，每个(客户, 产品)用月份位图记录已出现的月份，
+单个月份和日期范围的检测都只与所涉及的月份数有关，与已处理的行数无关。
+
+主要功能:
+- 判断一个搜索键是否与之前处理过的数据重复 (DuplicateTracker.is_duplicate)
+- 记录已处理的搜索键 (DuplicateTracker.add)
+
+重复规则（与原有逻辑一致）:
+    1. 与之前某行的搜索键完全相同
+    2. 单个月份落在同一(客户, 产品)最近一次出现的日期范围内
+       （后出现的日期范围覆盖之前的日期范围）
+    3. 日期范围展开后的某个月份，之前作为单个月份出现过
+
+作者: 供应商数据智能匹配系统开发团队
+版本: 1.0
+"""
+
+from typing import Dict, Set, Tuple
+
+from .date_parser import MonthMask, month_mask, month_ordinal
+from .key_codec import KeyCodec
+
+# 标准化后的搜索键：(日期, 客户名称, 产品名称)
+SearchKey = Tuple[str, str, str]
+
+# (客户名称, 产品名称)
+PairKey = Tuple[str, str]
+
+_EMPTY_MASK = MonthMask(0, frozenset())
+
+
+class DuplicateTracker:
+    """
+    重复数据检测器
+
+    按处理顺序记录搜索键，判断后续数据是否重复。重复检测依赖行的先后顺序，
+    每次匹配都应使用新的检测器。
+
+    能换算为月份序号的日期（YYYYMM格式）记录在位图中；其他日期（无法解析的原始值等）
+    按原样保存在集合中精确比较，检测结果与逐项比较完全相同。
+
+    示例:
+        >>> tracker = DuplicateTracker()
+        >>> tracker.add(("202403,202404", "客户A", "产品B"))
+        >>> tracker.is_duplicate(("202404", "客户A", "产品B"))
+        True
+    """
+
+    def __init__(self):
+        """
+        初始化重复数据检测器
+        """
+        # 客户和产品的字典编码，以下结构都以(客户, 产品)编号为键
+        self._codec = KeyCodec()
+
+        # 每个(客户, 产品)作为单个月份出现过的月份位图
+        self._single_months: Dict[int, int] = {}
+
+        # 每个(客户, 产品)最近一次出现的日期范围
+        self._last_ranges: Dict[int, MonthMask] = {}
+
+        # 出现过的日期范围，以及无法换算为月份序号的单个日期：((客户, 产品)编号, 日期)
+        self._seen_ranges: Set[Tuple[int, str]] = set()
+        self._seen_others: Set[Tuple[int, str]] = set()
+
+    def is_duplicate(self, search_key: SearchKey) -> bool:
+        """
+        检查是否为重复数据
+
+        参数:
+            search_key: 标准化后的搜索键(日期, 客户, 产品)
+
+        返回:
+            bool: 如果是重复数据返回True，否则返回False
+        """
+        date, customer, product = search_key
+        pair = self._codec.find_pair(customer, product)
+        if pair is None:
+            return False
+        return self._check(pair, date)
+
+    def add(self, search_key: SearchKey):
+        """
+        记录已处理的搜索键
+
+        参数:
+            search_key: 标准化后的搜索键(日期, 客户, 产品)
+        """
+        date, customer, product = search_key
+        self._record(self._codec.pair_code(customer, product), date)
+
+    def check_and_add(self, search_key: SearchKey) -> bool:
+        """
+        检查是否为重复数据，并记录该搜索键
+
+        等价于先调用is_duplicate再调用add，但客户和产品只编码一次。
+
+        参数:
+            search_key: 标准化后的搜索键(日期, 客户, 产品)
+
+        返回:
+            bool: 如果是重复数据返回True，否则返回False
+        """
+        date, customer, product = search_key
+        pair = self._codec.pair_code(customer, product)
+        is_duplicate = self._check(pair, date)
+        self._record(pair, date)
+        return is_duplicate
+
+    def _check(self, pair: int, date: str) -> bool:
+        """
+        检查(客户, 产品)编号和日期是否与之前处理过的数据重复
+
+        参数:
+            pair: (客户, 产品)编号
+            date: 标准化后的日期或逗号分隔的日期范围
+
+        返回:
+            bool: 如果是重复数据返回True，否则返回False
+        """
+        # 日期范围：完全相同，或展开的某个月份之前作为单个月份出现过
+        if ',' in date:
+            if (pair, date) in self._seen_ranges:
+                return True
+
+            months = month_mask(date)
+            if months.bits & self._single_months.get(pair, 0):
+                return True
+            return any((pair, other) in self._seen_others for other in months.others)
+
+        # 单个月份：之前出现过，或在最近一次的日期范围内
+        ordinal = month_ordinal(date)
+        last_range = self._last_ranges.get(pair, _EMPTY_MASK)
+        if ordinal is None:
+            return (pair, date) in self._seen_others or date in last_range.others
+
+        bit = 1 << ordinal
+        return bool((self._single_months.get(pair, 0) | last_range.bits) & bit)
+
+    def _record(self, pair: int, date: str):
+        """
+        记录(客户, 产品)编号和日期
+
+        参数:
+            pair: (客户, 产品)编号
+            date: 标准化后的日期或逗号分隔的日期范围
+        """
+        if ',' in date:
+            self._seen_ranges.add((pair, date))
+            self._last_ranges[pair] = month_mask(date)
+            return
+
+        ordinal = month_ordinal(date)
+        if ordinal is None:
+            self._seen_others.add((pair, date))
+        else:
+            self._single_months[pair] = self._single_months.get(pair, 0) | (1 << ordinal)
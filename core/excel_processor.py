@@ -5,23 +5,151 @@ Excel处理模块
 这些函数是数据处理流程的基础组件。
 
 主要功能:
+- 以只读/流式方式打开工作簿
+- 流式逐行读取工作表，每行只读取一次并同时提供原始值和标准化搜索键
+- 流式逐行读取工作表的原始值，按需再标准化（可以在不同线程中分开进行）
 - 从工作表获取并标准化数据
 - 清空工作表数据
 - 复制标题行到目标工作表
 - 初始化结果工作表
+- 按工作簿缓存样式编号，批量设置单元格样式
+- 查找或添加状态列，按状态列设置条件格式规则
 
 依赖:
 - openpyxl: 用于读写Excel文件
 - data_standardizer: 用于数据标准化
+- parallel_standardizer: 用于可选的并行标准化
 
 作者: 供应商数据智能匹配系统开发团队
 版本: 1.0
 """
 
-from typing import Tuple
+import re
+from typing import Any, Collection, Dict, Iterable, Iterator, Mapping, NamedTuple, Optional, Tuple
 import openpyxl
 import logging
+from openpyxl.formatting.formatting import ConditionalFormattingList
+from openpyxl.formatting.rule import FormulaRule
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.utils import get_column_letter, range_boundaries
+from .data_models import CellStyle
 from .data_standardizer import standardize_data
+from .parallel_standardizer import ParallelStandardizer, iter_keyed_rows
+
+
+class SheetRow(NamedTuple):
+    """
+    流式读取的一行数据
+
+    属性:
+        row (int): 行号（从1开始）
+        values (Tuple[str, str, str]): 前三列的原始值（转换为字符串），用于写入结果表
+        key (Tuple[str, str, str]): 标准化后的(日期, 客户名称, 产品名称)搜索键
+    """
+    row: int
+    values: Tuple[str, str, str]
+    key: Tuple[str, str, str]
+
+
+def open_workbook(file_path: str, read_only: bool = False):
+    """
+    打开Excel工作簿
+
+    read_only=True时使用openpyxl的只读模式：按需流式解析工作表XML，
+    不为每个单元格创建对象，加载时间和内存占用都远小于完整模式，
+    但工作簿不能修改和保存，使用完毕后应调用close()释放文件句柄。
+
+    参数:
+        file_path (str): Excel文件路径
+        read_only (bool): 是否以只读模式打开
+
+    返回:
+        openpyxl的工作簿对象
+    """
+    return openpyxl.load_workbook(file_path, read_only=read_only)
+
+
+def iter_sheet_rows(
+    sheet, min_row: int = 2, standardizer: Optional[ParallelStandardizer] = None
+) -> Iterator[SheetRow]:
+    """
+    流式逐行读取待匹配表
+
+    使用iter_rows(values_only=True)顺序读取前三列，每行只读取一次，
+    同时产出原始值和标准化后的搜索键。只读模式和完整模式的工作表都适用。
+
+    参数:
+        sheet: openpyxl的工作表对象
+        min_row (int): 起始行号，默认跳过标题行
+        standardizer: 可选的并行标准化器，为None时在当前进程中标准化
+
+    返回:
+        生成器，每次产出一个SheetRow
+
+    示例:
+        >>> for sheet_row in iter_sheet_rows(worksheet):
+        ...     print(sheet_row.row, sheet_row.key)
+        2 ('202403', '客户A', '产品B')
+    """
+    values = (values for _, values in iter_sheet_values(sheet, min_row))
+    return standardize_sheet_values(values, min_row, standardizer)
+
+
+def standardize_sheet_values(
+    values: Iterable[Tuple[str, str, str]],
+    min_row: int = 2,
+    standardizer: Optional[ParallelStandardizer] = None
+) -> Iterator[SheetRow]:
+    """
+    为连续读取的待匹配表原始值计算搜索键
+
+    与iter_sheet_rows相同，但读取和标准化可以分开进行（如在不同线程中）。
+
+    参数:
+        values: 从min_row开始逐行读取的前三列原始值（转换为字符串）
+        min_row (int): 第一行的行号
+        standardizer: 可选的并行标准化器，为None时在当前进程中标准化
+
+    返回:
+        生成器，每次产出一个SheetRow
+    """
+    for row, (row_values, key) in enumerate(iter_keyed_rows(values, standardizer), start=min_row):
+        yield SheetRow(row, row_values, key)
+
+
+def iter_sheet_values(sheet, min_row: int = 2) -> Iterator[Tuple[int, Tuple[str, str, str]]]:
+    """
+    流式逐行读取待匹配表的原始值，不进行标准化
+
+    参数:
+        sheet: openpyxl的工作表对象
+        min_row (int): 起始行号，默认跳过标题行
+
+    返回:
+        生成器，每次产出(行号, 前三列的原始值（转换为字符串）)
+    """
+    for row, cells in enumerate(
+        sheet.iter_rows(min_row=min_row, max_col=3, values_only=True),
+        start=min_row
+    ):
+        yield row, (str(cells[0]), str(cells[1]), str(cells[2]))
+
+
+def iter_reference_rows(sheet, min_row: int = 2) -> Iterator[Tuple[Any, ...]]:
+    """
+    流式逐行读取匹配原表
+
+    读取前四列（日期、客户名称、产品名称、供应商）的原始值。
+    不足四列的行会以None补齐。
+
+    参数:
+        sheet: openpyxl的工作表对象
+        min_row (int): 起始行号，默认跳过标题行
+
+    返回:
+        生成器，每次产出4个原始值组成的元组
+    """
+    return sheet.iter_rows(min_row=min_row, max_col=4, values_only=True)
 
 
 def get_sheet_data(sheet, row: int) -> Tuple[str, str, str]:
@@ -217,3 +345,155 @@ def init_result_sheet(workbook, sheet_name: str):
 
     # 返回工作表对象供后续使用
     return sheet
+
+
+class CellStyler:
+    """
+    单元格样式设置器
+
+    通过cell.fill / cell.font赋值时，openpyxl每次都要在工作簿的样式表中
+    查找该样式对象（计算对象哈希并比较），数十万个单元格时这一步是着色阶段的主要耗时。
+    本类对每种CellStyle只在工作簿样式表中登记一次，记下填充和字体的编号，
+    之后直接把编号写入单元格的样式数组，单元格原有的数字格式、边框、对齐方式保持不变。
+
+    说明:
+        单元格的样式数组（cell._style）和工作簿的样式表（_fills / _fonts）是openpyxl的内部属性，
+        写入方式与openpyxl自身的StyleDescriptor相同。
+
+    示例:
+        >>> styler = CellStyler(workbook)
+        >>> styler.apply(sheet.cell(row=2, column=1), CellStyles.GREEN)
+    """
+
+    def __init__(self, workbook):
+        """
+        初始化样式设置器
+
+        参数:
+            workbook: 单元格所在的openpyxl工作簿对象
+        """
+        self._workbook = workbook
+        self._style_ids: Dict[Tuple[str, str], Tuple[int, int]] = {}
+
+    def apply(self, cell, style: CellStyle) -> None:
+        """
+        设置单元格的填充和字体颜色
+
+        效果与cell.fill = style.fill; cell.font = style.font相同。
+
+        参数:
+            cell: 工作簿中的单元格对象
+            style: 单元格样式
+        """
+        style_key = (style.fill_color, style.font_color)
+        style_ids = self._style_ids.get(style_key)
+        if style_ids is None:
+            style_ids = self._style_ids[style_key] = (
+                self._workbook._fills.add(style.fill),
+                self._workbook._fonts.add(style.font),
+            )
+
+        style_array = cell._style
+        if not style_array:
+            style_array = cell._style = StyleArray()
+        style_array.fillId, style_array.fontId = style_ids
+
+
+def find_column(sheet, title: str) -> Optional[int]:
+    """
+    按标题查找列
+
+    参数:
+        sheet: 工作表对象
+        title: 第1行中的列标题
+
+    返回:
+        Optional[int]: 列号（从1开始），标题行中没有该标题时返回None
+    """
+    for cell in sheet[1]:
+        if cell.value == title:
+            return cell.column
+    return None
+
+
+def find_or_add_column(sheet, title: str) -> int:
+    """
+    按标题查找列，不存在时在已使用的最后一列之后添加
+
+    参数:
+        sheet: 工作表对象
+        title: 第1行中的列标题
+
+    返回:
+        int: 列号（从1开始）
+    """
+    column = find_column(sheet, title)
+    if column is None:
+        column = sheet.max_column + 1
+        sheet.cell(row=1, column=column, value=title)
+    return column
+
+
+def set_status_formatting(
+    sheet, cell_range: str, status_column: int, status_styles: Mapping[str, CellStyle]
+) -> None:
+    """
+    按状态列设置条件格式
+
+    为每个状态码添加一条公式规则：区域中某一行的状态列等于该状态码时，
+    该行显示对应的填充和字体颜色。之前为同一状态列添加的规则会先被删除，
+    重复分析不会累积规则。
+
+    参数:
+        sheet: 工作表对象
+        cell_range: 显示颜色的单元格区域，如"A2:C100"
+        status_column: 状态列的列号
+        status_styles: 状态码到单元格样式的映射
+
+    示例:
+        >>> set_status_formatting(sheet, "A2:C100", 4, MatchStatus.STYLES)
+    """
+    remove_status_formatting(sheet, status_column, status_styles)
+
+    _, first_row, _, _ = range_boundaries(cell_range)
+    column_letter = get_column_letter(status_column)
+    for status, style in status_styles.items():
+        sheet.conditional_formatting.add(cell_range, FormulaRule(
+            formula=[f'${column_letter}{first_row}="{status}"'],
+            fill=style.fill,
+            font=style.font
+        ))
+
+
+def remove_status_formatting(sheet, status_column: int, statuses: Collection[str]) -> int:
+    """
+    删除set_status_formatting为状态列添加的条件格式规则
+
+    只删除公式为"状态列=状态码"的规则，工作表中的其他条件格式保持不变。
+
+    参数:
+        sheet: 工作表对象
+        status_column: 状态列的列号
+        statuses: 状态码
+
+    返回:
+        int: 删除的规则数量
+    """
+    pattern = re.compile(rf'\${get_column_letter(status_column)}\d+="(.*)"')
+
+    kept = ConditionalFormattingList()
+    removed = 0
+    for formatting in sheet.conditional_formatting:
+        for rule in formatting.rules:
+            match = None
+            if rule.type == 'expression' and len(rule.formula) == 1:
+                match = pattern.fullmatch(rule.formula[0])
+            if match is not None and match.group(1) in statuses:
+                removed += 1
+            else:
+                kept.add(formatting, rule)
+
+    if removed:
+        kept.max_priority = sheet.conditional_formatting.max_priority
+        sheet.conditional_formatting = kept
+    return removed
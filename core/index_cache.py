@@ -0,0 +1,370 @@
+"""
+匹配原表索引缓存模块
+
+匹配原表（Sheet2）通常很少变化，但每次分析都要重新标准化所有行并构建索引。
+本模块把构建好的ReferenceIndex序列化保存到磁盘缓存目录，下次分析时如果
+匹配原表内容和标准化规则都没有变化，直接加载索引，跳过标准化和索引构建。
+
+缓存键由以下内容计算:
+- 匹配原表每一行的原始值
+- 标准化规则指纹：NORMALIZER_VERSION，以及标准化相关模块源文件的内容
+  （修改标准化规则后缓存自动失效，打包环境没有源文件时只依赖版本号）
+- 当前年份（只有月份的日期按当前年份补全）
+
+缓存目录超过容量上限时，按最近使用时间淘汰最久未使用的缓存文件。
+缓存目录的读写和淘汰由CacheDirectory实现，增量分析状态（core.analysis_state）也使用它。
+
+注意:
+    缓存文件使用pickle格式，只应存放在当前用户自己的缓存目录中。
+
+作者: 供应商数据智能匹配系统开发团队
+版本: 1.0
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+from . import data_standardizer, date_parser, key_codec, reference_index
+from .data_standardizer import NORMALIZER_VERSION
+from .parallel_standardizer import ParallelStandardizer
+from .reference_index import ReferenceIndex
+
+# 缓存文件扩展名
+INDEX_CACHE_FILE_SUFFIX = '.idx'
+
+# 缓存目录的默认容量上限（字节）
+DEFAULT_INDEX_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# 缓存文件格式版本，修改ReferenceIndex的结构时递增
+_INDEX_FORMAT_VERSION = 2
+
+# 参与标准化规则指纹计算的模块
+_NORMALIZER_MODULES = (data_standardizer, date_parser, key_codec, reference_index)
+
+
+def default_index_cache_dir() -> str:
+    """
+    获取默认的索引缓存目录
+
+    Windows下位于%LOCALAPPDATA%，其他系统位于$XDG_CACHE_HOME或~/.cache。
+
+    返回:
+        str: 缓存目录路径（可能尚未创建）
+    """
+    if sys.platform == 'win32':
+        base_dir = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+            os.path.expanduser('~'), '.cache'
+        )
+    return os.path.join(base_dir, 'PanDataone', 'index_cache')
+
+
+@lru_cache(maxsize=1)
+def normalizer_fingerprint() -> str:
+    """
+    计算标准化规则指纹
+
+    返回:
+        str: 十六进制指纹，标准化规则或索引结构变化后指纹随之变化
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{NORMALIZER_VERSION}:{_INDEX_FORMAT_VERSION}".encode())
+
+    for module in _NORMALIZER_MODULES:
+        try:
+            with open(module.__file__, 'rb') as source:
+                digest.update(source.read())
+        except (OSError, TypeError):
+            # 打包后可能没有源文件，此时只依赖版本号
+            pass
+
+    return digest.hexdigest()
+
+
+def reference_fingerprint(rows: Iterable[Sequence[Any]]) -> str:
+    """
+    计算匹配原表数据的指纹
+
+    指纹由每一行的原始值、标准化规则指纹和当前年份计算，
+    三者任一变化时指纹随之变化。用作索引缓存的缓存键，
+    也用于判断增量分析时匹配原表是否变化（见core.analysis_state）。
+
+    参数:
+        rows: 匹配原表的数据行
+
+    返回:
+        str: 十六进制指纹
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{normalizer_fingerprint()}:{datetime.now().year}\n".encode())
+    for row in rows:
+        digest.update(repr(tuple(row)).encode('utf-8', 'surrogatepass'))
+        digest.update(b'\n')
+    return digest.hexdigest()
+
+
+class CacheDirectory:
+    """
+    磁盘缓存目录
+
+    每个缓存键对应目录中的一个pickle文件。对象本身只保存缓存目录和容量上限，
+    可以传递给进程池中的子进程使用。多个进程同时写入同一缓存时，
+    先写临时文件再原子替换，不会读到不完整的文件。
+    缓存目录超过容量上限时，按最近使用时间淘汰最久未使用的缓存文件。
+
+    子类通过类属性指定缓存文件扩展名、缓存对象的类型和日志中的名称。
+
+    属性:
+        cache_dir (str): 缓存目录
+        max_bytes (int): 缓存目录的容量上限（字节）
+    """
+
+    file_suffix = INDEX_CACHE_FILE_SUFFIX
+    entry_type: type = object
+    description = '缓存'
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        """
+        初始化缓存目录
+
+        参数:
+            cache_dir: 缓存目录
+            max_bytes: 缓存目录的容量上限（字节）
+        """
+        if max_bytes < 0:
+            raise ValueError(f"缓存容量不能为负数: {max_bytes}")
+
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def load(self, key: str) -> Optional[Any]:
+        """
+        加载缓存对象
+
+        加载成功时更新文件的修改时间，作为最近使用时间。
+        缓存文件损坏或类型不符时删除该文件并按未命中处理。
+
+        参数:
+            key: 缓存键
+
+        返回:
+            Optional[Any]: 缓存的对象，未命中时返回None
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as cache_file:
+                entry = pickle.load(cache_file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.warning(f"{self.description}无法读取，已删除: {path} ({str(e)})")
+            self._remove(path)
+            return None
+
+        if not isinstance(entry, self.entry_type):
+            self._remove(path)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def store(self, key: str, entry: Any):
+        """
+        保存对象到缓存，并在超出容量上限时淘汰旧的缓存文件
+
+        写入失败（如磁盘已满、没有权限）只记录警告，不影响分析。
+
+        参数:
+            key: 缓存键
+            entry: 缓存对象
+        """
+        if self.max_bytes == 0:
+            return
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as cache_file:
+                    pickle.dump(entry, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, self._path(key))
+            except BaseException:
+                self._remove(temp_path)
+                raise
+        except Exception as e:
+            logging.warning(f"{self.description}写入失败: {str(e)}")
+            return
+
+        logging.info(f"{self.description}已写入: {key}")
+        self._evict()
+
+    def clear(self) -> int:
+        """
+        清空缓存目录中的所有缓存文件
+
+        返回:
+            int: 删除的缓存文件数量
+        """
+        removed = 0
+        for path, _, _ in self._entries():
+            if self._remove(path):
+                removed += 1
+        logging.info(f"已清空{self.description}，共删除 {removed} 个文件")
+        return removed
+
+    def total_bytes(self) -> int:
+        """
+        获取缓存目录中缓存文件的总大小
+
+        返回:
+            int: 总字节数
+        """
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self):
+        """
+        按最近使用时间淘汰缓存文件，直到总大小不超过容量上限
+        """
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+
+        for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            if total <= self.max_bytes:
+                break
+            if self._remove(path):
+                logging.info(f"淘汰{self.description}: {path}")
+            total -= size
+
+    def _entries(self) -> List[Tuple[str, int, float]]:
+        """
+        列出缓存目录中的缓存文件
+
+        返回:
+            List[Tuple[str, int, float]]: (路径, 大小, 修改时间)列表
+        """
+        entries = []
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return entries
+
+        for name in names:
+            if not name.endswith(self.file_suffix):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                # 可能已被其他进程淘汰
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _path(self, key: str) -> str:
+        """
+        获取缓存键对应的文件路径
+
+        参数:
+            key: 缓存键
+
+        返回:
+            str: 缓存文件路径
+        """
+        return os.path.join(self.cache_dir, key + self.file_suffix)
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        """
+        删除文件，文件不存在或无法删除时忽略
+
+        参数:
+            path: 文件路径
+
+        返回:
+            bool: 删除成功返回True
+        """
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
+
+
+class ReferenceIndexCache(CacheDirectory):
+    """
+    匹配原表索引的磁盘缓存
+
+    缓存键为匹配原表的指纹（见reference_fingerprint）。
+
+    示例:
+        >>> cache = ReferenceIndexCache()
+        >>> index, hit = cache.get_or_build(rows)
+    """
+
+    file_suffix = INDEX_CACHE_FILE_SUFFIX
+    entry_type = ReferenceIndex
+    description = '匹配原表索引缓存'
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_INDEX_CACHE_MAX_BYTES):
+        """
+        初始化索引缓存
+
+        参数:
+            cache_dir: 缓存目录，默认为default_index_cache_dir()
+            max_bytes: 缓存目录的容量上限（字节）
+        """
+        super().__init__(cache_dir or default_index_cache_dir(), max_bytes)
+
+    def get_or_build(
+        self,
+        rows: List[Sequence[Any]],
+        key: Optional[str] = None,
+        standardizer: Optional[ParallelStandardizer] = None
+    ) -> Tuple[ReferenceIndex, bool]:
+        """
+        获取匹配原表索引
+
+        缓存命中时直接加载，否则从数据行构建索引并写入缓存。
+
+        参数:
+            rows: 匹配原表的数据行（不含标题行）
+            key: 已计算好的缓存键（reference_fingerprint），为None时从数据行计算
+            standardizer: 未命中缓存时构建索引使用的并行标准化器，可以为None
+
+        返回:
+            Tuple[ReferenceIndex, bool]: (索引, 是否命中缓存)
+        """
+        if key is None:
+            key = self.cache_key(rows)
+
+        index = self.load(key)
+        if index is not None:
+            logging.info(f"匹配原表索引缓存命中: {key}")
+            return index, True
+
+        index = ReferenceIndex.from_rows(rows, standardizer)
+        self.store(key, index)
+        return index, False
+
+    def cache_key(self, rows: Sequence[Sequence[Any]]) -> str:
+        """
+        计算匹配原表数据对应的缓存键
+
+        参数:
+            rows: 匹配原表的数据行
+
+        返回:
+            str: 十六进制缓存键
+        """
+        return reference_fingerprint(rows)
@@ -0,0 +1,125 @@
+"""
+搜索键编码模块
+
+匹配原表和重复检测中的搜索键原本是(日期, 客户, 产品)三个字符串组成的元组，
+每行都要分配新的元组和字符串。本模块为每个客户和产品只保存一次字符串，
+分配连续的整数编号，再与月份序号打包成一个整数作为搜索键。
+整数键占用的内存远小于字符串元组，计算哈希和比较也更快。
+
+键的布局（从高位到低位）:
+    客户编号 | 产品编号（PRODUCT_BITS位）| 月份序号（MONTH_BITS位）
+
+主要功能:
+- 为(客户, 产品)分配整数编号 (KeyCodec.pair_code)
+- 查找已分配的编号，不分配新编号 (KeyCodec.find_pair)
+- 将(客户, 产品)编号与月份序号打包为整数键 (pack_key)
+
+作者: 供应商数据智能匹配系统开发团队
+版本: 1.0
+"""
+
+from typing import Dict, Optional
+
+from .date_parser import MONTH_ORDINAL_YEARS
+
+# 月份序号占用的位数（覆盖MONTH_ORDINAL_YEARS年）
+MONTH_BITS = (MONTH_ORDINAL_YEARS * 12 - 1).bit_length()
+
+# 产品编号占用的位数
+PRODUCT_BITS = 32
+
+_PRODUCT_LIMIT = 1 << PRODUCT_BITS
+
+
+class KeyCodec:
+    """
+    客户和产品的字典编码
+
+    每个不同的客户名称和产品名称只保存一次，按首次出现的顺序从0开始编号。
+    编号只在同一个编码器内有效，不同编码器之间不能混用。
+
+    示例:
+        >>> codec = KeyCodec()
+        >>> codec.pair_code("客户A", "产品B")
+        0
+        >>> codec.pair_code("客户B", "产品B")
+        4294967296
+        >>> codec.find_pair("客户C", "产品B") is None
+        True
+    """
+
+    def __init__(self):
+        """
+        初始化空的编码器
+        """
+        self._customers: Dict[str, int] = {}
+        self._products: Dict[str, int] = {}
+
+    def pair_code(self, customer: str, product: str) -> int:
+        """
+        获取(客户, 产品)的编号，首次出现的客户或产品分配新编号
+
+        参数:
+            customer: 标准化后的客户名称
+            product: 标准化后的产品名称
+
+        返回:
+            int: (客户, 产品)编号
+        """
+        customer_id = self._customers.get(customer)
+        if customer_id is None:
+            customer_id = self._customers[customer] = len(self._customers)
+
+        product_id = self._products.get(product)
+        if product_id is None:
+            product_id = len(self._products)
+            if product_id >= _PRODUCT_LIMIT:
+                raise ValueError(f"产品数量超出编码上限: {_PRODUCT_LIMIT}")
+            self._products[product] = product_id
+
+        return (customer_id << PRODUCT_BITS) | product_id
+
+    def find_pair(self, customer: str, product: str) -> Optional[int]:
+        """
+        查找(客户, 产品)的编号，不分配新编号
+
+        参数:
+            customer: 标准化后的客户名称
+            product: 标准化后的产品名称
+
+        返回:
+            Optional[int]: (客户, 产品)编号，客户或产品从未出现过时返回None
+        """
+        customer_id = self._customers.get(customer)
+        if customer_id is None:
+            return None
+
+        product_id = self._products.get(product)
+        if product_id is None:
+            return None
+
+        return (customer_id << PRODUCT_BITS) | product_id
+
+    def __len__(self) -> int:
+        """
+        已编码的客户和产品数量之和
+        """
+        return len(self._customers) + len(self._products)
+
+
+def pack_key(pair_code: int, ordinal: int) -> int:
+    """
+    将(客户, 产品)编号与月份序号打包为整数键
+
+    参数:
+        pair_code: KeyCodec分配的(客户, 产品)编号
+        ordinal: month_ordinal返回的月份序号
+
+    返回:
+        int: 整数搜索键
+
+    示例:
+        >>> pack_key(0, 410)
+        410
+    """
+    return (pair_code << MONTH_BITS) | ordinal
@@ -0,0 +1,251 @@
+"""
+匹配引擎模块
+
+本模块提供与界面无关的数据匹配引擎，可以在没有Qt窗口的情况下批量复用。
+匹配原表的索引只构建一次，之后可以对任意多个工作簿的数据行进行匹配。
+
+主要功能:
+- 从匹配原表的数据行构建参考索引 (MatchEngine.from_rows，索引见core.reference_index)
+- 以生成器方式逐行输出匹配结果 (MatchEngine.match)
+- 检测重复数据（core.duplicate_tracker）和日期范围数据
+- 同一次匹配中相同的搜索键只查找一次匹配原表，重复标记在复用的结果之上单独计算
+- 根据匹配结果确定单元格样式 (determine_cell_style)
+- 根据匹配结果确定状态码 (determine_status)
+
+使用示例:
+    >>> engine = MatchEngine.from_rows(sheet2.iter_rows(min_row=2, values_only=True))
+    >>> for key, result in engine.match(search_keys):
+    ...     print(key, result.is_matched)
+
+作者: 供应商数据智能匹配系统开发团队
+版本: 1.0
+"""
+
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+from .data_models import MatchResult, CellStyle, MatchStatus
+from .duplicate_tracker import DuplicateTracker, SearchKey
+from .reference_index import ReferenceIndex
+
+T = TypeVar('T')
+
+# 每批匹配的行数，每批开始前调用一次索引的prefetch
+MATCH_BATCH_SIZE = 1000
+
+# 与行的先后顺序无关的查找结果：(匹配到的(日期, 供应商), 单条数据是否匹配或日期范围是否全部匹配)
+_LookupOutcome = Tuple[Tuple[Tuple[str, Any], ...], bool]
+
+
+class MatchEngine:
+    """
+    数据匹配引擎
+
+    持有预处理后的匹配原表索引，对待匹配数据逐行分析。
+    索引在构造时建立，之后只读，因此同一个引擎可以连续处理多个工作簿；
+    每次调用match()都会使用独立的重复数据检测器和查找结果缓存。
+
+    属性:
+        reference (ReferenceIndex): 匹配原表索引
+        lookups_saved (int): 最近一次match()中因相同搜索键复用结果而省去的查找次数
+        cancel_check (Optional[Callable[[], None]]): 取消检查函数，需要取消时抛出异常，
+            在match()的各批之间（批量和分区并行引擎在各计算阶段之间）调用
+
+    示例:
+        >>> engine = MatchEngine.from_rows([
+        ...     ("2024年3月", "客户A", "产品B", "供应商X"),
+        ... ])
+        >>> results = list(engine.match([("202403", "客户A", "产品B")]))
+        >>> results[0][1].is_match
+        True
+    """
+
+    def __init__(self, reference: ReferenceIndex, cancel_check: Optional[Callable[[], None]] = None):
+        """
+        初始化匹配引擎
+
+        参数:
+            reference: 已构建好的匹配原表索引（ReferenceIndex或SqliteReferenceIndex）
+            cancel_check: 可选的取消检查函数，需要取消时抛出异常（如AnalysisCancelled）
+        """
+        self.reference = reference
+        self.cancel_check = cancel_check
+        self.lookups_saved = 0
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence[Any]]) -> 'MatchEngine':
+        """
+        从匹配原表数据行构建匹配引擎
+
+        对每行的前三列进行标准化作为键，第四列作为供应商。
+        同一个键对应多个供应商时按出现顺序保存。
+
+        参数:
+            rows: 匹配原表的数据行（不含标题行），每行至少包含4个值
+
+        返回:
+            MatchEngine: 构建好索引的匹配引擎
+        """
+        return cls(ReferenceIndex.from_rows(rows))
+
+    def match(
+        self,
+        rows: Iterable[T],
+        key: Optional[Callable[[T], SearchKey]] = None
+    ) -> Iterator[Tuple[T, MatchResult]]:
+        """
+        逐行匹配待匹配数据
+
+        按输入顺序处理数据行并以生成器方式输出结果。重复检测依赖行的先后顺序，
+        因此每次调用都会创建新的DuplicateTracker，同一次调用内按顺序累积。
+        数据行按MATCH_BATCH_SIZE分批读取，每批匹配前调用一次索引的prefetch，
+        使按批查询的索引（如SqliteReferenceIndex）可以一次取出整批所需的数据。
+        查找结果与行的先后顺序无关，按搜索键缓存到本次调用结束，
+        相同的搜索键不再查找匹配原表，也不再预取。
+
+        参数:
+            rows: 待匹配的数据行，可以是任意可迭代对象（包括生成器）
+            key: 从数据行中取出标准化搜索键的函数，默认数据行本身就是搜索键
+
+        返回:
+            生成器，每次产出(数据行, MatchResult)元组
+        """
+        tracker = DuplicateTracker()
+        memo: Dict[SearchKey, _LookupOutcome] = {}
+        reference = self.reference
+        rows = iter(rows)
+        self.lookups_saved = 0
+
+        while True:
+            batch: List[T] = list(islice(rows, MATCH_BATCH_SIZE))
+            if not batch:
+                break
+
+            self._check_cancelled()
+            search_keys = [key(row) for row in batch] if key is not None else batch
+            reference.prefetch([search_key for search_key in search_keys if search_key not in memo])
+
+            for row, search_key in zip(batch, search_keys):
+                # 检查重复并标记为已处理
+                result = self._analyze_match(search_key, tracker.check_and_add(search_key), memo)
+                yield row, result
+
+    def _check_cancelled(self):
+        """
+        取消检查点，未设置cancel_check时不做任何事
+        """
+        if self.cancel_check is not None:
+            self.cancel_check()
+
+    def _analyze_match(
+        self,
+        search_key: SearchKey,
+        is_duplicate: bool,
+        memo: Optional[Dict[SearchKey, _LookupOutcome]] = None
+    ) -> MatchResult:
+        """
+        分析数据匹配情况
+
+        判断待匹配数据是否在匹配原表中存在，处理日期范围数据。
+        重复的单条数据不查找匹配原表；其他数据的查找结果与重复标记无关，
+        提供memo时按搜索键缓存，相同的搜索键直接复用。
+
+        参数:
+            search_key: 标准化后的搜索键(日期, 客户, 产品)
+            is_duplicate: 是否与之前处理过的数据重复
+            memo: 可选的查找结果缓存，只在同一次匹配中使用
+
+        返回:
+            MatchResult对象，包含匹配结果信息
+        """
+        result = MatchResult()
+        result.is_duplicate = is_duplicate
+        result.is_date_range = ',' in search_key[0]
+
+        # 重复的单条数据不查找
+        if result.is_duplicate and not result.is_date_range:
+            return result
+
+        outcome = memo.get(search_key) if memo is not None else None
+        if outcome is None:
+            outcome = self._lookup(search_key)
+            if memo is not None:
+                memo[search_key] = outcome
+        else:
+            self.lookups_saved += 1
+
+        suppliers, matched = outcome
+        result.matched_suppliers = list(suppliers)
+        if result.is_date_range:
+            result.is_all_match = matched
+        else:
+            result.is_match = matched
+        return result
+
+    def _lookup(self, search_key: SearchKey) -> _LookupOutcome:
+        """
+        在匹配原表中查找搜索键
+
+        参数:
+            search_key: 标准化后的搜索键(日期, 客户, 产品)
+
+        返回:
+            _LookupOutcome: (匹配到的(日期, 供应商), 单条数据是否匹配或日期范围是否全部匹配)
+        """
+        reference = self.reference
+
+        # 日期范围数据处理：一次位运算判断是否所有月份都有匹配
+        if ',' in search_key[0]:
+            suppliers, all_matches = reference.match_range(search_key[1:], search_key[0])
+            return tuple(suppliers), all_matches and bool(suppliers)
+
+        # 单条数据处理
+        suppliers = reference.get(search_key)
+        if suppliers is None:
+            return (), False
+        date = search_key[0]
+        return tuple((date, supplier) for supplier in suppliers), True
+
+
+def determine_cell_style(result: MatchResult) -> CellStyle:
+    """
+    根据匹配结果确定单元格样式
+
+    根据匹配结果的状态选择相应的颜色标记。
+
+    样式优先级:
+        1. 黄色 - 重复数据（最高优先级）
+        2. 紫色 - 日期范围且全部匹配
+        3. 棕色 - 日期范围但未全部匹配
+        4. 绿色 - 单条数据匹配成功
+        5. 红色 - 单条数据未匹配
+
+    参数:
+        result: 匹配结果对象
+
+    返回:
+        CellStyle对象
+    """
+    return MatchStatus.STYLES[determine_status(result)]
+
+
+def determine_status(result: MatchResult) -> str:
+    """
+    根据匹配结果确定状态码
+
+    优先级与determine_cell_style相同，状态码与颜色的对应关系见MatchStatus。
+
+    参数:
+        result: 匹配结果对象
+
+    返回:
+        str: MatchStatus中的状态码
+    """
+    if result.is_duplicate:
+        return MatchStatus.DUPLICATE
+    elif result.is_date_range:
+        return MatchStatus.ALL_MATCH if result.is_all_match else MatchStatus.PARTIAL_MATCH
+    elif result.is_match:
+        return MatchStatus.MATCH
+    else:
+        return MatchStatus.NO_MATCH
@@ -0,0 +1,218 @@
+"""
+并行标准化模块
+
+standardize_data是纯Python的CPU密集计算，在一个进程中只能使用一个CPU核心。
+本模块把数据行分块交给进程池标准化，按输入顺序返回(数据行, 搜索键)。
+
+为了减少进程间传输的数据量，每块数据按列去重后只发送不同的原始字符串
+（三列各一个字符串列表），子进程返回对应的标准化结果，主进程再按行还原搜索键。
+表格中的客户、产品和月份写法高度重复，去重后传输的数据远少于原始数据行。
+
+说明:
+    值大多重复时，主进程去重的开销与直接查询标准化缓存相当，并行没有收益；
+    只有大量不同的值需要实际标准化时，进程池才能缩短时间。
+    子进程中的标准化不计入主进程的标准化缓存统计。
+
+主要功能:
+- 按进程池并行标准化数据行 (ParallelStandardizer.keyed_rows)
+- 可选并行地为数据行计算搜索键 (iter_keyed_rows)
+
+作者: 供应商数据智能匹配系统开发团队
+版本: 1.0
+"""
+
+import multiprocessing
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+from .data_standardizer import (
+    configure_standardize_cache, get_standardize_cache_stats, standardize_data, standardize_row
+)
+from .duplicate_tracker import SearchKey
+
+R = TypeVar('R', bound=Sequence[Any])
+
+# 每块数据的行数
+DEFAULT_CHUNK_ROWS = 5000
+
+# 每个子进程同时排队的块数
+_CHUNKS_PER_WORKER = 2
+
+# 一块数据按列去重后的结果：(三列各自不同的原始字符串, 三列各行对应的字符串序号)
+_PackedChunk = Tuple[Tuple[List[str], List[str], List[str]], Tuple[array, array, array]]
+
+
+class ParallelStandardizer:
+    """
+    基于进程池的并行标准化器
+
+    进程池在第一次使用时创建，之后复用，用完后需要调用close()（或使用with语句）。
+    子进程统一以spawn方式启动（与Windows相同），避免在界面的分析线程中fork进程。
+    子进程的标准化缓存容量与创建进程池时主进程的设置相同。
+
+    属性:
+        workers (int): 子进程数量
+        chunk_rows (int): 每块数据的行数
+
+    示例:
+        >>> with ParallelStandardizer(4) as standardizer:
+        ...     for row, key in standardizer.keyed_rows(rows):
+        ...         print(row, key)
+    """
+
+    def __init__(self, workers: int, chunk_rows: int = DEFAULT_CHUNK_ROWS):
+        """
+        初始化并行标准化器
+
+        参数:
+            workers: 子进程数量，至少为1
+            chunk_rows: 每块数据的行数，至少为1
+        """
+        if workers < 1:
+            raise ValueError(f"标准化进程数必须大于0: {workers}")
+        if chunk_rows < 1:
+            raise ValueError(f"每块行数必须大于0: {chunk_rows}")
+
+        self.workers = workers
+        self.chunk_rows = chunk_rows
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def keyed_rows(self, rows: Iterable[R]) -> Iterator[Tuple[R, SearchKey]]:
+        """
+        并行计算数据行的搜索键
+
+        按chunk_rows分块读取数据行，每个子进程最多同时排队两块，
+        输入很长时也不会一次读入全部数据。
+
+        参数:
+            rows: 数据行，每行至少包含3个值
+
+        返回:
+            生成器，按输入顺序产出(数据行, 标准化后的(日期, 客户, 产品))
+        """
+        executor = self._get_executor()
+        rows = iter(rows)
+        pending: Deque[Tuple[List[R], Tuple[array, array, array], Future]] = deque()
+
+        try:
+            while True:
+                # 保持进程池忙碌
+                while len(pending) < self.workers * _CHUNKS_PER_WORKER:
+                    chunk: List[R] = list(islice(rows, self.chunk_rows))
+                    if not chunk:
+                        break
+                    columns, indexes = _pack_chunk(chunk)
+                    pending.append((chunk, indexes, executor.submit(_standardize_columns, columns)))
+
+                if not pending:
+                    break
+
+                chunk, (dates, customers, products), future = pending.popleft()
+                date_values, customer_values, product_values = future.result()
+                for position, row in enumerate(chunk):
+                    yield row, (
+                        date_values[dates[position]],
+                        customer_values[customers[position]],
+                        product_values[products[position]]
+                    )
+        finally:
+            for _, _, future in pending:
+                future.cancel()
+
+    def close(self):
+        """
+        关闭进程池
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """
+        获取进程池，第一次使用时创建
+
+        返回:
+            ProcessPoolExecutor: 进程池
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=configure_standardize_cache,
+                initargs=(get_standardize_cache_stats().maxsize,)
+            )
+        return self._executor
+
+    def __enter__(self) -> 'ParallelStandardizer':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def iter_keyed_rows(
+    rows: Iterable[R], standardizer: Optional[ParallelStandardizer] = None
+) -> Iterator[Tuple[R, SearchKey]]:
+    """
+    为数据行计算搜索键
+
+    参数:
+        rows: 数据行，每行至少包含3个值
+        standardizer: 可选的并行标准化器，为None时在当前进程中逐行标准化
+
+    返回:
+        生成器，按输入顺序产出(数据行, 标准化后的(日期, 客户, 产品))
+    """
+    if standardizer is None:
+        return ((row, standardize_row(row)) for row in rows)
+    return standardizer.keyed_rows(rows)
+
+
+def _pack_chunk(chunk: List[Sequence[Any]]) -> _PackedChunk:
+    """
+    按列去重一块数据
+
+    原始值与standardize_row相同，先转换为字符串（空单元格为"None"）。
+
+    参数:
+        chunk: 数据行
+
+    返回:
+        _PackedChunk: (三列各自不同的原始字符串, 三列各行对应的字符串序号)
+    """
+    columns = ([], [], [])
+    indexes = (array('I'), array('I'), array('I'))
+    for column in range(3):
+        values: Dict[str, int] = {}
+        index = indexes[column]
+        for row in chunk:
+            value = str(row[column])
+            position = values.get(value)
+            if position is None:
+                position = values[value] = len(values)
+            index.append(position)
+        columns[column].extend(values)
+    return columns, indexes
+
+
+def _standardize_columns(
+    columns: Tuple[List[str], List[str], List[str]]
+) -> Tuple[List[str], List[str], List[str]]:
+    """
+    标准化三列去重后的原始字符串（在子进程中执行）
+
+    参数:
+        columns: 日期、客户名称、产品名称三列的原始字符串
+
+    返回:
+        Tuple[List[str], List[str], List[str]]: 与输入一一对应的标准化结果
+    """
+    dates, customers, products = columns
+    return (
+        [standardize_data(value, 1) for value in dates],
+        [standardize_data(value, 2) for value in customers],
+        [standardize_data(value, 3) for value in products]
+    )
@@ -0,0 +1,302 @@
+"""
+分区并行匹配引擎模块
+
+重复检测依赖同一(客户, 产品)中行的先后顺序，因此MatchEngine只能逐行串行匹配。
+但不同(客户, 产品)之间的重复检测和匹配互不影响（见core.duplicate_tracker），
+本模块的PartitionedMatchEngine按(客户, 产品)的哈希把待匹配数据分到若干个分区，
+每个分区固定由一个子进程按原来的行顺序逐行匹配，再按行号合并结果。
+同一(客户, 产品)的行总在同一个分区中且保持原有顺序，结果与MatchEngine完全相同。
+
+待匹配数据按CHUNK_ROWS行分块读入，每块分区后提交给子进程，子进程为每个分区保留
+重复检测状态，因此同时在内存中的只有少数几块数据，读取下一块与匹配上一块同时进行。
+等待子进程时定期调用cancel_check，取消时丢弃尚未开始的任务并关闭子进程。
+
+匹配原表索引在每个子进程启动时传入一次，之后每个分区只传输搜索键和匹配结果。
+
+以下情况退回当前进程中的逐行匹配（记录日志）:
+- 子进程数量为1，或待匹配数据少于MIN_PARALLEL_ROWS行（进程启动开销大于收益）
+- 索引不是内存中的ReferenceIndex（SQLite索引的数据库连接不能传给子进程）
+
+作者: 供应商数据智能匹配系统开发团队
+版本: 1.0
+"""
+
+import logging
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from itertools import chain, islice
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from .data_models import MatchResult
+from .duplicate_tracker import DuplicateTracker, SearchKey
+from .match_engine import MatchEngine
+from .reference_index import ReferenceIndex
+
+T = TypeVar('T')
+
+# 少于该行数时不启动进程池（逐行匹配每行只需几微秒，进程启动和传输索引的开销更大）
+MIN_PARALLEL_ROWS = 200000
+
+# 每块读入并分区匹配的行数
+CHUNK_ROWS = 50000
+
+# 每个子进程分到的分区数，分区越多各子进程的负载越均衡
+_PARTITIONS_PER_WORKER = 4
+
+# 同时提交给子进程的块数（不含正在产出结果的块）
+_MAX_PENDING_CHUNKS = 2
+
+# 等待子进程时检查取消请求的间隔（秒）
+_POLL_SECONDS = 0.1
+
+# 子进程返回的一行匹配结果：MatchResult各字段组成的元组
+_PackedResult = Tuple[bool, bool, bool, bool, List[Tuple[str, Any]]]
+
+# 已提交的一块：(数据行, 各分区的行位置, 各分区的任务)
+_PendingChunk = Tuple[List[Any], List[List[int]], List[Future]]
+
+# 子进程中的匹配引擎，由_init_worker创建
+_worker_engine: Optional[MatchEngine] = None
+
+# 子进程中各分区的(重复检测器, 查找结果缓存)，跨块保留
+_worker_partitions: Dict[int, Tuple[DuplicateTracker, Dict[SearchKey, Any]]] = {}
+
+
+class PartitionedMatchEngine(MatchEngine):
+    """
+    按(客户, 产品)分区的并行匹配引擎
+
+    接口与MatchEngine相同。match()分块读入数据行，每块分区匹配后按输入顺序产出结果。
+    每次调用match()都会为每个子进程创建单进程的进程池（保证同一分区的任务按提交顺序执行），
+    匹配完成、出错或被取消后关闭。
+
+    属性:
+        workers (int): 子进程数量
+
+    示例:
+        >>> engine = PartitionedMatchEngine(ReferenceIndex.from_rows(sheet2_rows), workers=4)
+        >>> for row, result in engine.match(rows, key=standardize_row):
+        ...     print(row, result.is_matched)
+    """
+
+    def __init__(
+        self,
+        reference: ReferenceIndex,
+        workers: Optional[int] = None,
+        cancel_check: Optional[Callable[[], None]] = None
+    ):
+        """
+        初始化分区并行匹配引擎
+
+        参数:
+            reference: 已构建好的匹配原表索引
+            workers: 子进程数量，默认为CPU核心数
+            cancel_check: 可选的取消检查函数，需要取消时抛出异常
+        """
+        super().__init__(reference, cancel_check)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError(f"匹配进程数必须大于0: {workers}")
+        self.workers = workers
+
+    def match(
+        self,
+        rows: Iterable[T],
+        key: Optional[Callable[[T], SearchKey]] = None
+    ) -> Iterator[Tuple[T, MatchResult]]:
+        """
+        分区并行匹配全部待匹配数据
+
+        参数:
+            rows: 待匹配的数据行
+            key: 从数据行中取出标准化搜索键的函数，默认数据行本身就是搜索键
+
+        返回:
+            生成器，按输入顺序产出(数据行, MatchResult)元组
+        """
+        if not self._can_partition():
+            yield from super().match(rows, key)
+            return
+
+        # 先读入MIN_PARALLEL_ROWS行判断数据量
+        rows = iter(rows)
+        head = list(islice(rows, MIN_PARALLEL_ROWS))
+        if len(head) < MIN_PARALLEL_ROWS:
+            logging.info(f"待匹配数据少于 {MIN_PARALLEL_ROWS} 行，使用逐行匹配")
+            yield from super().match(head, key)
+            return
+
+        yield from self._match_partitions(chain(head, rows), key)
+
+    def _can_partition(self) -> bool:
+        """
+        是否可以分区并行匹配
+
+        返回:
+            bool: 子进程数量大于1且索引为内存中的ReferenceIndex时返回True
+        """
+        if self.workers == 1:
+            logging.info("匹配进程数为1，使用逐行匹配")
+            return False
+        if not isinstance(self.reference, ReferenceIndex):
+            logging.info("分区并行匹配只支持内存索引，使用逐行匹配")
+            return False
+        return True
+
+    def _match_partitions(
+        self,
+        rows: Iterator[T],
+        key: Optional[Callable[[T], SearchKey]]
+    ) -> Iterator[Tuple[T, MatchResult]]:
+        """
+        分块分区匹配并按输入顺序产出结果
+
+        参数:
+            rows: 待匹配的数据行
+            key: 从数据行中取出标准化搜索键的函数，为None时数据行本身就是搜索键
+
+        返回:
+            生成器，按输入顺序产出(数据行, MatchResult)元组
+        """
+        logging.info(f"分区并行匹配: {self.workers} 个进程，每块 {CHUNK_ROWS} 行")
+
+        context = multiprocessing.get_context('spawn')
+        executors = [
+            ProcessPoolExecutor(
+                max_workers=1, mp_context=context, initializer=_init_worker, initargs=(self.reference,)
+            )
+            for _ in range(self.workers)
+        ]
+        pending: Deque[_PendingChunk] = deque()
+        exhausted = False
+        self.lookups_saved = 0
+        try:
+            while True:
+                if not exhausted:
+                    chunk = list(islice(rows, CHUNK_ROWS))
+                    exhausted = len(chunk) < CHUNK_ROWS
+                    if chunk:
+                        pending.append(self._submit_chunk(executors, chunk, key))
+                if not pending:
+                    break
+                if exhausted or len(pending) >= _MAX_PENDING_CHUNKS:
+                    yield from self._collect_chunk(*pending.popleft())
+        finally:
+            # 完成、出错或取消时关闭子进程，取消时丢弃尚未开始的任务
+            for executor in executors:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def _submit_chunk(
+        self,
+        executors: List[ProcessPoolExecutor],
+        chunk: List[T],
+        key: Optional[Callable[[T], SearchKey]]
+    ) -> _PendingChunk:
+        """
+        把一块数据分区后提交给子进程
+
+        同一分区总是提交给同一个子进程，分区内保持原来的行顺序。
+
+        参数:
+            executors: 各子进程的单进程进程池
+            chunk: 一块数据行
+            key: 从数据行中取出标准化搜索键的函数
+
+        返回:
+            _PendingChunk: (数据行, 各分区的行位置, 各分区的任务)
+        """
+        search_keys = [key(row) for row in chunk] if key is not None else chunk
+        partition_count = len(executors) * _PARTITIONS_PER_WORKER
+        partitions: List[List[int]] = [[] for _ in range(partition_count)]
+        for position, (_, customer, product) in enumerate(search_keys):
+            partitions[hash((customer, product)) % partition_count].append(position)
+
+        positions: List[List[int]] = []
+        futures: List[Future] = []
+        for partition_id, partition in enumerate(partitions):
+            if partition:
+                positions.append(partition)
+                futures.append(executors[partition_id % len(executors)].submit(
+                    _match_partition, partition_id, [search_keys[position] for position in partition]
+                ))
+        return chunk, positions, futures
+
+    def _collect_chunk(
+        self,
+        chunk: List[T],
+        positions: List[List[int]],
+        futures: List[Future]
+    ) -> Iterator[Tuple[T, MatchResult]]:
+        """
+        等待一块数据的所有分区完成，按行号合并结果
+
+        等待期间每隔_POLL_SECONDS调用一次cancel_check。
+
+        参数:
+            chunk: 一块数据行
+            positions: 各分区的行位置
+            futures: 各分区的任务
+
+        返回:
+            生成器，按输入顺序产出(数据行, MatchResult)元组
+        """
+        not_done = set(futures)
+        while not_done:
+            self._check_cancelled()
+            _, not_done = wait(not_done, timeout=_POLL_SECONDS)
+
+        results: List[Optional[_PackedResult]] = [None] * len(chunk)
+        for partition, future in zip(positions, futures):
+            packed_results, lookups_saved = future.result()
+            self.lookups_saved += lookups_saved
+            for position, packed in zip(partition, packed_results):
+                results[position] = packed
+
+        for row, packed in zip(chunk, results):
+            yield row, MatchResult(*packed)
+
+
+def _init_worker(reference: ReferenceIndex):
+    """
+    子进程初始化：保存匹配原表索引
+
+    参数:
+        reference: 匹配原表索引
+    """
+    global _worker_engine
+    _worker_engine = MatchEngine(reference)
+    _worker_partitions.clear()
+
+
+def _match_partition(partition_id: int, search_keys: List[SearchKey]) -> Tuple[List[_PackedResult], int]:
+    """
+    按顺序逐行匹配一个分区中的一块数据（在子进程中执行）
+
+    分区的重复检测器和查找结果缓存在子进程中跨块保留，
+    与MatchEngine.match()在一次调用中逐行累积的状态相同。
+
+    参数:
+        partition_id: 分区编号
+        search_keys: 这一块中属于该分区的搜索键，按原来顺序排列
+
+    返回:
+        Tuple[List[_PackedResult], int]: (各行的匹配结果, 复用查找结果省去的查找次数)
+    """
+    engine = _worker_engine
+    state = _worker_partitions.get(partition_id)
+    if state is None:
+        state = _worker_partitions[partition_id] = (DuplicateTracker(), {})
+    tracker, memo = state
+
+    engine.lookups_saved = 0
+    packed_results = []
+    for search_key in search_keys:
+        result = engine._analyze_match(search_key, tracker.check_and_add(search_key), memo)
+        packed_results.append((
+            result.is_duplicate, result.is_date_range, result.is_all_match, result.is_match,
+            result.matched_suppliers
+        ))
+    return packed_results, engine.lookups_saved
@@ -0,0 +1,319 @@
+"""
+流水线模块
+
+单独输出模式下，读取待匹配表（解压和解析XML）、标准化、匹配和写出结果原本在
+同一个线程中依次进行。本模块提供用有界队列连接的后台线程阶段，把分析组织成
+读取 → 标准化 → 匹配 → 写出的流水线:
+
+- ThreadedReader: 在后台线程中迭代数据源，把数据放入有界队列，前台按顺序取出
+- ThreadedWriter: 前台把数据放入有界队列，后台线程按顺序写出
+
+队列已满时上游阶段阻塞等待（背压），因此各阶段之间最多缓存
+max_chunks * chunk_size 个数据，内存占用与总行数无关。
+数据按块在队列中传递，避免每行一次的线程切换开销。
+
+说明:
+    CPython的线程受GIL限制，只有释放GIL的工作（如zlib解压、磁盘读写）能与
+    其他阶段真正同时进行；CPU密集的标准化可以交给进程池（core.parallel_standardizer）。
+
+主要功能:
+- 在后台线程中读取数据 (ThreadedReader)
+- 在后台线程中写出数据 (ThreadedWriter)
+
+作者: 供应商数据智能匹配系统开发团队
+版本: 1.0
+"""
+
+import queue
+import threading
+from itertools import islice
+from typing import Any, Callable, Generic, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar('T')
+
+# 每块数据的个数
+DEFAULT_CHUNK_SIZE = 1000
+
+# 队列中最多缓存的块数
+DEFAULT_MAX_CHUNKS = 8
+
+# 阻塞在队列上的线程检查停止请求的间隔（秒）
+_POLL_INTERVAL = 0.1
+
+# 数据源结束的标记
+_END = object()
+
+
+class _Failure:
+    """
+    后台线程中发生的异常，经队列传给前台重新抛出
+
+    属性:
+        error (BaseException): 异常对象
+    """
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class ThreadedReader(Iterator[T]):
+    """
+    在后台线程中迭代数据源的读取阶段
+
+    后台线程按块读取数据源并放入有界队列，前台按原来的顺序逐个取出。
+    数据源抛出的异常在前台取到该位置时重新抛出。
+    提前结束时需要调用close()（或使用with语句）停止后台线程，
+    数据源是生成器时会在后台线程中被关闭。
+
+    属性:
+        name (str): 线程名称，用于日志和调试
+
+    示例:
+        >>> with ThreadedReader(iter_sheet_values(sheet), name='读取') as rows:
+        ...     for row, values in rows:
+        ...         print(row, values)
+    """
+
+    def __init__(
+        self,
+        source: Iterable[T],
+        name: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_chunks: int = DEFAULT_MAX_CHUNKS
+    ):
+        """
+        初始化并启动读取阶段
+
+        参数:
+            source: 数据源
+            name: 线程名称
+            chunk_size: 每块数据的个数，至少为1
+            max_chunks: 队列中最多缓存的块数，至少为1
+        """
+        if chunk_size < 1:
+            raise ValueError(f"每块数据个数必须大于0: {chunk_size}")
+        if max_chunks < 1:
+            raise ValueError(f"队列容量必须大于0: {max_chunks}")
+
+        self.name = name
+        self._source = source
+        self._chunk_size = chunk_size
+        self._queue: queue.Queue = queue.Queue(max_chunks)
+        self._stop = threading.Event()
+        self._chunk: Iterator[T] = iter(())
+        self._finished = False
+        self._thread = threading.Thread(target=self._produce, name=name, daemon=True)
+        self._thread.start()
+
+    def __next__(self) -> T:
+        """
+        按顺序取出下一个数据
+
+        返回:
+            T: 下一个数据
+
+        异常:
+            StopIteration: 数据源已结束
+        """
+        while True:
+            for item in self._chunk:
+                return item
+            if self._finished:
+                raise StopIteration
+
+            chunk = self._queue.get()
+            if chunk is _END:
+                self._finished = True
+                self._thread.join()
+            elif isinstance(chunk, _Failure):
+                self._finished = True
+                self._thread.join()
+                raise chunk.error
+            else:
+                self._chunk = iter(chunk)
+
+    def close(self):
+        """
+        停止后台线程，丢弃尚未取出的数据
+        """
+        self._finished = True
+        self._chunk = iter(())
+        self._stop.set()
+        self._thread.join()
+
+    def _produce(self):
+        """
+        后台线程：按块读取数据源并放入队列
+        """
+        items = iter(self._source)
+        try:
+            while not self._stop.is_set():
+                chunk: List[T] = list(islice(items, self._chunk_size))
+                if not chunk:
+                    break
+                self._put(chunk)
+            self._put(_END)
+        except BaseException as e:
+            self._put(_Failure(e))
+        finally:
+            close = getattr(items, 'close', None)
+            if close is not None:
+                close()
+
+    def _put(self, chunk: Any):
+        """
+        把一块数据放入队列，队列已满时等待，已请求停止时放弃
+
+        参数:
+            chunk: 数据块或结束标记
+        """
+        while not self._stop.is_set():
+            try:
+                self._queue.put(chunk, timeout=_POLL_INTERVAL)
+                return
+            except queue.Full:
+                continue
+
+    def __enter__(self) -> 'ThreadedReader[T]':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class ThreadedWriter(Generic[T]):
+    """
+    在后台线程中写出数据的写出阶段
+
+    前台调用put()按块放入有界队列，后台线程按放入的顺序对每个数据调用write。
+    写出时发生的异常在下一次put()或close()时在前台重新抛出，之后的数据不再写出。
+
+    示例:
+        >>> writer = ThreadedWriter(lambda item: item[0].append(item[1]), name='写出')
+        >>> writer.put((sheet, values))
+        >>> writer.close()
+    """
+
+    def __init__(
+        self,
+        write: Callable[[T], Any],
+        name: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_chunks: int = DEFAULT_MAX_CHUNKS
+    ):
+        """
+        初始化并启动写出阶段
+
+        参数:
+            write: 写出一个数据的函数，在后台线程中调用
+            name: 线程名称
+            chunk_size: 每块数据的个数，至少为1
+            max_chunks: 队列中最多缓存的块数，至少为1
+        """
+        if chunk_size < 1:
+            raise ValueError(f"每块数据个数必须大于0: {chunk_size}")
+        if max_chunks < 1:
+            raise ValueError(f"队列容量必须大于0: {max_chunks}")
+
+        self.name = name
+        self._write = write
+        self._chunk_size = chunk_size
+        self._queue: queue.Queue = queue.Queue(max_chunks)
+        self._chunk: List[T] = []
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._consume, name=name, daemon=True)
+        self._thread.start()
+
+    def put(self, item: T):
+        """
+        放入一个待写出的数据，队列已满时等待
+
+        参数:
+            item: 待写出的数据
+
+        异常:
+            写出线程中发生的异常
+        """
+        self._raise_error()
+        self._chunk.append(item)
+        if len(self._chunk) >= self._chunk_size:
+            self._flush()
+
+    def close(self):
+        """
+        写出剩余数据并等待后台线程结束
+
+        异常:
+            写出线程中发生的异常
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._chunk:
+            self._flush()
+        self._put(_END)
+        self._thread.join()
+        self._raise_error()
+
+    def abort(self):
+        """
+        丢弃尚未写出的数据并停止后台线程，不抛出写出时发生的异常
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._chunk = []
+        # 写出线程出错后不再取数据，清空队列后结束标记才能放入
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        self._put(_END)
+        self._thread.join()
+
+    def _flush(self):
+        """
+        把当前块放入队列
+        """
+        chunk, self._chunk = self._chunk, []
+        self._put(chunk)
+        self._raise_error()
+
+    def _put(self, chunk: Any):
+        """
+        把一块数据放入队列，写出线程出错后放弃
+
+        参数:
+            chunk: 数据块或结束标记
+        """
+        while self._error is None:
+            try:
+                self._queue.put(chunk, timeout=_POLL_INTERVAL)
+                return
+            except queue.Full:
+                continue
+
+    def _consume(self):
+        """
+        后台线程：按顺序取出数据块并逐个写出
+        """
+        write = self._write
+        while True:
+            chunk = self._queue.get()
+            if chunk is _END:
+                return
+            try:
+                for item in chunk:
+                    write(item)
+            except BaseException as e:
+                self._error = e
+                return
+
+    def _raise_error(self):
+        """
+        写出线程出错时在前台重新抛出异常
+        """
+        if self._error is not None:
+            raise self._error
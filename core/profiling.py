@@ -0,0 +1,122 @@
+"""
+性能分析模块
+
+用户反馈某个工作簿分析很慢时，可以用cProfile记录一次分析，把生成的文件发给开发团队，
+无需提供工作簿本身。性能分析文件与日志文件放在同一目录:
+
+- 性能分析_YYYYMMDD_HHMMSS.prof: cProfile原始数据，可用pstats或snakeviz等工具查看
+- 性能分析_YYYYMMDD_HHMMSS.txt: 按累计耗时排序的前N个函数
+
+记录范围与Python版本有关:
+- Python 3.11及以前：cProfile基于sys.setprofile，只记录执行分析的线程，
+  流水线的后台线程只表现为等待队列的时间
+- Python 3.12及以后：cProfile基于sys.monitoring，对解释器中的所有线程生效，
+  记录中还包括界面主线程和流水线后台线程的调用
+两种情况下标准化进程池和分区并行匹配子进程中的工作都不在其中，只表现为等待进程池的时间。
+同一时间只能有一个性能分析器（3.12及以后再次启用会抛出ValueError），
+此时跳过本次性能分析并记录警告，分析照常进行。
+记录期间分析会明显变慢，只在需要时启用。
+
+主要功能:
+- 在with语句中记录性能分析并写出两个文件 (AnalysisProfiler)
+
+作者: 供应商数据智能匹配系统开发团队
+版本: 1.0
+"""
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+from datetime import datetime
+from typing import Optional
+
+# 文本摘要中列出的函数个数
+DEFAULT_TOP = 40
+
+# 性能分析文件名前缀
+PROFILE_FILE_PREFIX = '性能分析_'
+
+
+class AnalysisProfiler:
+    """
+    分析过程的性能分析器
+
+    在with语句中启用cProfile，退出时（包括分析出错或被取消）写出.prof文件和文本摘要。
+    已有其他性能分析器在运行、无法启用cProfile时只记录警告，不写出文件，两个路径保持为None。
+
+    属性:
+        output_dir (str): 输出目录
+        top (int): 文本摘要中列出的函数个数
+        profile_file (Optional[str]): 写出的.prof文件路径，写出前为None
+        summary_file (Optional[str]): 写出的文本摘要路径，写出前为None
+
+    示例:
+        >>> with AnalysisProfiler(os.path.dirname(log_file)) as profiler:
+        ...     stats = analyze_workbook(file_path)
+        >>> profiler.summary_file
+        'logs/性能分析_20240106_153012.txt'
+    """
+
+    def __init__(self, output_dir: str, top: int = DEFAULT_TOP):
+        """
+        初始化性能分析器
+
+        参数:
+            output_dir: 输出目录，不存在时自动创建
+            top: 文本摘要中列出的函数个数
+        """
+        self.output_dir = output_dir
+        self.top = top
+        self.profile_file: Optional[str] = None
+        self.summary_file: Optional[str] = None
+        self._profile: Optional[cProfile.Profile] = None
+
+    def __enter__(self) -> 'AnalysisProfiler':
+        """开始记录，无法启用cProfile时跳过记录"""
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as e:
+            # Python 3.12及以后已有其他性能分析器运行时抛出
+            logging.warning(f"无法启用性能分析，本次分析不记录: {str(e)}")
+        else:
+            self._profile = profile
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """停止记录并写出文件，写出失败时只记录日志，不影响分析结果"""
+        if self._profile is None:
+            return False
+
+        self._profile.disable()
+        try:
+            self._write()
+        except OSError as e:
+            logging.warning(f"写出性能分析文件失败: {str(e)}")
+        return False
+
+    def _write(self):
+        """
+        写出.prof文件和按累计耗时排序的文本摘要
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        stem = os.path.join(
+            self.output_dir, f"{PROFILE_FILE_PREFIX}{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        )
+
+        profile_file = f"{stem}.prof"
+        self._profile.dump_stats(profile_file)
+
+        summary = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=summary)
+        stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+
+        summary_file = f"{stem}.txt"
+        with open(summary_file, 'w', encoding='utf-8') as f:
+            f.write(f"按累计耗时排序的前 {self.top} 个函数\n")
+            f.write(summary.getvalue())
+
+        self.profile_file, self.summary_file = profile_file, summary_file
+        logging.info(f"性能分析已保存到: {profile_file}")
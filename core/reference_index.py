@@ -0,0 +1,247 @@
+"""
+匹配原表索引模块
+
+本模块提供匹配原表（Sheet2）的索引结构。客户和产品通过KeyCodec编码为整数，
+YYYYMM格式的日期换算为月份序号，与(客户, 产品)编号打包成一个整数作为键，
+每行只占用一个整数键；同一个键只有一个供应商时直接保存供应商值，不另建列表。
+每个(客户, 产品)还用月份位图记录覆盖了哪些月份，日期范围数据只需一次位运算
+即可判断是否所有月份都有匹配，并且只为覆盖到的月份取出供应商。
+
+主要功能:
+- 从匹配原表数据行构建索引 (ReferenceIndex.from_rows)
+- 查找单条数据的供应商 (ReferenceIndex.get)
+- 匹配日期范围数据 (ReferenceIndex.match_range, match_pair_range)
+
+作者: 供应商数据智能匹配系统开发团队
+版本: 1.0
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .date_parser import month_mask, month_ordinal
+from .duplicate_tracker import PairKey, SearchKey
+from .key_codec import MONTH_BITS, KeyCodec, pack_key
+from .parallel_standardizer import ParallelStandardizer, iter_keyed_rows
+
+# 字典中不存在的键
+_MISSING = object()
+
+
+class ReferenceIndex:
+    """
+    匹配原表索引
+
+    属性:
+        codec (KeyCodec): 客户和产品的字典编码
+        suppliers (Dict[int, Any]): 按整数键（(客户, 产品)编号与月份序号）索引的供应商，
+            只有一个供应商时为供应商值本身，多个供应商时为按出现顺序排列的列表
+        other_suppliers (Dict[Tuple[int, str], Any]): 日期不是YYYYMM格式的供应商，
+            按((客户, 产品)编号, 日期)索引，取值形式与suppliers相同
+        coverage (Dict[int, int]): 每个(客户, 产品)编号覆盖的月份位图
+
+    示例:
+        >>> index = ReferenceIndex.from_rows([
+        ...     ("2024年3月", "客户A", "产品B", "供应商X"),
+        ...     ("2024年4月", "客户A", "产品B", "供应商Y"),
+        ... ])
+        >>> index.match_range(("客户A", "产品B"), "202403,202404")
+        ([('202403', '供应商X'), ('202404', '供应商Y')], True)
+    """
+
+    def __init__(self):
+        """
+        初始化空索引
+        """
+        self.codec = KeyCodec()
+        self.suppliers: Dict[int, Any] = {}
+        self.other_suppliers: Dict[Tuple[int, str], Any] = {}
+        self.coverage: Dict[int, int] = {}
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Sequence[Any]],
+        standardizer: Optional[ParallelStandardizer] = None
+    ) -> 'ReferenceIndex':
+        """
+        从匹配原表数据行构建索引
+
+        对每行的前三列进行标准化作为键，第四列作为供应商。
+        同一个键对应多个供应商时按出现顺序保存。
+
+        参数:
+            rows: 匹配原表的数据行（不含标题行），每行至少包含4个值
+            standardizer: 可选的并行标准化器，为None时在当前进程中标准化
+
+        返回:
+            ReferenceIndex: 构建好的索引
+        """
+        index = cls()
+        for row, key in iter_keyed_rows(rows, standardizer):
+            index.add(key, row[3])
+        return index
+
+    def add(self, key: SearchKey, supplier: Any):
+        """
+        添加一条供应商记录
+
+        参数:
+            key: 标准化后的(日期, 客户, 产品)
+            supplier: 供应商
+        """
+        date, customer, product = key
+        pair_code = self.codec.pair_code(customer, product)
+        coverage = self.coverage.get(pair_code, 0)
+
+        ordinal = month_ordinal(date)
+        if ordinal is None:
+            self.coverage[pair_code] = coverage
+            _add_supplier(self.other_suppliers, (pair_code, date), supplier)
+        else:
+            self.coverage[pair_code] = coverage | (1 << ordinal)
+            _add_supplier(self.suppliers, pack_key(pair_code, ordinal), supplier)
+
+    def get(self, key: SearchKey) -> Optional[List[Any]]:
+        """
+        查找单条数据的供应商
+
+        参数:
+            key: 标准化后的(日期, 客户, 产品)
+
+        返回:
+            Optional[List]: 供应商列表，没有匹配时返回None
+        """
+        date, customer, product = key
+        pair_code = self.codec.find_pair(customer, product)
+        if pair_code is None:
+            return None
+
+        ordinal = month_ordinal(date)
+        if ordinal is None:
+            suppliers = self.other_suppliers.get((pair_code, date), _MISSING)
+        else:
+            suppliers = self.suppliers.get((pair_code << MONTH_BITS) | ordinal, _MISSING)
+
+        if suppliers is _MISSING:
+            return None
+        return suppliers if type(suppliers) is list else [suppliers]
+
+    def match_range(self, pair: PairKey, dates: str) -> Tuple[List[Tuple[str, Any]], bool]:
+        """
+        匹配日期范围数据
+
+        按日期范围中的月份顺序收集各月份的供应商，并判断是否所有月份都有匹配。
+
+        参数:
+            pair: (客户名称, 产品名称)
+            dates: 逗号分隔的标准化日期，如"202403,202404,202405"
+
+        返回:
+            Tuple[List[Tuple[str, Any]], bool]: (匹配到的(日期, 供应商)列表, 是否所有月份都有匹配)
+        """
+        pair_code = self.codec.find_pair(*pair)
+        coverage = self.coverage.get(pair_code)
+        if coverage is None:
+            return [], False
+
+        months = month_mask(dates)
+        covered_bits = months.bits & coverage
+        all_covered = covered_bits == months.bits and all(
+            (pair_code, date) in self.other_suppliers for date in months.others
+        )
+
+        matched: List[Tuple[str, Any]] = []
+        if covered_bits or months.others:
+            base = pair_code << MONTH_BITS
+            for date in dates.split(','):
+                ordinal = month_ordinal(date)
+                if ordinal is None:
+                    suppliers = self.other_suppliers.get((pair_code, date), _MISSING)
+                    if suppliers is _MISSING:
+                        continue
+                elif covered_bits >> ordinal & 1:
+                    suppliers = self.suppliers[base | ordinal]
+                else:
+                    continue
+
+                if type(suppliers) is list:
+                    matched.extend((date, supplier) for supplier in suppliers)
+                else:
+                    matched.append((date, suppliers))
+
+        return matched, all_covered
+
+    def prefetch(self, keys: Iterable[SearchKey]):
+        """
+        预取一批搜索键所需的数据
+
+        内存索引的数据都已在内存中，无需预取。按批查询的存储实现
+        （见core.sqlite_reference_index）会在这里一次取出整批数据。
+
+        参数:
+            keys: 即将匹配的搜索键
+        """
+
+    def close(self):
+        """
+        释放索引占用的资源（内存索引无需释放）
+        """
+
+    def __len__(self) -> int:
+        """
+        索引中的键数量
+        """
+        return len(self.suppliers) + len(self.other_suppliers)
+
+
+def _add_supplier(suppliers: Dict[Any, Any], key: Any, supplier: Any):
+    """
+    向供应商字典中添加一条记录
+
+    第一个供应商直接保存，出现第二个供应商时才转换为列表。
+    单元格的值不会是列表，可以据此区分两种形式。
+
+    参数:
+        suppliers: 供应商字典
+        key: 键
+        supplier: 供应商
+    """
+    existing = suppliers.get(key, _MISSING)
+    if existing is _MISSING:
+        suppliers[key] = supplier
+    elif type(existing) is list:
+        existing.append(supplier)
+    else:
+        suppliers[key] = [existing, supplier]
+
+
+def match_pair_range(
+    months_by_date: Dict[str, List[Any]], coverage: int, dates: str
+) -> Tuple[List[Tuple[str, Any]], bool]:
+    """
+    在一个(客户, 产品)的数据中匹配日期范围
+
+    用于按(客户, 产品)分组、以日期字符串为键保存数据的索引（见core.sqlite_reference_index）。
+
+    参数:
+        months_by_date: 该(客户, 产品)按日期索引的供应商列表
+        coverage: 该(客户, 产品)覆盖的月份位图
+        dates: 逗号分隔的标准化日期
+
+    返回:
+        Tuple[List[Tuple[str, Any]], bool]: (匹配到的(日期, 供应商)列表, 是否所有月份都有匹配)
+    """
+    months = month_mask(dates)
+    covered_bits = months.bits & coverage
+    all_covered = covered_bits == months.bits and all(
+        date in months_by_date for date in months.others
+    )
+
+    matched: List[Tuple[str, Any]] = []
+    if covered_bits or months.others:
+        for date in dates.split(','):
+            suppliers = months_by_date.get(date)
+            if suppliers is not None:
+                matched.extend((date, supplier) for supplier in suppliers)
+
+    return matched, all_covered
@@ -0,0 +1,285 @@
+"""
+SQLite匹配原表索引模块
+
+当匹配原表有数百万行时，内存中的ReferenceIndex可能超出办公电脑的内存。
+本模块把标准化后的(日期, 客户, 产品, 供应商)批量写入一个临时的SQLite数据库，
+并建立(客户, 产品)复合索引。匹配时按批预取：每批待匹配数据涉及的(客户, 产品)
+通过IN (...)分块查询一次取出，内存中只保留最近使用的若干组数据。
+
+主要功能:
+- 从匹配原表数据行批量构建SQLite索引 (SqliteReferenceIndex.from_rows)
+- 按批预取待匹配数据所需的(客户, 产品) (SqliteReferenceIndex.prefetch)
+- 与ReferenceIndex相同的查询接口 (get, match_range)
+
+说明:
+    数据库为SQLite的私有临时数据库（文件名为空），超出页缓存的数据写入临时目录，
+    连接关闭后自动删除。
+
+作者: 供应商数据智能匹配系统开发团队
+版本: 1.0
+"""
+
+import logging
+import pickle
+import sqlite3
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .date_parser import month_ordinal
+from .duplicate_tracker import PairKey, SearchKey
+from .parallel_standardizer import ParallelStandardizer, iter_keyed_rows
+from .reference_index import match_pair_range
+
+# 批量写入的行数
+_INSERT_BATCH_SIZE = 10000
+
+# 单条IN (...)查询的参数个数上限（低于SQLite默认的999）
+_QUERY_CHUNK_SIZE = 500
+
+# 内存中保留的(客户, 产品)组数上限
+DEFAULT_PAIR_CACHE_SIZE = 20000
+
+# SQLite页缓存大小（KB）
+_PAGE_CACHE_KB = 65536
+
+# 客户与产品之间的分隔符，Excel单元格中不允许出现该控制字符
+_PAIR_SEPARATOR = '\x1f'
+
+# 供应商值的存储方式：SQLite原生类型 / pickle序列化（日期时间等其他类型）
+_SUPPLIER_NATIVE = 0
+_SUPPLIER_PICKLED = 1
+_NATIVE_TYPES = (str, int, float, type(None))
+
+# 一组(客户, 产品)的数据：(按日期索引的供应商列表, 月份位图)
+PairData = Tuple[Dict[str, List[Any]], int]
+
+_EMPTY_PAIR: PairData = ({}, 0)
+
+
+class SqliteReferenceIndex:
+    """
+    基于SQLite的匹配原表索引
+
+    查询接口与ReferenceIndex相同，可以直接传给MatchEngine。
+    MatchEngine在每批数据匹配前调用prefetch，之后的get和match_range都从内存中的分组数据读取。
+
+    示例:
+        >>> index = SqliteReferenceIndex.from_rows(sheet2_rows)
+        >>> engine = MatchEngine(index)
+        >>> ...
+        >>> index.close()
+    """
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        key_count: int,
+        pair_cache_size: int = DEFAULT_PAIR_CACHE_SIZE
+    ):
+        """
+        初始化索引
+
+        参数:
+            connection: 已写入数据并建立索引的数据库连接
+            key_count: 数据库中不同(日期, 客户, 产品)的数量
+            pair_cache_size: 内存中保留的(客户, 产品)组数上限，至少为1
+        """
+        if pair_cache_size < 1:
+            raise ValueError(f"缓存组数必须大于0: {pair_cache_size}")
+
+        self._connection = connection
+        self._key_count = key_count
+        self._pair_cache_size = pair_cache_size
+        self._pairs: 'OrderedDict[str, PairData]' = OrderedDict()
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Sequence[Any]],
+        pair_cache_size: int = DEFAULT_PAIR_CACHE_SIZE,
+        standardizer: Optional[ParallelStandardizer] = None
+    ) -> 'SqliteReferenceIndex':
+        """
+        从匹配原表数据行构建索引
+
+        逐行标准化后分批写入数据库，全部写入后再建立索引，并沿索引统计一次键的数量，
+        内存占用与匹配原表的行数无关。
+
+        参数:
+            rows: 匹配原表的数据行（不含标题行），每行至少包含4个值
+            pair_cache_size: 内存中保留的(客户, 产品)组数上限
+            standardizer: 可选的并行标准化器，为None时在当前进程中标准化
+
+        返回:
+            SqliteReferenceIndex: 构建好的索引
+        """
+        connection = sqlite3.connect('')
+        connection.execute(f"PRAGMA cache_size = -{_PAGE_CACHE_KB}")
+        connection.execute("PRAGMA journal_mode = OFF")
+        connection.execute("PRAGMA synchronous = OFF")
+        connection.execute(
+            "CREATE TABLE reference ("
+            "seq INTEGER PRIMARY KEY, pair TEXT NOT NULL, date TEXT NOT NULL, "
+            "supplier, kind INTEGER NOT NULL)"
+        )
+
+        total = 0
+        batch: List[Tuple[str, str, Any, int]] = []
+        with connection:
+            for row, (date, customer, product) in iter_keyed_rows(rows, standardizer):
+                batch.append((customer + _PAIR_SEPARATOR + product, date) + _encode_supplier(row[3]))
+                if len(batch) >= _INSERT_BATCH_SIZE:
+                    connection.executemany(
+                        "INSERT INTO reference (pair, date, supplier, kind) VALUES (?, ?, ?, ?)", batch
+                    )
+                    total += len(batch)
+                    batch.clear()
+
+            if batch:
+                connection.executemany(
+                    "INSERT INTO reference (pair, date, supplier, kind) VALUES (?, ?, ?, ?)", batch
+                )
+                total += len(batch)
+
+            connection.execute("CREATE INDEX idx_reference_pair ON reference (pair, date)")
+
+        # 刚建立的索引按(pair, date)有序，统计不同的键只需顺序扫描一次索引
+        key_count = connection.execute(
+            "SELECT COUNT(*) FROM (SELECT DISTINCT pair, date FROM reference)"
+        ).fetchone()[0]
+
+        logging.info(f"匹配原表已写入SQLite索引，共 {total} 行，{key_count} 个键")
+        return cls(connection, key_count, pair_cache_size)
+
+    def get(self, key: SearchKey) -> Optional[List[Any]]:
+        """
+        查找单条数据的供应商
+
+        参数:
+            key: 标准化后的(日期, 客户, 产品)
+
+        返回:
+            Optional[List]: 供应商列表，没有匹配时返回None
+        """
+        return self._pair_data(key[1:])[0].get(key[0])
+
+    def match_range(self, pair: PairKey, dates: str) -> Tuple[List[Tuple[str, Any]], bool]:
+        """
+        匹配日期范围数据
+
+        参数:
+            pair: (客户名称, 产品名称)
+            dates: 逗号分隔的标准化日期，如"202403,202404,202405"
+
+        返回:
+            Tuple[List[Tuple[str, Any]], bool]: (匹配到的(日期, 供应商)列表, 是否所有月份都有匹配)
+        """
+        months_by_date, coverage = self._pair_data(pair)
+        if not months_by_date:
+            return [], False
+        return match_pair_range(months_by_date, coverage, dates)
+
+    def prefetch(self, keys: Iterable[SearchKey]):
+        """
+        预取一批搜索键涉及的(客户, 产品)数据
+
+        已在内存中的(客户, 产品)标记为最近使用，其余的按_QUERY_CHUNK_SIZE分块，
+        每块一次IN (...)查询。
+
+        参数:
+            keys: 即将匹配的搜索键
+        """
+        pairs = self._pairs
+        missing = []
+        seen = set()
+        for key in keys:
+            pair = key[1] + _PAIR_SEPARATOR + key[2]
+            if pair in seen:
+                continue
+            seen.add(pair)
+            if pair in pairs:
+                pairs.move_to_end(pair)
+            else:
+                missing.append(pair)
+
+        for start in range(0, len(missing), _QUERY_CHUNK_SIZE):
+            self._load_pairs(missing[start:start + _QUERY_CHUNK_SIZE])
+
+    def close(self):
+        """
+        关闭数据库连接，临时数据库随之删除
+        """
+        self._pairs.clear()
+        self._connection.close()
+
+    def __len__(self) -> int:
+        """
+        索引中的键数量（构建索引时统计）
+        """
+        return self._key_count
+
+    def _pair_data(self, pair: PairKey) -> PairData:
+        """
+        获取一组(客户, 产品)的数据，未预取时单独查询
+
+        参数:
+            pair: (客户名称, 产品名称)
+
+        返回:
+            PairData: (按日期索引的供应商列表, 月份位图)
+        """
+        pair_key = pair[0] + _PAIR_SEPARATOR + pair[1]
+        data = self._pairs.get(pair_key)
+        if data is None:
+            self._load_pairs([pair_key])
+            data = self._pairs[pair_key]
+        return data
+
+    def _load_pairs(self, pair_keys: List[str]):
+        """
+        从数据库读取若干组(客户, 产品)的数据并放入内存缓存
+
+        参数:
+            pair_keys: 组合后的(客户, 产品)键，数量不超过_QUERY_CHUNK_SIZE
+        """
+        loaded: Dict[str, Dict[str, List[Any]]] = {pair_key: {} for pair_key in pair_keys}
+        placeholders = ','.join('?' * len(pair_keys))
+        cursor = self._connection.execute(
+            f"SELECT pair, date, supplier, kind FROM reference "
+            f"WHERE pair IN ({placeholders}) ORDER BY seq",
+            pair_keys
+        )
+        for pair_key, date, supplier, kind in cursor:
+            if kind == _SUPPLIER_PICKLED:
+                supplier = pickle.loads(supplier)
+            loaded[pair_key].setdefault(date, []).append(supplier)
+
+        for pair_key, months_by_date in loaded.items():
+            coverage = 0
+            for date in months_by_date:
+                ordinal = month_ordinal(date)
+                if ordinal is not None:
+                    coverage |= 1 << ordinal
+            self._pairs[pair_key] = (months_by_date, coverage) if months_by_date else _EMPTY_PAIR
+
+        # 超出上限时淘汰最久未使用的组
+        while len(self._pairs) > self._pair_cache_size:
+            self._pairs.popitem(last=False)
+
+
+def _encode_supplier(supplier: Any) -> Tuple[Any, int]:
+    """
+    将供应商值转换为可写入SQLite的形式
+
+    字符串、数字和空值直接保存，其他类型（如日期时间、布尔值）通过pickle序列化，
+    读取后与原值完全相同。
+
+    参数:
+        supplier: 供应商单元格的原始值
+
+    返回:
+        Tuple[Any, int]: (写入的值, 存储方式)
+    """
+    if type(supplier) in _NATIVE_TYPES:
+        return supplier, _SUPPLIER_NATIVE
+    return pickle.dumps(supplier, protocol=pickle.HIGHEST_PROTOCOL), _SUPPLIER_PICKLED
@@ -0,0 +1,879 @@
+"""
+工作簿分析模块
+
+本模块提供与界面无关的完整工作簿分析流程：加载Excel文件、匹配数据、
+标记样式、写入结果工作表并保存（写回原文件或另存为新工作簿）。图形界面的后台线程和命令行批处理
+都调用同一个analyze_workbook函数，保证两条路径的输出完全一致。
+
+主要功能:
+- 执行单个工作簿的完整分析流程 (analyze_workbook)
+- 支持写回原文件和单独输出两种模式 (OUTPUT_IN_PLACE / OUTPUT_SEPARATE)
+- 通过AnalysisProgress共享进度计数器
+- 通过threading.Event支持协作式取消 (AnalysisCancelled)
+- 可选地使用磁盘缓存的匹配原表索引 (core.index_cache)
+- 可选地将匹配原表存入SQLite临时数据库，适用于超出内存的匹配原表 (REFERENCE_SQLITE)
+- 可选地使用基于NumPy的批量匹配引擎 (MATCH_BATCH，见core.batch_match_engine)
+- 可选地按(客户, 产品)分区在多个进程中并行匹配 (MATCH_PARTITIONED，见core.partitioned_match_engine)
+- 可选地以状态列加条件格式标记颜色，代替逐个单元格设置样式 (STYLE_CONDITIONAL)
+- 可选地增量分析：只重新匹配上次分析后可能变化的行 (见core.analysis_state)
+- 可选地在进程池中并行标准化两个工作表 (见core.parallel_standardizer)
+- 可选地以有界队列连接的读取、标准化、匹配、写出流水线进行单独输出 (见core.pipeline)
+- 分阶段计时并统计日期范围行、重复行和匹配原表键数，分析结束后写入一行日志摘要 (见core.instrumentation)
+
+作者: 供应商数据智能匹配系统开发团队
+版本: 1.0
+"""
+
+import logging
+import os
+import threading
+import time
+from operator import attrgetter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, TypeVar
+
+from openpyxl import Workbook
+
+from .analysis_state import (
+    AnalysisState, AnalysisStateStore, RowState, pair_fingerprint, row_fingerprint
+)
+from .data_models import MatchResult, MatchStatus
+from .data_standardizer import (
+    cache_stats_delta, expire_standardize_cache, get_standardize_cache_stats, standardize_row
+)
+from .duplicate_tracker import SearchKey
+from .excel_processor import (
+    CellStyler, SheetRow, open_workbook, iter_sheet_rows, iter_sheet_values, iter_reference_rows,
+    standardize_sheet_values, copy_title_row, init_result_sheet, find_column, find_or_add_column,
+    set_status_formatting, remove_status_formatting
+)
+from .batch_match_engine import BatchMatchEngine
+from .index_cache import ReferenceIndexCache, reference_fingerprint
+from .instrumentation import PhaseTimer, format_summary
+from .match_engine import MatchEngine, determine_status
+from .parallel_standardizer import ParallelStandardizer
+from .partitioned_match_engine import PartitionedMatchEngine
+from .pipeline import ThreadedReader, ThreadedWriter
+from .reference_index import ReferenceIndex
+from .sqlite_reference_index import SqliteReferenceIndex
+
+T = TypeVar('T')
+
+# 输出模式：结果写回原文件 / 写入单独的新工作簿
+OUTPUT_IN_PLACE = 'in_place'
+OUTPUT_SEPARATE = 'separate'
+
+# 匹配原表索引的存储方式：内存 / SQLite临时数据库
+REFERENCE_MEMORY = 'memory'
+REFERENCE_SQLITE = 'sqlite'
+
+# 匹配方式：逐行匹配 / 整列批量匹配（需要NumPy，未安装时自动退回逐行匹配）/
+# 按(客户, 产品)分区并行匹配（只支持内存索引，否则自动退回逐行匹配）
+MATCH_ROW = 'row'
+MATCH_BATCH = 'batch'
+MATCH_PARTITIONED = 'partitioned'
+
+# 待匹配表的颜色标记方式：逐个单元格设置样式 / 写入状态列并添加条件格式规则
+STYLE_CELLS = 'cells'
+STYLE_CONDITIONAL = 'conditional'
+
+# 条件格式模式下待匹配表状态列的标题
+STATUS_COLUMN_TITLE = '匹配状态'
+
+# 单独输出模式下结果工作簿的文件名后缀
+RESULT_FILE_SUFFIX = '_匹配结果'
+
+# 从SheetRow中取出标准化搜索键
+_SEARCH_KEY = attrgetter('key')
+
+# 一行的分析结果：(行号, 前三列原始值, 状态码, 写入"匹配到的数据"的供应商，未匹配时为空)
+_RowOutcome = Tuple[int, Tuple[str, str, str], str, Sequence[Any]]
+
+# 增量分析中的一行：(行号, 前三列原始值, 行指纹, (客户, 产品)指纹, 沿用的(状态码, 供应商)，需要重新匹配时为None)
+_PlannedRow = Tuple[int, Tuple[str, str, str], int, int, Optional[Tuple[str, Sequence[Any]]]]
+
+
+class AnalysisCancelled(Exception):
+    """
+    分析取消异常
+
+    当调用方请求取消分析时，在检查点抛出，用于中断处理流程。
+    抛出该异常时工作簿尚未保存，原文件保持不变。
+    """
+
+
+class AnalysisProgress:
+    """
+    分析进度计数器
+
+    分析线程只写、观察方只读的简单计数器，观察方可以按自己的节奏轮询，
+    无需为每一行发送通知。
+
+    属性:
+        total_rows (int): 待匹配的数据总行数，未知时为0
+        processed_rows (int): 已处理的数据行数
+    """
+
+    def __init__(self):
+        """初始化进度计数器"""
+        self.total_rows = 0
+        self.processed_rows = 0
+
+
+def result_file_path(file_path: str) -> str:
+    """
+    计算单独输出模式下结果工作簿的路径
+
+    结果工作簿与输入文件位于同一目录，文件名为"原文件名_匹配结果.xlsx"。
+
+    参数:
+        file_path: 输入Excel文件路径
+
+    返回:
+        str: 结果工作簿路径
+
+    示例:
+        >>> result_file_path("D:/数据/三月.xlsx")
+        'D:/数据/三月_匹配结果.xlsx'
+    """
+    stem, _ = os.path.splitext(file_path)
+    return f"{stem}{RESULT_FILE_SUFFIX}.xlsx"
+
+
+def analyze_workbook(
+    file_path: str,
+    progress: Optional[AnalysisProgress] = None,
+    cancel_event: Optional[threading.Event] = None,
+    output_mode: str = OUTPUT_IN_PLACE,
+    index_cache: Optional[ReferenceIndexCache] = None,
+    reference_backend: str = REFERENCE_MEMORY,
+    match_mode: str = MATCH_ROW,
+    style_mode: str = STYLE_CELLS,
+    state_store: Optional[AnalysisStateStore] = None,
+    standardizer: Optional[ParallelStandardizer] = None,
+    match_workers: Optional[int] = None,
+    pipeline: bool = False
+) -> Dict[str, Any]:
+    """
+    分析单个工作簿
+
+    执行完整的数据分析流程:
+        1. 加载Excel文件
+        2. 检查工作表数量
+        3. 构建匹配引擎并逐行匹配
+        4. 写入结果并保存（保存前最后一次检查取消请求）
+
+    两种输出模式:
+        - OUTPUT_IN_PLACE: 在待匹配表上标记颜色，结果工作表写回原文件
+        - OUTPUT_SEPARATE: 以只读模式流式读取原文件，结果工作表以write_only模式
+          写入同目录下的新工作簿(见result_file_path)，原文件不会被修改，
+          保存开销只与结果规模相关。该模式不标记待匹配表的颜色。
+
+    流水线（pipeline=True，只用于OUTPUT_SEPARATE）:
+        读取待匹配表（解压和解析XML）、标准化和写出结果分别在后台线程中进行，
+        当前线程只负责匹配，各阶段之间用有界队列连接（见core.pipeline）。
+        待匹配表不会被一次读入内存，内存占用与行数无关
+        （MATCH_BATCH需要先读入全部数据行，仍与行数相关；MATCH_PARTITIONED分块读入）。
+        结果与不使用流水线时完全相同。
+
+    两种颜色标记方式（只用于OUTPUT_IN_PLACE）:
+        - STYLE_CELLS: 逐个设置待匹配表前三列单元格的填充和字体颜色
+        - STYLE_CONDITIONAL: 在待匹配表末尾的"匹配状态"列写入状态码（见MatchStatus），
+          并添加每种状态一条的条件格式规则显示相同的颜色。不修改单元格样式，
+          但多出一列；由于STYLE_CELLS已共享样式对象（见CellStyler），文件大小和保存时间基本相同
+
+    增量分析（传入state_store，只用于OUTPUT_IN_PLACE）:
+        保存后把每一行的分析结果写入状态存储（见core.analysis_state）。再次分析同一工作簿时，
+        如果匹配原表没有变化，只重新匹配内容有变化的行所在的(客户, 产品)，
+        其余行直接沿用上次的结果；匹配原表、标准化规则或年份变化时自动进行完整分析。
+        结果与完整分析完全相同。
+
+    参数:
+        file_path: Excel文件路径，第一个工作表为待匹配表，第二个为匹配原表
+        progress: 可选的进度计数器
+        cancel_event: 可选的取消事件，被设置后在下一个检查点抛出AnalysisCancelled
+        output_mode: 输出模式，OUTPUT_IN_PLACE或OUTPUT_SEPARATE
+        index_cache: 可选的匹配原表索引缓存，匹配原表未变化时跳过预处理
+            （只用于内存索引）
+        reference_backend: 匹配原表索引的存储方式，REFERENCE_MEMORY或REFERENCE_SQLITE
+        match_mode: 匹配方式，MATCH_ROW、MATCH_BATCH或MATCH_PARTITIONED
+        style_mode: 颜色标记方式，STYLE_CELLS或STYLE_CONDITIONAL
+        state_store: 可选的增量分析状态存储，为None时进行完整分析
+        standardizer: 可选的并行标准化器，用于待匹配表和匹配原表的标准化，
+            为None时在当前进程中标准化（进程池由调用方创建和关闭）
+        match_workers: MATCH_PARTITIONED使用的进程数，默认为CPU核心数
+        pipeline: 单独输出时是否使用流水线
+
+    返回:
+        包含统计信息的字典，包括total, matched, unmatched, rate, output_file，
+        标准化缓存的cache_hits, cache_misses, cache_hit_rate，
+        匹配原表索引是否命中缓存index_cache_hit，沿用上次结果的行数reused_rows，
+        相同搜索键复用结果省去的查找次数lookups_saved，
+        日期范围行数range_rows（全部匹配和部分匹配），重复行数duplicate_rows，
+        匹配原表索引的键数reference_keys（没有需要匹配的行、未构建索引时为0），
+        各阶段耗时phase_seconds（见core.instrumentation.PHASES），
+        总耗时elapsed（秒）和吞吐量rows_per_second
+
+    异常:
+        ValueError: 工作表数量不足、待匹配表没有数据、输出模式、索引存储方式、匹配方式或颜色标记方式无效
+        AnalysisCancelled: 分析被取消
+    """
+    if output_mode not in (OUTPUT_IN_PLACE, OUTPUT_SEPARATE):
+        raise ValueError(f"无效的输出模式: {output_mode}")
+    if reference_backend not in (REFERENCE_MEMORY, REFERENCE_SQLITE):
+        raise ValueError(f"无效的索引存储方式: {reference_backend}")
+    if match_mode not in (MATCH_ROW, MATCH_BATCH, MATCH_PARTITIONED):
+        raise ValueError(f"无效的匹配方式: {match_mode}")
+    if style_mode not in (STYLE_CELLS, STYLE_CONDITIONAL):
+        raise ValueError(f"无效的颜色标记方式: {style_mode}")
+
+    # 只有月份的日期按当前年份补全，跨年后缓存中的标准化结果失效
+    expire_standardize_cache()
+
+    start = time.perf_counter()
+    analyzer = _WorkbookAnalyzer(
+        progress or AnalysisProgress(), cancel_event, index_cache, reference_backend, match_mode,
+        style_mode, state_store, standardizer, match_workers, pipeline
+    )
+    if output_mode == OUTPUT_SEPARATE:
+        stats = analyzer.run_separate(file_path)
+    else:
+        stats = analyzer.run_in_place(file_path)
+
+    # 各阶段耗时和吞吐量，并以一行结构化摘要写入日志
+    elapsed = time.perf_counter() - start
+    stats['phase_seconds'] = analyzer.timer.as_dict()
+    stats['elapsed'] = round(elapsed, 4)
+    stats['rows_per_second'] = round(stats['total'] / elapsed, 1) if elapsed > 0 else 0.0
+    logging.info(f"分析统计: {format_summary(stats)}")
+    return stats
+
+
+class _WorkbookAnalyzer:
+    """
+    单次工作簿分析的执行器
+
+    持有进度计数器和取消事件，把取消检查点和进度更新织入数据读取过程，
+    并用timer记录各阶段的耗时。
+    """
+
+    def __init__(
+        self,
+        progress: AnalysisProgress,
+        cancel_event: Optional[threading.Event],
+        index_cache: Optional[ReferenceIndexCache] = None,
+        reference_backend: str = REFERENCE_MEMORY,
+        match_mode: str = MATCH_ROW,
+        style_mode: str = STYLE_CELLS,
+        state_store: Optional[AnalysisStateStore] = None,
+        standardizer: Optional[ParallelStandardizer] = None,
+        match_workers: Optional[int] = None,
+        pipeline: bool = False
+    ):
+        """
+        初始化执行器
+
+        参数:
+            progress: 进度计数器
+            cancel_event: 取消事件，可以为None
+            index_cache: 匹配原表索引缓存，可以为None
+            reference_backend: 匹配原表索引的存储方式
+            match_mode: 匹配方式
+            style_mode: 颜色标记方式
+            state_store: 增量分析状态存储，可以为None（只用于写回原文件）
+            standardizer: 并行标准化器，可以为None
+            match_workers: 分区并行匹配的进程数，为None时使用CPU核心数
+            pipeline: 是否使用流水线（只用于单独输出）
+        """
+        self.progress = progress
+        self.cancel_event = cancel_event
+        self.index_cache = index_cache
+        self.reference_backend = reference_backend
+        self.match_mode = match_mode
+        self.style_mode = style_mode
+        self.state_store = state_store
+        self.standardizer = standardizer
+        self.match_workers = match_workers
+        self.pipeline = pipeline
+        self.timer = PhaseTimer()
+
+    def _check_cancelled(self):
+        """
+        取消检查点
+
+        如果已请求取消，抛出AnalysisCancelled异常中断处理。
+        """
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise AnalysisCancelled()
+
+    def run_in_place(self, file_path: str) -> Dict[str, Any]:
+        """
+        执行分析并将结果写回原文件
+
+        参数:
+            file_path: Excel文件路径
+
+        返回:
+            包含统计信息的字典
+        """
+        # 加载工作簿（结果需要写回原文件并标记样式，因此使用完整模式）
+        with self.timer.phase('load'):
+            workbook = open_workbook(file_path, read_only=False)
+        logging.info(f"工作簿包含的工作表: {workbook.sheetnames}")
+        self._check_cancelled()
+
+        # 检查工作表数量
+        if len(workbook.worksheets) < 2:
+            raise ValueError("工作簿中缺少必要的工作表")
+
+        # 获取工作表
+        sheet1 = workbook.worksheets[0]  # 待匹配表
+        sheet2 = workbook.worksheets[1]  # 匹配原表
+
+        # 增量分析：读取上次的状态，匹配原表变化时不使用
+        reference = previous = None
+        if self.state_store is not None:
+            with self.timer.phase('preprocess'):
+                reference = reference_fingerprint(self._cancellable(iter_reference_rows(sheet2)))
+                previous = self.state_store.load_state(file_path)
+            if previous is not None and previous.reference != reference:
+                logging.info("匹配原表或标准化规则已变化，进行完整分析")
+                previous = None
+
+        with self.timer.phase('write'):
+            sheet3 = init_result_sheet(workbook, "匹配到的数据")
+            sheet4 = init_result_sheet(workbook, "未找到的数据")
+
+            # 初始化结果表
+            copy_title_row(sheet1, sheet3)
+            copy_title_row(sheet1, sheet4)
+            sheet3.cell(row=1, column=4, value="供应商")
+            sheet4.cell(row=1, column=4, value="供应商")
+
+        # 处理数据
+        state_rows: Optional[List[RowState]] = [] if self.state_store is not None else None
+        stats = self._process_data(
+            sheet1, sheet2, sheet3, sheet4, style_sheet=True,
+            reference=reference, previous=previous, state_rows=state_rows
+        )
+
+        # 保存结果，开始保存后不再响应取消，避免写出不完整的文件
+        self._check_cancelled()
+        with self.timer.phase('save'):
+            workbook.save(file_path)
+
+            # 保存成功后才记录本次的状态
+            if state_rows is not None:
+                self.state_store.store_state(file_path, AnalysisState(reference, state_rows))
+
+        stats['output_file'] = file_path
+        return stats
+
+    def run_separate(self, file_path: str) -> Dict[str, Any]:
+        """
+        执行分析并将结果写入单独的新工作簿
+
+        原文件以只读模式流式读取，结果以write_only模式流式写出。
+        使用流水线时读取、标准化和写出在后台线程中进行。
+
+        参数:
+            file_path: Excel文件路径
+
+        返回:
+            包含统计信息的字典
+        """
+        output_file = result_file_path(file_path)
+
+        with self.timer.phase('load'):
+            source = open_workbook(file_path, read_only=True)
+        try:
+            logging.info(f"工作簿包含的工作表: {source.sheetnames}")
+            self._check_cancelled()
+
+            # 检查工作表数量
+            if len(source.worksheets) < 2:
+                raise ValueError("工作簿中缺少必要的工作表")
+
+            sheet1 = source.worksheets[0]  # 待匹配表
+            sheet2 = source.worksheets[1]  # 匹配原表
+
+            # 创建结果工作簿，标题行与写回原文件时相同
+            with self.timer.phase('write'):
+                result_workbook = Workbook(write_only=True)
+                sheet3 = result_workbook.create_sheet("匹配到的数据")
+                sheet4 = result_workbook.create_sheet("未找到的数据")
+                header = _result_header(sheet1)
+                sheet3.append(header)
+                sheet4.append(header)
+
+            # 处理数据
+            stats = self._process_data(
+                sheet1, sheet2, sheet3, sheet4, style_sheet=False, pipelined=self.pipeline
+            )
+        finally:
+            source.close()
+
+        # 保存结果，开始保存后不再响应取消，避免写出不完整的文件
+        self._check_cancelled()
+        with self.timer.phase('save'):
+            result_workbook.save(output_file)
+        logging.info(f"结果已保存到: {output_file}")
+
+        stats['output_file'] = output_file
+        return stats
+
+    def _process_data(
+        self, sheet1, sheet2, sheet3, sheet4, style_sheet: bool,
+        pipelined: bool = False,
+        reference: Optional[str] = None,
+        previous: Optional[AnalysisState] = None,
+        state_rows: Optional[List[RowState]] = None
+    ) -> Dict[str, Any]:
+        """
+        处理数据匹配逻辑
+
+        执行数据匹配流程，包括:
+        1. 构建匹配引擎（预处理匹配原表）
+        2. 逐行分析匹配（增量分析时只匹配可能变化的行）
+        3. 应用样式标记（可选）
+        4. 分类结果
+
+        只读模式下待匹配表在逐行匹配时按需读取和标准化，读取时间计入match阶段；
+        匹配时间为逐行循环的总时间减去其中标记颜色和写入结果的时间。
+
+        参数:
+            sheet1: 待匹配表
+            sheet2: 匹配原表
+            sheet3: 匹配结果表（标题行已写入）
+            sheet4: 未匹配结果表（标题行已写入）
+            style_sheet: 是否在待匹配表上标记颜色，只读工作表必须为False
+            pipelined: 是否在后台线程中读取、标准化待匹配表和写出结果，
+                只用于不标记颜色的完整分析
+            reference: 匹配原表指纹，已计算时用作索引缓存键
+            previous: 上次分析的状态，为None时匹配所有行
+            state_rows: 不为None时按行追加本次分析的行状态
+
+        返回:
+            包含统计信息的字典，包括total, matched, unmatched, rate，
+            标准化缓存的cache_hits, cache_misses, cache_hit_rate，index_cache_hit，reused_rows，
+            相同搜索键复用结果省去的查找次数lookups_saved，
+            以及range_rows, duplicate_rows, reference_keys
+        """
+        logging.info("开始处理数据")
+        timer = self.timer
+        cache_before = get_standardize_cache_stats()
+
+        # 发布总行数（只读模式下工作表可能没有尺寸信息，此时保持未知）
+        if sheet1.max_row:
+            self.progress.total_rows = max(sheet1.max_row - 1, 0)
+
+        # 确定需要匹配的行，增量分析时其余行沿用上次的结果
+        if state_rows is None:
+            rows_to_match: Iterable[SheetRow] = self._iter_sheet1_rows(sheet1, pipelined)
+            plan = None
+        else:
+            with timer.phase('match'):
+                plan, rows_to_match = self._plan_incremental(sheet1, previous)
+
+        # 预处理匹配数据（匹配原表未变化时直接加载缓存的索引；没有需要匹配的行时跳过）
+        index, index_cache_hit, engine = None, False, None
+        reference_keys = 0
+        results: Iterator[Tuple[SheetRow, MatchResult]] = iter(())
+        if plan is None or rows_to_match:
+            with timer.phase('preprocess'):
+                index, index_cache_hit = self._build_index(sheet2, reference)
+                reference_keys = len(index)
+                engine = self._create_engine(index)
+            results = engine.match(rows_to_match, key=_SEARCH_KEY)
+
+        if plan is None:
+            outcomes = (
+                (sheet_row.row, sheet_row.values, determine_status(result), _result_suppliers(result))
+                for sheet_row, result in results
+            )
+        else:
+            outcomes = self._merge_incremental(plan, results, state_rows)
+
+        styler = status_column = None
+        if style_sheet:
+            with timer.phase('style'):
+                if self.style_mode == STYLE_CONDITIONAL:
+                    status_column = find_or_add_column(sheet1, STATUS_COLUMN_TITLE)
+                else:
+                    styler = CellStyler(sheet1.parent)
+                    _remove_status_column(sheet1)
+
+        # 结果行在后台线程中写出，或者直接写出
+        writer = ThreadedWriter(_append_row, name='写出结果') if pipelined else None
+        append = writer.put if writer is not None else _append_row
+
+        matched_count = 0
+        unmatched_count = 0
+        last_row = 1
+        status_counts: Dict[str, int] = {}
+
+        # 逐行循环中分别累计标记颜色和写入结果的时间，其余时间计为匹配
+        perf_counter = time.perf_counter
+        style_seconds = write_seconds = 0.0
+        loop_start = perf_counter()
+
+        try:
+            for row, values, status, suppliers in outcomes:
+                # 进度按已匹配的行计算（批量和分区并行匹配先读入数据，读取不计入进度）
+                self._check_cancelled()
+                self.progress.processed_rows = row - 1
+                status_counts[status] = status_counts.get(status, 0) + 1
+                style_start = perf_counter()
+
+                # 应用样式
+                if status_column is not None:
+                    sheet1.cell(row=row, column=status_column, value=status)
+                    last_row = row
+                elif style_sheet:
+                    cell_style = MatchStatus.STYLES[status]
+                    for col in range(1, 4):
+                        styler.apply(sheet1.cell(row=row, column=col), cell_style)
+                write_start = perf_counter()
+
+                # 保存结果
+                if suppliers:
+                    matched_count += 1
+                    for supplier in suppliers:
+                        append((sheet3, values + (supplier,)))
+                else:
+                    unmatched_count += 1
+                    append((sheet4, values + ('',)))
+
+                write_end = perf_counter()
+                style_seconds += write_start - style_start
+                write_seconds += write_end - write_start
+
+            timer.add('match', perf_counter() - loop_start - style_seconds - write_seconds)
+            timer.add('style', style_seconds)
+            timer.add('write', write_seconds)
+
+            if writer is not None:
+                with timer.phase('write'):
+                    writer.close()
+        finally:
+            # 出错或取消时停止流水线的后台线程
+            if writer is not None:
+                writer.abort()
+            if engine is not None:
+                results.close()
+            if plan is None:
+                rows_to_match.close()
+            if index is not None:
+                index.close()
+
+        # 相同搜索键复用查找结果的统计
+        lookups_saved = engine.lookups_saved if engine is not None else 0
+        logging.info(f"相同搜索键复用匹配结果: 省去 {lookups_saved} 次查找")
+
+        # 检查数据量
+        if matched_count + unmatched_count == 0:
+            raise ValueError("Sheet1中没有数据需要匹配")
+
+        # 条件格式模式：整个数据区域只添加每种状态一条规则
+        if status_column is not None:
+            with timer.phase('style'):
+                set_status_formatting(sheet1, f"A2:C{last_row}", status_column, MatchStatus.STYLES)
+
+        self.progress.processed_rows = self.progress.total_rows
+
+        # 标准化缓存命中统计（仅统计本次分析）
+        cache = cache_stats_delta(cache_before, get_standardize_cache_stats())
+        logging.info(
+            f"标准化缓存: 命中 {cache.hits} 次，未命中 {cache.misses} 次，"
+            f"命中率 {cache.hit_rate * 100:.1f}%，当前条目 {cache.currsize}/{cache.maxsize}"
+        )
+
+        # 计算统计
+        total = matched_count + unmatched_count
+        rate = (matched_count / total * 100) if total > 0 else 0
+
+        return {
+            'total': total,
+            'matched': matched_count,
+            'unmatched': unmatched_count,
+            'rate': f"{rate:.1f}",
+            'cache_hits': cache.hits,
+            'cache_misses': cache.misses,
+            'cache_hit_rate': f"{cache.hit_rate * 100:.1f}",
+            'index_cache_hit': index_cache_hit,
+            'reused_rows': len(plan) - len(rows_to_match) if plan is not None else 0,
+            'lookups_saved': lookups_saved,
+            'range_rows': (status_counts.get(MatchStatus.ALL_MATCH, 0)
+                           + status_counts.get(MatchStatus.PARTIAL_MATCH, 0)),
+            'duplicate_rows': status_counts.get(MatchStatus.DUPLICATE, 0),
+            'reference_keys': reference_keys
+        }
+
+    def _create_engine(self, index) -> MatchEngine:
+        """
+        按匹配方式创建匹配引擎
+
+        参数:
+            index: 匹配原表索引
+
+        返回:
+            MatchEngine: 匹配引擎
+        """
+        if self.match_mode == MATCH_BATCH:
+            return BatchMatchEngine(index, self._check_cancelled)
+        if self.match_mode == MATCH_PARTITIONED:
+            return PartitionedMatchEngine(index, self.match_workers, self._check_cancelled)
+        return MatchEngine(index, self._check_cancelled)
+
+    def _build_index(self, sheet2, reference: Optional[str] = None):
+        """
+        构建匹配原表索引
+
+        参数:
+            sheet2: 匹配原表
+            reference: 已计算的匹配原表指纹，用作索引缓存键，为None时由缓存自行计算
+
+        返回:
+            (索引, 是否命中索引缓存)
+        """
+        reference_rows = self._cancellable(iter_reference_rows(sheet2))
+        if self.reference_backend == REFERENCE_SQLITE:
+            return SqliteReferenceIndex.from_rows(reference_rows, standardizer=self.standardizer), False
+        if self.index_cache is not None:
+            return self.index_cache.get_or_build(list(reference_rows), reference, self.standardizer)
+        return ReferenceIndex.from_rows(reference_rows, self.standardizer), False
+
+    def _plan_incremental(
+        self, sheet1, previous: Optional[AnalysisState]
+    ) -> Tuple[List[_PlannedRow], List[SheetRow]]:
+        """
+        确定增量分析时需要重新匹配的行
+
+        一行的结果只取决于同一(客户, 产品)中的行和匹配原表。先按指纹把本次的行
+        与上次的行对应起来（见_align_rows），没有对应的新行和上次的行所在的(客户, 产品)
+        标记为受影响，受影响的(客户, 产品)的所有行都重新匹配，其余行沿用上次的状态和供应商。
+
+        参数:
+            sheet1: 待匹配表
+            previous: 上次分析的状态，为None时所有行都需要匹配
+
+        返回:
+            Tuple[List[_PlannedRow], List[SheetRow]]: (按行顺序排列的所有行, 需要重新匹配的行)
+        """
+        old_rows = previous.rows if previous is not None else []
+        entries = [
+            (row, values, row_fingerprint(values))
+            for row, values in self._cancellable(iter_sheet_values(sheet1))
+        ]
+        old_positions = _align_rows([entry[2] for entry in entries], old_rows)
+
+        # 内容有变化的行和上次被删除或修改的行所在的(客户, 产品)都需要重新匹配
+        keys: Dict[int, SearchKey] = {}
+        pairs: List[int] = []
+        dirty_pairs: Set[int] = set()
+        used = [False] * len(old_rows)
+        for position, (_, values, _) in enumerate(entries):
+            old_position = old_positions[position]
+            if old_position is not None:
+                used[old_position] = True
+                pairs.append(old_rows[old_position].pair)
+                continue
+
+            key = keys[position] = standardize_row(values)
+            pairs.append(pair_fingerprint(key[1], key[2]))
+            dirty_pairs.add(pairs[-1])
+
+        dirty_pairs.update(old.pair for old, is_used in zip(old_rows, used) if not is_used)
+
+        # 受影响的(客户, 产品)重新匹配，其余行沿用上次的结果
+        plan: List[_PlannedRow] = []
+        rows_to_match: List[SheetRow] = []
+        for position, (row, values, fingerprint) in enumerate(entries):
+            pair = pairs[position]
+            reused = None
+            if pair in dirty_pairs:
+                key = keys.get(position) or standardize_row(values)
+                rows_to_match.append(SheetRow(row, values, key))
+            else:
+                old_position = old_positions[position]
+                old = old_rows[old_position]
+                reused = (old.status, old.suppliers)
+            plan.append((row, values, fingerprint, pair, reused))
+
+        logging.info(f"增量分析: 共 {len(plan)} 行，重新匹配 {len(rows_to_match)} 行")
+        return plan, rows_to_match
+
+    def _merge_incremental(
+        self,
+        plan: List[_PlannedRow],
+        results: Iterator[Tuple[SheetRow, MatchResult]],
+        state_rows: List[RowState]
+    ) -> Iterator[_RowOutcome]:
+        """
+        按行顺序合并重新匹配的结果和沿用的结果，并记录本次的行状态
+
+        参数:
+            plan: _plan_incremental返回的所有行
+            results: 重新匹配的行的匹配结果，顺序与plan中需要匹配的行相同
+            state_rows: 追加本次行状态的列表
+
+        返回:
+            生成器，每次产出一行的分析结果
+        """
+        for row, values, fingerprint, pair, reused in plan:
+            if reused is None:
+                _, result = next(results)
+                status, suppliers = determine_status(result), _result_suppliers(result)
+            else:
+                status, suppliers = reused
+
+            state_rows.append(RowState(fingerprint, pair, status, tuple(suppliers)))
+            yield row, values, status, suppliers
+
+    def _iter_sheet1_rows(self, sheet1, pipelined: bool = False) -> Iterator[SheetRow]:
+        """
+        流式读取待匹配表
+
+        在每行读取前检查取消请求（进度在匹配后更新，见_process_data）。
+
+        参数:
+            sheet1: 待匹配表
+            pipelined: 是否在后台线程中读取和标准化（读取和标准化各一个线程）
+
+        返回:
+            生成器，每次产出SheetRow（行号、原始值、标准化搜索键）
+        """
+        if pipelined:
+            values = ThreadedReader(
+                (values for _, values in iter_sheet_values(sheet1)), name='读取待匹配表'
+            )
+            sheet_rows = ThreadedReader(
+                standardize_sheet_values(values, standardizer=self.standardizer), name='标准化待匹配表'
+            )
+        else:
+            sheet_rows = iter_sheet_rows(sheet1, standardizer=self.standardizer)
+
+        try:
+            for sheet_row in sheet_rows:
+                self._check_cancelled()
+                yield sheet_row
+        finally:
+            if pipelined:
+                sheet_rows.close()
+                values.close()
+
+    def _cancellable(self, rows: Iterable[T]) -> Iterator[T]:
+        """
+        为数据行迭代添加取消检查点
+
+        参数:
+            rows: 任意数据行迭代器
+
+        返回:
+            生成器，逐个产出数据行，已请求取消时抛出AnalysisCancelled
+        """
+        for row in rows:
+            self._check_cancelled()
+            yield row
+
+
+def _result_header(sheet1) -> List[Any]:
+    """
+    生成结果工作表的标题行
+
+    与copy_title_row加写入"供应商"列的效果相同：复制待匹配表第1行，
+    第4列固定为"供应商"。
+
+    参数:
+        sheet1: 待匹配表（可以是只读工作表）
+
+    返回:
+        List[Any]: 标题行的值列表
+    """
+    header: List[Any] = []
+    for cells in sheet1.iter_rows(min_row=1, max_row=1, values_only=True):
+        header = list(cells)
+
+    header.extend([None] * (4 - len(header)))
+    header[3] = "供应商"
+    return header
+
+
+def _align_rows(fingerprints: List[int], old_rows: List[RowState]) -> List[Optional[int]]:
+    """
+    把本次的行与上次的行按指纹对应起来
+
+    开头和末尾相同的部分按顺序对应，因此插入或删除少量行时前后的行都能对应上；
+    中间部分行数不变时逐行比较（修改了分散的若干行），行数变化时不再对应。
+
+    参数:
+        fingerprints: 本次各行的指纹
+        old_rows: 上次的行状态
+
+    返回:
+        List[Optional[int]]: 与fingerprints等长，每行对应的上次行位置，没有对应时为None
+    """
+    new_count, old_count = len(fingerprints), len(old_rows)
+    limit = min(new_count, old_count)
+
+    prefix = 0
+    while prefix < limit and fingerprints[prefix] == old_rows[prefix].fingerprint:
+        prefix += 1
+
+    suffix = 0
+    while (suffix < limit - prefix
+           and fingerprints[new_count - 1 - suffix] == old_rows[old_count - 1 - suffix].fingerprint):
+        suffix += 1
+
+    shift = old_count - new_count
+    positions: List[Optional[int]] = [None] * new_count
+    for position in range(new_count):
+        if position < prefix:
+            positions[position] = position
+        elif position >= new_count - suffix:
+            positions[position] = position + shift
+        elif shift == 0 and fingerprints[position] == old_rows[position].fingerprint:
+            positions[position] = position
+    return positions
+
+
+def _result_suppliers(result: MatchResult) -> List[Any]:
+    """
+    取出写入"匹配到的数据"的供应商
+
+    参数:
+        result: 匹配结果
+
+    返回:
+        List[Any]: 计入已匹配时为匹配到的供应商，否则为空列表
+    """
+    if not result.is_matched:
+        return []
+    return [supplier for _, supplier in result.matched_suppliers]
+
+
+def _append_row(item: Tuple[Any, Tuple[Any, ...]]):
+    """
+    向结果工作表追加一行
+
+    参数:
+        item: (结果工作表, 行的值)
+    """
+    sheet, values = item
+    sheet.append(values)
+
+
+def _remove_status_column(sheet1):
+    """
+    删除之前以条件格式模式分析时添加的状态列及其条件格式规则
+
+    改为逐个单元格设置样式后，旧的条件格式规则会覆盖单元格的颜色，状态码也已过时。
+
+    参数:
+        sheet1: 待匹配表
+    """
+    status_column = find_column(sheet1, STATUS_COLUMN_TITLE)
+    if status_column is None:
+        return
+
+    remove_status_formatting(sheet1, status_column, MatchStatus.STYLES)
+    sheet1.delete_cols(status_column)
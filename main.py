@@ -15,6 +15,7 @@ Version:
 """
 
 import sys
+from multiprocessing import freeze_support
 from PySide6.QtWidgets import QApplication
 
 from ui.main_window import MainWindow
@@ -50,4 +51,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # 打包为可执行文件后，并行标准化的子进程需要由此进入
+    freeze_support()
     sys.exit(main())
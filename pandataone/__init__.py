@@ -0,0 +1,8 @@
+"""
+PanDataone 命令行入口包
+
+提供不启动图形界面的批处理命令，使用方式:
+    python -m pandataone match 文件或通配符 [...] --jobs N
+"""
+
+__all__ = []
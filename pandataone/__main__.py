@@ -0,0 +1,13 @@
+"""
+命令行入口
+
+支持通过 python -m pandataone 运行批处理命令。
+"""
+
+import sys
+
+from pandataone.cli import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
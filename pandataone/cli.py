@@ -0,0 +1,380 @@
+"""
+命令行批处理模块
+
+在不启动图形界面的情况下批量分析多个工作簿。每个文件的处理与界面中
+点击"开始分析"完全相同（调用core.workbook_analyzer.analyze_workbook），
+多个文件通过进程池在多个CPU核心上并行处理。
+
+使用示例:
+    python -m pandataone match 供应商/*.xlsx --jobs 4
+    python -m pandataone match 一月.xlsx 二月.xlsx --separate-output
+
+作者: 供应商数据智能匹配系统开发团队
+版本: 1.0
+"""
+
+import argparse
+import glob
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+from typing import Any, Dict, List, Optional, Sequence
+
+from core.analysis_state import AnalysisStateStore, default_state_dir
+from core.data_standardizer import DEFAULT_CACHE_SIZE, configure_standardize_cache
+from core.index_cache import (
+    DEFAULT_INDEX_CACHE_MAX_BYTES, ReferenceIndexCache, default_index_cache_dir
+)
+from core.parallel_standardizer import ParallelStandardizer
+from core.partitioned_match_engine import MIN_PARALLEL_ROWS
+from core.workbook_analyzer import (
+    MATCH_BATCH, MATCH_PARTITIONED, MATCH_ROW, OUTPUT_IN_PLACE, OUTPUT_SEPARATE, REFERENCE_MEMORY, REFERENCE_SQLITE,
+    RESULT_FILE_SUFFIX, STYLE_CELLS, STYLE_CONDITIONAL, analyze_workbook
+)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    命令行主入口
+
+    参数:
+        argv: 命令行参数列表，默认为sys.argv[1:]
+
+    返回:
+        int: 退出码，全部文件处理成功返回0，否则返回1
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    # 在开始处理前检查，否则负数会在每个进程的初始化函数中才抛出异常
+    if args.command == 'match' and args.cache_size < 0:
+        parser.error("--cache-size 不能为负数")
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    return args.handler(args)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    创建命令行参数解析器
+
+    返回:
+        argparse.ArgumentParser: 配置好子命令的解析器
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m pandataone',
+        description='供应商数据智能匹配系统 - 命令行批处理'
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    match_parser = subparsers.add_parser(
+        'match',
+        help='批量分析工作簿，每个文件的处理与界面"开始分析"相同'
+    )
+    match_parser.add_argument(
+        'inputs', nargs='+',
+        help='Excel文件路径或通配符（如 "data/*.xlsx"，支持 ** 递归匹配）'
+    )
+    match_parser.add_argument(
+        '-j', '--jobs', type=int, default=os.cpu_count() or 1,
+        help='并行处理的进程数，默认为CPU核心数'
+    )
+    match_parser.add_argument(
+        '-s', '--separate-output', action='store_true',
+        help='结果另存为"原文件名_匹配结果.xlsx"，不修改原文件'
+    )
+    match_parser.add_argument(
+        '--pipeline', action='store_true',
+        help='单独输出时在后台线程中读取、标准化和写出，与匹配同时进行，'
+             '各阶段之间用有界队列连接，内存占用与行数无关（只用于--separate-output）'
+    )
+    match_parser.add_argument(
+        '--cache-size', type=int, default=DEFAULT_CACHE_SIZE,
+        help=f'每个进程的标准化缓存容量（条目数），0表示关闭缓存，默认{DEFAULT_CACHE_SIZE}'
+    )
+    match_parser.add_argument(
+        '--normalize-workers', type=int, default=1,
+        help='每个文件标准化两个工作表使用的进程数，默认1（在当前进程中标准化）；'
+             '大于1时与--jobs的进程数相乘，大量不同的客户和产品名称时才有收益'
+    )
+    match_parser.add_argument(
+        '--no-index-cache', action='store_true',
+        help='不使用匹配原表索引的磁盘缓存'
+    )
+    match_parser.add_argument(
+        '--index-cache-dir', default=None,
+        help=f'匹配原表索引缓存目录，默认为 {default_index_cache_dir()}'
+    )
+    match_parser.add_argument(
+        '--index-cache-size', type=int, default=DEFAULT_INDEX_CACHE_MAX_BYTES // (1024 * 1024),
+        help='匹配原表索引缓存目录的容量上限（MB），超出时淘汰最久未使用的缓存，'
+             f'默认{DEFAULT_INDEX_CACHE_MAX_BYTES // (1024 * 1024)}'
+    )
+    match_parser.add_argument(
+        '--reference-backend', choices=(REFERENCE_MEMORY, REFERENCE_SQLITE), default=REFERENCE_MEMORY,
+        help='匹配原表索引的存储方式：memory为内存（默认），'
+             'sqlite为临时SQLite数据库，适用于数百万行、超出内存的匹配原表（不使用索引缓存）'
+    )
+    match_parser.add_argument(
+        '--match-mode', choices=(MATCH_ROW, MATCH_BATCH, MATCH_PARTITIONED), default=MATCH_ROW,
+        help='匹配方式：row为逐行匹配（默认），batch为基于NumPy的整列批量匹配，'
+             '适用于大量数据（未安装NumPy或使用sqlite存储时自动退回逐行匹配），'
+             f'partitioned为按(客户, 产品)分区在多个进程中并行匹配（待匹配表少于{MIN_PARALLEL_ROWS}行'
+             '或使用sqlite存储时自动退回逐行匹配）'
+    )
+    match_parser.add_argument(
+        '--match-workers', type=int, default=None,
+        help='partitioned匹配方式使用的进程数，默认为CPU核心数（与--jobs的进程数相乘）'
+    )
+    match_parser.add_argument(
+        '--style-mode', choices=(STYLE_CELLS, STYLE_CONDITIONAL), default=STYLE_CELLS,
+        help='待匹配表的颜色标记方式：cells为逐个设置单元格颜色（默认），'
+             'conditional为在末尾增加"匹配状态"列并添加条件格式规则，由规则显示颜色，'
+             '文件大小和速度与cells基本相同'
+             '（单独输出时不标记颜色）'
+    )
+    match_parser.add_argument(
+        '--incremental', action='store_true',
+        help='增量分析：在缓存目录中保存每个工作簿的分析状态，再次分析时只重新匹配修改过的行'
+             f'（匹配原表变化时自动完整分析，单独输出时不适用），状态目录为 {default_state_dir()}'
+    )
+    match_parser.add_argument(
+        '-v', '--verbose', action='store_true',
+        help='输出INFO级别日志'
+    )
+    match_parser.set_defaults(handler=_run_match)
+
+    return parser
+
+
+def _expand_inputs(patterns: Sequence[str]) -> List[str]:
+    """
+    展开文件路径和通配符
+
+    Windows的命令行不会自动展开通配符，因此在这里统一处理。
+    通配符展开时跳过Excel的临时锁文件(~$开头)和之前生成的结果工作簿，
+    直接给出的路径保持不变。结果按首次出现顺序去重。
+
+    参数:
+        patterns: 文件路径或通配符列表
+
+    返回:
+        List[str]: 去重后的文件路径列表
+    """
+    files: List[str] = []
+    seen = set()
+
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            matches = [
+                path for path in sorted(glob.glob(pattern, recursive=True))
+                if not _is_generated_file(path)
+            ]
+        else:
+            matches = [pattern]
+
+        for path in matches:
+            key = os.path.normcase(os.path.abspath(path))
+            if key not in seen:
+                seen.add(key)
+                files.append(path)
+
+    return files
+
+
+def _is_generated_file(path: str) -> bool:
+    """
+    判断文件是否为Excel锁文件或本系统生成的结果工作簿
+
+    参数:
+        path: 文件路径
+
+    返回:
+        bool: 需要在通配符展开时跳过返回True
+    """
+    name = os.path.basename(path)
+    stem, _ = os.path.splitext(name)
+    return name.startswith('~$') or stem.endswith(RESULT_FILE_SUFFIX)
+
+
+def _process_file(
+    file_path: str,
+    output_mode: str,
+    index_cache: Optional[ReferenceIndexCache] = None,
+    reference_backend: str = REFERENCE_MEMORY,
+    match_mode: str = MATCH_ROW,
+    style_mode: str = STYLE_CELLS,
+    state_store: Optional[AnalysisStateStore] = None,
+    normalize_workers: int = 1,
+    match_workers: Optional[int] = None,
+    pipeline: bool = False
+) -> Dict[str, Any]:
+    """
+    处理单个文件（在进程池的子进程中执行）
+
+    异常会被捕获并作为结果返回，避免一个文件失败中断整个批次。
+
+    参数:
+        file_path: Excel文件路径
+        output_mode: 输出模式，OUTPUT_IN_PLACE或OUTPUT_SEPARATE
+        index_cache: 匹配原表索引缓存，为None时不使用缓存
+        reference_backend: 匹配原表索引的存储方式
+        match_mode: 匹配方式
+        style_mode: 颜色标记方式
+        state_store: 增量分析状态存储，为None时进行完整分析
+        normalize_workers: 标准化使用的进程数，大于1时为该文件创建并行标准化器
+        match_workers: 分区并行匹配的进程数，为None时使用CPU核心数
+        pipeline: 单独输出时是否使用流水线
+
+    返回:
+        Dict[str, Any]: 处理结果，包括file, stats, elapsed, error
+    """
+    start = time.perf_counter()
+    standardizer = ParallelStandardizer(normalize_workers) if normalize_workers > 1 else None
+    try:
+        stats = analyze_workbook(
+            file_path, output_mode=output_mode, index_cache=index_cache,
+            reference_backend=reference_backend, match_mode=match_mode, style_mode=style_mode,
+            state_store=state_store, standardizer=standardizer, match_workers=match_workers,
+            pipeline=pipeline
+        )
+        error = None
+    except Exception as e:
+        logging.error(f"处理文件出错 {file_path}: {str(e)}", exc_info=True)
+        stats = None
+        error = str(e)
+    finally:
+        if standardizer is not None:
+            standardizer.close()
+
+    return {
+        'file': file_path,
+        'stats': stats,
+        'elapsed': time.perf_counter() - start,
+        'error': error,
+    }
+
+
+def _run_match(args: argparse.Namespace) -> int:
+    """
+    执行match子命令
+
+    参数:
+        args: 解析后的命令行参数
+
+    返回:
+        int: 退出码
+    """
+    files = _expand_inputs(args.inputs)
+    if not files:
+        print("没有找到需要处理的文件", file=sys.stderr)
+        return 1
+
+    jobs = max(1, min(args.jobs, len(files)))
+    print(f"共 {len(files)} 个文件，使用 {jobs} 个进程处理")
+
+    if args.index_cache_size < 0:
+        print("--index-cache-size 不能为负数", file=sys.stderr)
+        return 1
+    if args.normalize_workers < 1:
+        print("--normalize-workers 必须大于0", file=sys.stderr)
+        return 1
+    if args.match_workers is not None and args.match_workers < 1:
+        print("--match-workers 必须大于0", file=sys.stderr)
+        return 1
+
+    output_mode = OUTPUT_SEPARATE if args.separate_output else OUTPUT_IN_PLACE
+    index_cache = None
+    if not args.no_index_cache:
+        index_cache = ReferenceIndexCache(
+            args.index_cache_dir, args.index_cache_size * 1024 * 1024
+        )
+    process_file = partial(
+        _process_file, output_mode=output_mode, index_cache=index_cache,
+        reference_backend=args.reference_backend, match_mode=args.match_mode,
+        style_mode=args.style_mode,
+        state_store=AnalysisStateStore() if args.incremental else None,
+        normalize_workers=args.normalize_workers, match_workers=args.match_workers,
+        pipeline=args.pipeline
+    )
+
+    start = time.perf_counter()
+    results: List[Dict[str, Any]] = []
+
+    if jobs == 1:
+        # 单进程时直接在当前进程处理，省去进程启动开销
+        configure_standardize_cache(args.cache_size)
+        for file_path in files:
+            result = process_file(file_path)
+            _print_file_result(result)
+            results.append(result)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=configure_standardize_cache,
+            initargs=(args.cache_size,)
+        ) as executor:
+            futures = [executor.submit(process_file, f) for f in files]
+            for future in as_completed(futures):
+                result = future.result()
+                _print_file_result(result)
+                results.append(result)
+
+    wall_time = time.perf_counter() - start
+    _print_summary(results, wall_time)
+
+    return 0 if all(r['error'] is None for r in results) else 1
+
+
+def _print_file_result(result: Dict[str, Any]):
+    """
+    输出单个文件的处理结果
+
+    参数:
+        result: _process_file返回的结果字典
+    """
+    name = os.path.basename(result['file'])
+    elapsed = result['elapsed']
+
+    if result['error'] is not None:
+        print(f"✗ {name}: 失败 ({result['error']})，用时 {elapsed:.2f}s")
+        return
+
+    stats = result['stats']
+    rows_per_second = stats['total'] / elapsed if elapsed > 0 else 0
+    index_note = "，匹配原表索引来自缓存" if stats['index_cache_hit'] else ""
+    reused_note = f"，沿用上次结果 {stats['reused_rows']} 行" if stats['reused_rows'] else ""
+    lookups_note = f"，复用查找结果 {stats['lookups_saved']} 次" if stats['lookups_saved'] else ""
+    print(
+        f"✓ {name}: {stats['total']} 行，已匹配 {stats['matched']}，"
+        f"匹配率 {stats['rate']}%，用时 {elapsed:.2f}s，{rows_per_second:,.0f} 行/秒，"
+        f"缓存命中率 {stats['cache_hit_rate']}%{index_note}{reused_note}{lookups_note}"
+    )
+
+
+def _print_summary(results: List[Dict[str, Any]], wall_time: float):
+    """
+    输出批处理吞吐量汇总
+
+    参数:
+        results: 所有文件的处理结果
+        wall_time: 整个批次的实际耗时（秒）
+    """
+    succeeded = [r for r in results if r['error'] is None]
+    failed_count = len(results) - len(succeeded)
+    total_rows = sum(r['stats']['total'] for r in succeeded)
+    busy_time = sum(r['elapsed'] for r in results)
+    rows_per_second = total_rows / wall_time if wall_time > 0 else 0
+
+    print("-" * 60)
+    print(f"文件: 成功 {len(succeeded)} 个，失败 {failed_count} 个")
+    print(f"数据行: {total_rows}")
+    print(f"总耗时: {wall_time:.2f}s（各文件累计 {busy_time:.2f}s）")
+    print(f"吞吐量: {rows_per_second:,.0f} 行/秒")
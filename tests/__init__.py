@@ -0,0 +1,6 @@
+"""
+单元测试
+
+使用示例:
+    python -m pytest -q
+"""
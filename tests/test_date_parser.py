@@ -0,0 +1,87 @@
+"""
+日期解析模块的单元测试
+
+覆盖core.date_parser替换原先的正则表达式级联时有意修正的中文数字处理:
+- 十一月、十二月按11月、12月解析（原先"十"先被替换为"10"，误读为10月）
+- 复合中文数字（二十三 -> 23）和逐位写出的年份（二〇二四 -> 2024）
+- "〇"和"零"作为数字0（原先原样保留，无法解析）
+
+只有月份的日期使用当前年份，测试中固定为2026年。
+"""
+
+import pytest
+
+import core.date_parser as date_parser
+from core.date_parser import parse_date, parse_date_range
+
+
+@pytest.fixture(autouse=True)
+def fixed_year(monkeypatch):
+    """把只有月份的日期补全时使用的当前年份固定为2026"""
+    monkeypatch.setattr(date_parser, '_current_year', lambda: '2026')
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('十月', '202610'),
+    ('十一月', '202611'),
+    ('十二月', '202612'),
+    ('2024年十一月', '202411'),
+    ('24年十二月', '202412'),
+    ('一九九九年十二月', '199912'),
+])
+def test_eleven_and_twelve_are_not_read_as_october(value, expected):
+    assert parse_date(value) == expected
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('二十三', '23'),
+    ('二十三年', '23'),
+    ('十一', '202611'),
+    ('二十', '20'),
+])
+def test_compound_numerals_convert_as_a_whole(value, expected):
+    assert parse_date(value) == expected
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('二〇二四', '2024'),
+    ('二〇二四年三月', '202403'),
+    ('二〇二四年十一月', '202411'),
+    ('二〇二四03', '202403'),
+    ('二〇二四-03', '202403'),
+])
+def test_digit_by_digit_years(value, expected):
+    assert parse_date(value) == expected
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('〇三月', '202603'),
+    ('零三月', '202603'),
+    ('零67', '202606'),
+    ('2024年〇3月', '202403'),
+    ('2024年零3月', '202403'),
+])
+def test_zero_characters_are_digits(value, expected):
+    assert parse_date(value) == expected
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('2024年十一月到十二月', '202411,202412'),
+    ('2024年3月到十二月', ','.join(f'2024{month:02d}' for month in range(3, 13))),
+    ('二〇二四年三月到五月', '202403,202404,202405'),
+])
+def test_numeral_fixes_apply_to_ranges(value, expected):
+    assert parse_date(value) == expected
+    assert parse_date_range(value) == expected
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('正月', '202601'),
+    ('三月', '202603'),
+    ('2024年3月', '202403'),
+    ('24年03月', '202403'),
+    ('23年3月', '233'),
+    ('3月到5月', '202603'),
+])
+def test_unchanged_forms(value, expected):
+    assert parse_date(value) == expected
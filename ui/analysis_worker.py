@@ -0,0 +1,183 @@
+"""
+分析工作线程模块
+
+本模块定义了在后台线程中执行数据分析的工作线程类。
+将Excel加载、数据匹配和结果保存移出GUI主线程，避免界面卡死。
+
+主要功能:
+- 在QThread中调用core.workbook_analyzer执行完整的分析流程（加载、匹配、保存）
+- 通过共享计数器发布进度，由主线程的QTimer定期轮询
+- 支持协作式取消，取消后不会写回原文件
+- 通过信号通知分析完成、失败或取消
+- 可选地用cProfile记录本次分析 (见core.profiling)
+
+作者: 供应商数据智能匹配系统开发团队
+版本: 1.0
+"""
+
+import logging
+import threading
+from typing import Optional
+
+from PySide6.QtCore import QThread, Signal
+
+from core.analysis_state import AnalysisStateStore
+from core.index_cache import ReferenceIndexCache
+from core.parallel_standardizer import ParallelStandardizer
+from core.profiling import AnalysisProfiler
+from core.workbook_analyzer import (
+    MATCH_ROW, OUTPUT_IN_PLACE, REFERENCE_MEMORY, STYLE_CELLS, AnalysisCancelled, AnalysisProgress,
+    analyze_workbook
+)
+
+
+class AnalysisWorker(QThread):
+    """
+    数据分析工作线程
+
+    在后台线程中执行数据分析，主线程只负责界面更新。
+    进度通过progress共享计数器发布，工作线程只写、主线程只读，
+    避免逐行发送信号造成事件队列拥堵。
+
+    Signals:
+        analysis_finished: 分析成功完成时发出，参数为统计信息字典
+        analysis_failed: 分析出错时发出，参数为错误信息(str)
+        analysis_cancelled: 分析被用户取消时发出
+
+    属性:
+        file_path (str): 待分析的Excel文件路径
+        output_mode (str): 输出模式，OUTPUT_IN_PLACE或OUTPUT_SEPARATE
+        index_cache (Optional[ReferenceIndexCache]): 匹配原表索引缓存，为None时不使用缓存
+        reference_backend (str): 匹配原表索引的存储方式，REFERENCE_MEMORY或REFERENCE_SQLITE
+        match_mode (str): 匹配方式，MATCH_ROW、MATCH_BATCH或MATCH_PARTITIONED
+        style_mode (str): 颜色标记方式，STYLE_CELLS或STYLE_CONDITIONAL
+        state_store (Optional[AnalysisStateStore]): 增量分析状态存储，为None时进行完整分析
+        normalize_workers (int): 标准化使用的进程数，大于1时在进程池中并行标准化
+        pipeline (bool): 单独输出时是否使用读取、标准化、匹配、写出流水线
+        profile_dir (Optional[str]): 性能分析文件的输出目录，为None时不记录性能分析
+        progress (AnalysisProgress): 共享进度计数器
+
+    示例:
+        >>> worker = AnalysisWorker(file_path)
+        >>> worker.analysis_finished.connect(on_finished)
+        >>> worker.start()
+        >>> worker.request_cancel()  # 需要时取消
+    """
+
+    analysis_finished = Signal(dict)
+    analysis_failed = Signal(str)
+    analysis_cancelled = Signal()
+
+    def __init__(
+        self,
+        file_path: str,
+        output_mode: str = OUTPUT_IN_PLACE,
+        index_cache: Optional[ReferenceIndexCache] = None,
+        reference_backend: str = REFERENCE_MEMORY,
+        match_mode: str = MATCH_ROW,
+        style_mode: str = STYLE_CELLS,
+        state_store: Optional[AnalysisStateStore] = None,
+        normalize_workers: int = 1,
+        pipeline: bool = False,
+        profile_dir: Optional[str] = None,
+        parent=None
+    ):
+        """
+        初始化分析工作线程
+
+        参数:
+            file_path: 待分析的Excel文件路径
+            output_mode: 输出模式，默认写回原文件
+            index_cache: 匹配原表索引缓存，默认不使用
+            reference_backend: 匹配原表索引的存储方式，默认在内存中
+            match_mode: 匹配方式，默认逐行匹配
+            style_mode: 颜色标记方式，默认逐个设置单元格颜色
+            state_store: 增量分析状态存储，默认进行完整分析
+            normalize_workers: 标准化使用的进程数，默认在工作线程中标准化
+            pipeline: 单独输出时是否使用流水线，默认不使用
+            profile_dir: 性能分析文件的输出目录，默认不记录性能分析
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self.file_path = file_path
+        self.output_mode = output_mode
+        self.index_cache = index_cache
+        self.reference_backend = reference_backend
+        self.match_mode = match_mode
+        self.style_mode = style_mode
+        self.state_store = state_store
+        self.normalize_workers = normalize_workers
+        self.pipeline = pipeline
+        self.profile_dir = profile_dir
+
+        # 共享进度计数器（工作线程写入，主线程轮询读取）
+        self.progress = AnalysisProgress()
+
+        self._cancel_event = threading.Event()
+
+    def request_cancel(self):
+        """
+        请求取消分析
+
+        设置取消标志，工作线程会在下一个检查点停止处理。
+        可以在任意线程中调用。
+        """
+        logging.info("请求取消数据分析")
+        self._cancel_event.set()
+
+    def is_cancel_requested(self) -> bool:
+        """
+        是否已请求取消
+
+        返回:
+            bool: 已请求取消返回True，否则返回False
+        """
+        return self._cancel_event.is_set()
+
+    def run(self):
+        """
+        线程入口函数
+
+        执行分析流程，并根据结果发出完成、失败或取消信号。
+        记录性能分析时，完成信号的统计信息中包含profile_file和profile_summary_file。
+        """
+        standardizer = (
+            ParallelStandardizer(self.normalize_workers) if self.normalize_workers > 1 else None
+        )
+        profiler = AnalysisProfiler(self.profile_dir) if self.profile_dir is not None else None
+        try:
+            if profiler is not None:
+                with profiler:
+                    stats = self._analyze(standardizer)
+                stats['profile_file'] = profiler.profile_file
+                stats['profile_summary_file'] = profiler.summary_file
+            else:
+                stats = self._analyze(standardizer)
+        except AnalysisCancelled:
+            logging.info("数据分析已取消，原文件未修改")
+            self.analysis_cancelled.emit()
+        except Exception as e:
+            logging.error(f"分析过程出错: {str(e)}", exc_info=True)
+            self.analysis_failed.emit(str(e))
+        else:
+            logging.info("数据分析完成")
+            self.analysis_finished.emit(stats)
+        finally:
+            if standardizer is not None:
+                standardizer.close()
+
+    def _analyze(self, standardizer: Optional[ParallelStandardizer]) -> dict:
+        """
+        执行分析
+
+        参数:
+            standardizer: 并行标准化器，可以为None
+
+        返回:
+            dict: analyze_workbook返回的统计信息
+        """
+        return analyze_workbook(
+            self.file_path, self.progress, self._cancel_event,
+            self.output_mode, self.index_cache, self.reference_backend, self.match_mode,
+            self.style_mode, self.state_store, standardizer, pipeline=self.pipeline
+        )
@@ -8,7 +8,7 @@
 - 创建和管理应用程序主窗口
 - 协调标签页组件(数据筛选页、设置页)
 - 处理文件选择和数据分析流程
-- 管理数据匹配算法和结果展示
+- 启动后台分析线程并展示结果
 - 处理菜单栏和帮助系统
 - 线程管理和进度更新
 
@@ -16,6 +16,7 @@
 - ui.tabs.filter_tab: 数据筛选标签页
 - ui.tabs.settings_tab: 设置标签页
 - ui.widgets.help_widget: 帮助组件
+- ui.analysis_worker: 分析工作线程
 - core.*: 核心数据处理模块
 
 作者: 供应商数据智能匹配系统开发团队
@@ -25,15 +26,14 @@
 import sys
 import os
 import logging
-from typing import Dict, Set, Tuple, List, Optional
+from typing import Dict, List, Optional
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QTabWidget,
     QFileDialog, QMessageBox, QPushButton, QHBoxLayout
 )
-from PySide6.QtCore import QSettings, Qt
+from PySide6.QtCore import QSettings, Qt, QTimer
 from PySide6.QtGui import QIcon
-import openpyxl
 
 # 导入标签页组件
 from ui.tabs.filter_tab import FilterTab
@@ -42,13 +42,21 @@ from ui.tabs.settings_tab import SettingsTab
 # 导入帮助组件
 from ui.widgets.help_widget import HelpWidget
 
+# 导入分析工作线程
+from ui.analysis_worker import AnalysisWorker
+
 # 导入核心模块
-from core.data_models import MatchResult, CellStyles
-from core.data_standardizer import standardize_data
-from core.excel_processor import (
-    get_sheet_data, clear_sheet, copy_title_row, init_result_sheet
-)
 from core.logging_config import setup_logging
+from core.analysis_state import AnalysisStateStore
+from core.index_cache import ReferenceIndexCache
+from core.instrumentation import format_phase_seconds
+from core.workbook_analyzer import (
+    MATCH_BATCH, MATCH_PARTITIONED, MATCH_ROW, OUTPUT_IN_PLACE, OUTPUT_SEPARATE, REFERENCE_MEMORY, REFERENCE_SQLITE,
+    STYLE_CELLS, STYLE_CONDITIONAL
+)
+
+# 进度轮询间隔（毫秒），约10Hz
+PROGRESS_POLL_INTERVAL_MS = 100
 
 
 class MainWindow(QMainWindow):
@@ -63,10 +71,9 @@ class MainWindow(QMainWindow):
         2. 标签页管理(筛选页、设置页)
         3. 菜单栏创建(包含帮助菜单)
         4. 文件选择和验证
-        5. 数据分析流程控制
-        6. 数据匹配算法实现
-        7. 统计信息更新
-        8. 日志系统管理
+        5. 数据分析流程控制(分析在后台工作线程中执行)
+        6. 统计信息更新
+        7. 日志系统管理
 
     属性:
         settings (QSettings): 应用程序配置对象
@@ -74,6 +81,8 @@ class MainWindow(QMainWindow):
         recent_files (List[str]): 最近打开的文件列表
         filter_tab (FilterTab): 数据筛选标签页
         settings_tab (SettingsTab): 设置标签页
+        analysis_worker (Optional[AnalysisWorker]): 正在运行的分析工作线程
+        progress_timer (QTimer): 进度轮询定时器
 
     示例:
         >>> app = QApplication(sys.argv)
@@ -99,6 +108,12 @@ class MainWindow(QMainWindow):
         self.settings = QSettings('供应商数据智能匹配系统', 'DataAnalysis')
         self.log_file: Optional[str] = None
         self.recent_files: List[str] = []
+        self.analysis_worker: Optional[AnalysisWorker] = None
+
+        # 进度轮询定时器，分析期间周期性读取工作线程的进度计数器
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setInterval(PROGRESS_POLL_INTERVAL_MS)
+        self.progress_timer.timeout.connect(self._poll_progress)
 
         # 初始化系统
         self._init_logging()
@@ -381,6 +396,7 @@ class MainWindow(QMainWindow):
         self.filter_tab = FilterTab()
         self.filter_tab.file_browsed.connect(self._on_file_browsed)
         self.filter_tab.analyze_clicked.connect(self._on_analyze_clicked)
+        self.filter_tab.cancel_clicked.connect(self._on_cancel_clicked)
         self.filter_tab.file_dropped.connect(self._on_file_dropped)
         tab_widget.addTab(self.filter_tab, "📊 数据筛选")
 
@@ -575,12 +591,13 @@ class MainWindow(QMainWindow):
         """
         开始数据分析
 
-        执行完整的数据分析流程:
+        在后台工作线程中执行完整的数据分析流程:
         1. 验证文件选择
-        2. 加载Excel文件
-        3. 处理数据匹配
-        4. 保存结果
-        5. 更新统计信息
+        2. 创建并启动分析工作线程
+        3. 启动进度轮询定时器
+        4. 切换按钮状态（禁用分析按钮，启用取消按钮）
+
+        分析结果通过工作线程的信号异步返回。
         """
         # 检查是否选择了文件
         file_path = self.filter_tab.get_file_path()
@@ -588,313 +605,174 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "警告", "请先选择Excel文件")
             return
 
+        # 已有分析在运行时不重复启动
+        if self.analysis_worker is not None:
+            return
+
         logging.info("开始数据分析")
 
-        # 禁用分析按钮
+        # 切换按钮状态并显示进度条
         self.filter_tab.enable_analyze_button(False)
+        self.filter_tab.enable_cancel_button(True)
+        self.filter_tab.set_progress_maximum(0)  # 总行数未知前显示忙碌状态
+        self.filter_tab.set_progress_value(0)
+        self.filter_tab.set_progress_visible(True)
+        self.status_bar.showMessage("正在分析...")
+
+        # 创建工作线程
+        output_mode = (
+            OUTPUT_SEPARATE if self.settings_tab.is_separate_output_enabled()
+            else OUTPUT_IN_PLACE
+        )
+        index_cache = ReferenceIndexCache() if self.settings_tab.is_index_cache_enabled() else None
+        reference_backend = (
+            REFERENCE_SQLITE if self.settings_tab.is_sqlite_reference_enabled()
+            else REFERENCE_MEMORY
+        )
+        if self.settings_tab.is_batch_match_enabled():
+            match_mode = MATCH_BATCH
+        elif self.settings_tab.is_partitioned_match_enabled():
+            match_mode = MATCH_PARTITIONED
+        else:
+            match_mode = MATCH_ROW
+        style_mode = (
+            STYLE_CONDITIONAL if self.settings_tab.is_conditional_format_enabled()
+            else STYLE_CELLS
+        )
+        # 性能分析只记录这一次分析，文件写入日志文件所在目录
+        profile_dir = None
+        if self.settings_tab.is_profiling_enabled():
+            profile_dir = os.path.dirname(os.path.abspath(self.log_file))
+            self.settings_tab.set_profiling_enabled(False)
+
+        self.analysis_worker = AnalysisWorker(
+            file_path, output_mode, index_cache, reference_backend, match_mode, style_mode,
+            AnalysisStateStore() if self.settings_tab.is_incremental_enabled() else None,
+            self.settings_tab.get_normalize_workers(), self.settings_tab.is_pipeline_enabled(),
+            profile_dir, parent=self
+        )
+        self.analysis_worker.analysis_finished.connect(self._on_analysis_finished)
+        self.analysis_worker.analysis_failed.connect(self._on_analysis_failed)
+        self.analysis_worker.analysis_cancelled.connect(self._on_analysis_cancelled)
+        self.analysis_worker.finished.connect(self._on_analysis_thread_finished)
 
-        try:
-            # 加载工作簿
-            workbook = openpyxl.load_workbook(file_path)
-            logging.info(f"工作簿包含的工作表: {workbook.sheetnames}")
-
-            # 检查工作表数量
-            if len(workbook.worksheets) < 2:
-                QMessageBox.critical(self, "错误", "工作簿中缺少必要的工作表")
-                self.filter_tab.enable_analyze_button(True)
-                return
-
-            # 获取工作表
-            sheet1 = workbook.worksheets[0]  # 待匹配表
-            sheet2 = workbook.worksheets[1]  # 匹配原表
-            sheet3 = init_result_sheet(workbook, "匹配到的数据")
-            sheet4 = init_result_sheet(workbook, "未找到的数据")
-
-            # 显示进度条
-            self.filter_tab.set_progress_visible(True)
-
-            # 处理数据
-            stats = self._process_data(workbook, sheet1, sheet2, sheet3, sheet4)
-
-            # 保存结果
-            workbook.save(file_path)
-            self.filter_tab.set_progress_visible(False)
-
-            # 更新统计信息
-            self.filter_tab.update_stats(stats)
-
-            # 显示完成消息
-            logging.info("数据分析完成")
-            QMessageBox.information(
-                self,
-                "✅ 分析完成",
-                f"数据处理完成！\n\n"
-                f"总计：{stats['total']} 条\n"
-                f"已匹配：{stats['matched']} 条\n"
-                f"未匹配：{stats['unmatched']} 条\n"
-                f"匹配率：{stats['rate']}%",
-                QMessageBox.Ok
-            )
-
-            self.status_bar.showMessage("分析完成")
-
-        except Exception as e:
-            self.filter_tab.set_progress_visible(False)
-            logging.error(f"分析过程出错: {str(e)}", exc_info=True)
-            QMessageBox.critical(self, "错误", f"执行分析时出错：{str(e)}")
-            self.status_bar.showMessage("分析失败")
-
-        finally:
-            # 重新启用分析按钮
-            self.filter_tab.enable_analyze_button(True)
+        # 启动工作线程和进度轮询
+        self.analysis_worker.start()
+        self.progress_timer.start()
 
-    def _process_data(self, workbook, sheet1, sheet2, sheet3, sheet4) -> Dict[str, any]:
+    def _on_cancel_clicked(self):
         """
-        处理数据匹配逻辑
-
-        执行数据匹配的核心算法，包括:
-        1. 初始化结果表
-        2. 预处理匹配数据
-        3. 逐行分析匹配
-        4. 应用样式标记
-        5. 分类结果
+        处理取消分析按钮点击事件
 
-        参数:
-            workbook: Excel工作簿对象
-            sheet1: 待匹配表
-            sheet2: 匹配原表
-            sheet3: 匹配结果表
-            sheet4: 未匹配结果表
-
-        返回:
-            包含统计信息的字典，包括total, matched, unmatched, rate
+        向工作线程发出取消请求，工作线程会在下一个检查点停止。
         """
-        try:
-            logging.info("开始处理数据")
-
-            # 初始化结果表
-            copy_title_row(sheet1, sheet3)
-            copy_title_row(sheet1, sheet4)
-            sheet3.cell(row=1, column=4, value="供应商")
-            sheet4.cell(row=1, column=4, value="供应商")
-
-            # 预处理匹配数据
-            sheet2_data = self._preprocess_sheet2(sheet2)
-
-            # 检查数据量
-            max_row = sheet1.max_row
-            if max_row <= 1:
-                raise ValueError("Sheet1中没有数据需要匹配")
-
-            # 设置进度条
-            self.filter_tab.set_progress_maximum(max_row - 1)
-
-            # 处理数据
-            processed_keys: Set[Tuple[str, str, str]] = set()
-            date_range_map: Dict[Tuple[str, str], List[str]] = {}
-
-            matched_count = 0
-            unmatched_count = 0
-
-            for row in range(2, max_row + 1):
-                # 更新进度
-                self.filter_tab.set_progress_value(row - 2)
-
-                # 获取原始数据和标准化后的搜索键
-                original_data = tuple(
-                    str(sheet1.cell(row=row, column=i).value)
-                    for i in range(1, 4)
-                )
-                search_key = get_sheet_data(sheet1, row)
-
-                # 分析匹配
-                result = self._analyze_match(
-                    search_key, sheet2_data, processed_keys, date_range_map
-                )
-
-                # 应用样式
-                cell_style = self._determine_cell_style(result)
-                for col in range(1, 4):
-                    cell = sheet1.cell(row=row, column=col)
-                    cell.fill = cell_style.to_pattern_fill()
-                    cell.font = cell_style.to_font()
-
-                # 保存结果
-                if result.is_match or (result.is_date_range and result.is_all_match):
-                    matched_count += 1
-                    target_sheet = sheet3
-                    for _, supplier in result.matched_suppliers:
-                        target_sheet.append(original_data + (supplier,))
-                else:
-                    unmatched_count += 1
-                    sheet4.append(original_data + ('',))
-
-                # 标记为已处理
-                processed_keys.add(search_key)
-
-            # 计算统计
-            total = matched_count + unmatched_count
-            rate = (matched_count / total * 100) if total > 0 else 0
-
-            return {
-                'total': total,
-                'matched': matched_count,
-                'unmatched': unmatched_count,
-                'rate': f"{rate:.1f}"
-            }
+        if self.analysis_worker is None:
+            return
 
-        except Exception as e:
-            self.filter_tab.set_progress_visible(False)
-            logging.error(f"数据处理出错: {str(e)}", exc_info=True)
-            raise
+        self.analysis_worker.request_cancel()
+        self.filter_tab.enable_cancel_button(False)
+        self.status_bar.showMessage("正在取消...")
 
-    def _preprocess_sheet2(self, sheet2) -> Dict[Tuple[str, str, str], List[str]]:
+    def _poll_progress(self):
         """
-        预处理匹配原表数据
+        轮询分析进度
 
-        将sheet2的数据转换为字典结构，便于快速查找。
-
-        参数:
-            sheet2: 匹配原表
-
-        返回:
-            字典，键为(日期, 客户名称, 产品名称)，值为供应商列表
+        由进度定时器周期性调用，读取工作线程的共享计数器并更新进度条。
         """
-        sheet2_data = {}
-
-        for row in sheet2.iter_rows(min_row=2, values_only=True):
-            key = (
-                standardize_data(str(row[0]), 1),
-                standardize_data(str(row[1]), 2),
-                standardize_data(str(row[2]), 3)
-            )
-
-            if key in sheet2_data:
-                sheet2_data[key].append(row[3])
-            else:
-                sheet2_data[key] = [row[3]]
+        worker = self.analysis_worker
+        if worker is None:
+            return
 
-        return sheet2_data
+        total = worker.progress.total_rows
+        if total > 0:
+            self.filter_tab.set_progress_maximum(total)
+            self.filter_tab.set_progress_value(worker.progress.processed_rows)
 
-    def _analyze_match(
-        self,
-        search_key: Tuple[str, str, str],
-        sheet2_data: Dict,
-        processed_keys: Set[Tuple[str, str, str]],
-        date_range_map: Dict[Tuple[str, str], List[str]]
-    ) -> MatchResult:
+    def _on_analysis_finished(self, stats: Dict[str, any]):
         """
-        分析数据匹配情况
+        处理分析完成事件
 
-        判断待匹配数据是否在匹配原表中存在，处理重复数据和日期范围数据。
+        更新统计信息并显示完成消息（包括各阶段耗时和计数）。
 
         参数:
-            search_key: 标准化后的搜索键(日期, 客户, 产品)
-            sheet2_data: 预处理后的匹配原表数据
-            processed_keys: 已处理的键集合
-            date_range_map: 日期范围映射
-
-        返回:
-            MatchResult对象，包含匹配结果信息
-        """
-        result = MatchResult()
-
-        # 检查是否重复
-        result.is_duplicate = self._check_duplicate(
-            search_key, processed_keys, date_range_map
+            stats: 统计信息字典，包括total, matched, unmatched, rate，
+                以及phase_seconds, elapsed, rows_per_second, range_rows, duplicate_rows, reference_keys
+        """
+        self.filter_tab.set_progress_visible(False)
+
+        # 更新统计信息
+        self.filter_tab.update_stats(stats)
+
+        # 显示完成消息
+        message = (
+            f"数据处理完成！\n\n"
+            f"总计：{stats['total']} 条\n"
+            f"已匹配：{stats['matched']} 条\n"
+            f"未匹配：{stats['unmatched']} 条\n"
+            f"匹配率：{stats['rate']}%\n"
+            f"日期范围：{stats['range_rows']} 条，重复：{stats['duplicate_rows']} 条\n"
+            f"匹配原表：{stats['reference_keys']} 个键，标准化缓存命中率：{stats['cache_hit_rate']}%\n\n"
+            f"用时：{stats['elapsed']:.1f} 秒（{stats['rows_per_second']:,.0f} 行/秒）\n"
+            f"{format_phase_seconds(stats['phase_seconds'])}"
         )
+        output_file = stats.get('output_file')
+        if output_file and output_file != self.filter_tab.get_file_path():
+            message += f"\n\n结果已保存到：\n{output_file}"
+        if stats.get('profile_summary_file'):
+            message += f"\n\n性能分析已保存到：\n{stats['profile_summary_file']}"
 
-        # 日期范围数据处理
-        if ',' in search_key[0]:
-            result.is_date_range = True
-            dates = search_key[0].split(',')
-            date_range_map[search_key[1:]] = dates
-
-            all_matches = True
-            for date in dates:
-                test_key = (date,) + search_key[1:]
-                if test_key in sheet2_data:
-                    for supplier in sheet2_data[test_key]:
-                        result.matched_suppliers.append((date, supplier))
-                else:
-                    all_matches = False
+        QMessageBox.information(self, "✅ 分析完成", message, QMessageBox.Ok)
 
-            result.is_all_match = all_matches and bool(result.matched_suppliers)
+        self.status_bar.showMessage("分析完成")
 
-        # 单条数据处理
-        elif not result.is_duplicate and search_key in sheet2_data:
-            result.is_match = True
-            for supplier in sheet2_data[search_key]:
-                result.matched_suppliers.append((search_key[0], supplier))
-
-        return result
-
-    def _check_duplicate(
-        self,
-        search_key: Tuple[str, str, str],
-        processed_keys: Set[Tuple[str, str, str]],
-        date_range_map: Dict[Tuple[str, str], List[str]]
-    ) -> bool:
+    def _on_analysis_failed(self, message: str):
         """
-        检查是否为重复数据
-
-        判断当前数据是否在之前已经处理过，包括直接重复和日期范围展开后的重复。
+        处理分析失败事件
 
         参数:
-            search_key: 待检查的搜索键
-            processed_keys: 已处理的键集合
-            date_range_map: 日期范围映射
-
-        返回:
-            bool: 如果是重复数据返回True，否则返回False
+            message: 错误信息
         """
-        # 检查是否直接重复
-        if search_key in processed_keys:
-            return True
+        self.filter_tab.set_progress_visible(False)
+        QMessageBox.critical(self, "错误", f"执行分析时出错：{message}")
+        self.status_bar.showMessage("分析失败")
 
-        # 检查是否在日期范围内
-        if ',' not in search_key[0]:
-            for range_key, months in date_range_map.items():
-                if search_key[1:] == range_key and search_key[0] in months:
-                    return True
+    def _on_analysis_cancelled(self):
+        """
+        处理分析取消事件
 
-        # 如果是日期范围，检查其展开的月份是否重复
-        if ',' in search_key[0]:
-            dates = search_key[0].split(',')
-            for date in dates:
-                single_key = (date,) + search_key[1:]
-                if single_key in processed_keys:
-                    return True
+        取消的分析不会保存任何结果，原文件保持不变。
+        """
+        self.filter_tab.set_progress_visible(False)
+        self.status_bar.showMessage("分析已取消")
 
-        return False
+    def _on_analysis_thread_finished(self):
+        """
+        处理工作线程结束事件
 
-    def _determine_cell_style(self, result: MatchResult):
+        停止进度轮询，恢复按钮状态并释放工作线程。
         """
-        根据匹配结果确定单元格样式
+        self.progress_timer.stop()
+        self.filter_tab.enable_cancel_button(False)
+        self.filter_tab.enable_analyze_button(True)
 
-        根据匹配结果的状态选择相应的颜色标记。
+        if self.analysis_worker is not None:
+            self.analysis_worker.deleteLater()
+            self.analysis_worker = None
 
-        样式优先级:
-            1. 黄色 - 重复数据（最高优先级）
-            2. 紫色 - 日期范围且全部匹配
-            3. 棕色 - 日期范围但未全部匹配
-            4. 绿色 - 单条数据匹配成功
-            5. 红色 - 单条数据未匹配
+    def closeEvent(self, event):
+        """
+        处理窗口关闭事件
 
-        参数:
-            result: 匹配结果对象
+        如果分析仍在运行，先请求取消并等待工作线程退出，
+        避免线程在窗口销毁后继续访问文件。
 
-        返回:
-            CellStyle对象
-        """
-        if result.is_duplicate:
-            return CellStyles.YELLOW
-        elif result.is_date_range:
-            return CellStyles.PURPLE if result.is_all_match else CellStyles.BROWN
-        elif result.is_match:
-            return CellStyles.GREEN
-        else:
-            return CellStyles.RED
+        参数:
+            event: 关闭事件对象
+        """
+        if self.analysis_worker is not None:
+            self.analysis_worker.request_cancel()
+            self.analysis_worker.wait()
+        super().closeEvent(event)
 
     # ==================== 帮助和对话框函数 ====================
 
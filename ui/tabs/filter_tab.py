@@ -16,6 +16,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, Signal
 
+from core.instrumentation import format_phase_seconds
 from ui.widgets.drop_zone import DropZoneGroupBox
 from ui.widgets.stat_card import StatCard
 
@@ -28,17 +29,19 @@ class FilterTab(QWidget):
     - 文件选择区域（支持拖拽）
     - 统计信息卡片展示
     - 进度条显示
-    - 浏览文件和开始分析按钮
+    - 浏览文件、开始分析和取消分析按钮
 
     Signals:
         file_browsed: 当用户点击浏览文件按钮时发出
         analyze_clicked: 当用户点击开始分析按钮时发出
+        cancel_clicked: 当用户点击取消分析按钮时发出
         file_dropped: 当文件被拖放到区域时发出，参数为文件路径(str)
     """
 
     # 信号定义
     file_browsed = Signal()
     analyze_clicked = Signal()
+    cancel_clicked = Signal()
     file_dropped = Signal(str)
 
     def __init__(self, parent: Optional[QWidget] = None):
@@ -54,6 +57,7 @@ class FilterTab(QWidget):
         # UI组件
         self.file_group: DropZoneGroupBox
         self.analyze_button: QPushButton
+        self.cancel_button: QPushButton
         self.progress_bar: QProgressBar
         self.stat_total: StatCard
         self.stat_matched: StatCard
@@ -177,7 +181,7 @@ class FilterTab(QWidget):
         创建按钮布局
 
         Returns:
-            包含浏览文件和开始分析按钮的布局
+            包含浏览文件、开始分析和取消分析按钮的布局
         """
         button_layout = QHBoxLayout()
         button_layout.addStretch()
@@ -190,6 +194,10 @@ class FilterTab(QWidget):
         self.analyze_button = self._create_analyze_button()
         button_layout.addWidget(self.analyze_button)
 
+        # 取消分析按钮
+        self.cancel_button = self._create_cancel_button()
+        button_layout.addWidget(self.cancel_button)
+
         button_layout.addStretch()
 
         return button_layout
@@ -257,6 +265,39 @@ class FilterTab(QWidget):
         """)
         return analyze_button
 
+    def _create_cancel_button(self) -> QPushButton:
+        """
+        创建取消分析按钮
+
+        Returns:
+            配置好的按钮组件，仅在分析运行期间可点击
+        """
+        cancel_button = QPushButton("⏹ 取消分析")
+        cancel_button.clicked.connect(self._on_cancel_clicked)
+        cancel_button.setEnabled(False)  # 分析开始前不可点击
+        cancel_button.setMinimumHeight(45)
+        cancel_button.setMinimumWidth(150)
+        cancel_button.setStyleSheet("""
+            QPushButton {
+                background-color: #EF5350;
+                color: white;
+                border: none;
+                padding: 12px 24px;
+                border-radius: 8px;
+                font-weight: bold;
+                font-size: 15px;
+            }
+            QPushButton:hover {
+                background-color: #E53935;
+            }
+            QPushButton:disabled {
+                background-color: #E0E0E0;
+                color: #9E9E9E;
+                border: 1px solid #D0D0D0;
+            }
+        """)
+        return cancel_button
+
     def _create_stats_section(self) -> QGroupBox:
         """
         创建统计信息区域
@@ -286,6 +327,13 @@ class FilterTab(QWidget):
         ])
         stats_layout.addWidget(second_row)
 
+        # 性能明细（各阶段耗时和计数），分析完成后显示
+        self.performance_label = QLabel()
+        self.performance_label.setWordWrap(True)
+        self.performance_label.setStyleSheet("color: #666666; font-size: 12px;")
+        self.performance_label.setVisible(False)
+        stats_layout.addWidget(self.performance_label)
+
         stats_layout.addStretch()
 
         return stats_group
@@ -345,6 +393,11 @@ class FilterTab(QWidget):
         logging.info("用户点击开始分析按钮")
         self.analyze_clicked.emit()
 
+    def _on_cancel_clicked(self):
+        """处理取消分析按钮点击事件"""
+        logging.info("用户点击取消分析按钮")
+        self.cancel_clicked.emit()
+
     def _on_file_selected(self, file_path: str):
         """
         处理文件选择事件
@@ -390,12 +443,23 @@ class FilterTab(QWidget):
         更新统计信息
 
         Args:
-            stats: 统计信息字典，包含total, matched, unmatched, rate等字段
+            stats: 统计信息字典，包含total, matched, unmatched, rate等字段，
+                包含phase_seconds时同时显示各阶段耗时和计数
         """
         self.stat_total.update_value(str(stats.get('total', 0)))
         self.stat_matched.update_value(str(stats.get('matched', 0)))
         self.stat_unmatched.update_value(str(stats.get('unmatched', 0)))
         self.stat_rate.update_value(f"{stats.get('rate', 0)}%")
+
+        if 'phase_seconds' in stats:
+            self.performance_label.setText(
+                f"⏱ 用时 {stats['elapsed']:.1f} 秒，{stats['rows_per_second']:,.0f} 行/秒"
+                f"（{format_phase_seconds(stats['phase_seconds'])}）\n"
+                f"日期范围 {stats['range_rows']} 行，重复 {stats['duplicate_rows']} 行，"
+                f"匹配原表 {stats['reference_keys']} 个键，"
+                f"标准化缓存命中 {stats['cache_hits']} 次（{stats['cache_hit_rate']}%）"
+            )
+            self.performance_label.setVisible(True)
         logging.info(f"统计信息已更新: {stats}")
 
     def set_progress_visible(self, visible: bool):
@@ -433,3 +497,12 @@ class FilterTab(QWidget):
             enabled: True为启用，False为禁用
         """
         self.analyze_button.setEnabled(enabled)
+
+    def enable_cancel_button(self, enabled: bool = True):
+        """
+        启用或禁用取消分析按钮
+
+        Args:
+            enabled: True为启用，False为禁用
+        """
+        self.cancel_button.setEnabled(enabled)
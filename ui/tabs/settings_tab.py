@@ -2,24 +2,30 @@
 设置标签页组件
 
 提供应用程序设置和关于信息的用户界面组件。
-包括日志记录开关和应用说明信息。
+包括日志记录和性能分析开关、结果输出方式、性能选项和应用说明信息。
 """
 
 import os
 import logging
 from typing import Optional
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QGroupBox, QCheckBox, QLabel
+    QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QCheckBox, QLabel, QPushButton, QSpinBox
 )
 from PySide6.QtCore import QSettings, Signal
 
+from core.batch_match_engine import NUMPY_AVAILABLE
+from core.index_cache import ReferenceIndexCache
+from core.partitioned_match_engine import MIN_PARALLEL_ROWS
+
 
 class SettingsTab(QWidget):
     """
     设置标签页组件
 
     提供应用程序的设置选项和关于信息，包括：
-    - 日志记录开关
+    - 日志记录开关和性能分析开关
+    - 结果输出方式（写回原文件或另存为新工作簿）
+    - 性能选项（匹配原表索引缓存、并行标准化等）
     - 关于应用说明
     - 版本信息展示
 
@@ -41,6 +47,8 @@ class SettingsTab(QWidget):
         self.settings = QSettings('供应商数据智能匹配系统', 'DataAnalysis')
         self.log_file: Optional[str] = None
         self.log_path_label: Optional[QLabel] = None  # 保存标签引用以便更新
+        self.profiling_checkbox: Optional[QCheckBox] = None
+        self.index_cache_label: Optional[QLabel] = None
         self._setup_ui()
 
     def _setup_ui(self):
@@ -52,6 +60,12 @@ class SettingsTab(QWidget):
         # 添加日志设置组
         layout.addWidget(self._create_logging_group())
 
+        # 添加输出设置组
+        layout.addWidget(self._create_output_group())
+
+        # 添加性能设置组
+        layout.addWidget(self._create_performance_group())
+
         # 添加关于信息组
         layout.addWidget(self._create_about_group())
 
@@ -80,8 +94,176 @@ class SettingsTab(QWidget):
         self.log_path_label.setStyleSheet("color: #666666; font-size: 11px;")
         log_layout.addWidget(self.log_path_label)
 
+        # 性能分析复选框（只用于下一次分析，不保存到设置中）
+        self.profiling_checkbox = QCheckBox("记录下一次分析的性能分析（cProfile）")
+        self.profiling_checkbox.stateChanged.connect(self._on_profiling_changed)
+        log_layout.addWidget(self.profiling_checkbox)
+
+        profiling_hint = QLabel(
+            "启用后下一次分析会明显变慢，结束后在日志文件所在目录生成\"性能分析_日期_时间\"的"
+            ".prof文件和文本摘要，只包含函数耗时，不包含表格数据，可以发给开发团队排查性能问题"
+        )
+        profiling_hint.setWordWrap(True)
+        profiling_hint.setStyleSheet("color: #666666; font-size: 11px;")
+        log_layout.addWidget(profiling_hint)
+
         return log_group
 
+    def _create_output_group(self) -> QGroupBox:
+        """
+        创建输出设置组
+
+        Returns:
+            QGroupBox: 包含结果输出方式选项的组框
+        """
+        output_group = QGroupBox("📤 输出设置")
+        output_layout = QVBoxLayout(output_group)
+
+        # 单独输出复选框
+        separate_checkbox = QCheckBox("将结果另存为新工作簿（不修改原文件）")
+        separate_checkbox.setChecked(self.is_separate_output_enabled())
+        separate_checkbox.stateChanged.connect(self._on_separate_output_changed)
+        output_layout.addWidget(separate_checkbox)
+
+        # 说明文字
+        hint_label = QLabel(
+            "启用后结果写入原文件旁的\"原文件名_匹配结果.xlsx\"，"
+            "原文件保持不变，大文件保存更快；待匹配表不再标记颜色。"
+        )
+        hint_label.setWordWrap(True)
+        hint_label.setStyleSheet("color: #666666; font-size: 11px;")
+        output_layout.addWidget(hint_label)
+
+        # 条件格式复选框
+        conditional_checkbox = QCheckBox("用条件格式标记颜色（写入\"匹配状态\"列）")
+        conditional_checkbox.setChecked(self.is_conditional_format_enabled())
+        conditional_checkbox.stateChanged.connect(self._on_conditional_format_changed)
+        output_layout.addWidget(conditional_checkbox)
+
+        conditional_hint = QLabel(
+            "启用后不再逐个设置单元格颜色，而是在待匹配表末尾增加一列写入每行的匹配状态，"
+            "由Excel的条件格式按状态显示相同的颜色（修改状态后颜色随之改变）。"
+            "文件大小和保存速度与逐个设置颜色基本相同。"
+        )
+        conditional_hint.setWordWrap(True)
+        conditional_hint.setStyleSheet("color: #666666; font-size: 11px;")
+        output_layout.addWidget(conditional_hint)
+
+        return output_group
+
+    def _create_performance_group(self) -> QGroupBox:
+        """
+        创建性能设置组
+
+        Returns:
+            QGroupBox: 包含性能选项的组框
+        """
+        performance_group = QGroupBox("⚡ 性能设置")
+        performance_layout = QVBoxLayout(performance_group)
+
+        # 索引缓存复选框
+        index_cache_checkbox = QCheckBox("缓存匹配原表索引（匹配原表未变化时跳过预处理）")
+        index_cache_checkbox.setChecked(self.is_index_cache_enabled())
+        index_cache_checkbox.stateChanged.connect(self._on_index_cache_changed)
+        performance_layout.addWidget(index_cache_checkbox)
+
+        # 缓存位置和大小，以及清空按钮
+        cache_row = QHBoxLayout()
+        self.index_cache_label = QLabel()
+        self.index_cache_label.setWordWrap(True)
+        self.index_cache_label.setStyleSheet("color: #666666; font-size: 11px;")
+        cache_row.addWidget(self.index_cache_label, 1)
+
+        clear_button = QPushButton("清空缓存")
+        clear_button.clicked.connect(self._on_clear_index_cache)
+        cache_row.addWidget(clear_button)
+        performance_layout.addLayout(cache_row)
+
+        self._update_index_cache_label()
+
+        # SQLite匹配原表复选框
+        sqlite_checkbox = QCheckBox("使用SQLite存储匹配原表（适用于数百万行的匹配原表，节省内存）")
+        sqlite_checkbox.setChecked(self.is_sqlite_reference_enabled())
+        sqlite_checkbox.stateChanged.connect(self._on_sqlite_reference_changed)
+        performance_layout.addWidget(sqlite_checkbox)
+
+        sqlite_hint = QLabel("启用后匹配原表写入临时数据库，分析结束后自动删除，此时不使用索引缓存")
+        sqlite_hint.setWordWrap(True)
+        sqlite_hint.setStyleSheet("color: #666666; font-size: 11px;")
+        performance_layout.addWidget(sqlite_hint)
+
+        # 批量匹配复选框（未安装NumPy时不可用）
+        batch_checkbox = QCheckBox("批量匹配（使用NumPy整列匹配，适用于大量数据）")
+        batch_checkbox.setChecked(self.is_batch_match_enabled())
+        batch_checkbox.setEnabled(NUMPY_AVAILABLE)
+        if not NUMPY_AVAILABLE:
+            batch_checkbox.setToolTip("未安装NumPy，无法使用批量匹配")
+        batch_checkbox.stateChanged.connect(self._on_batch_match_changed)
+        performance_layout.addWidget(batch_checkbox)
+
+        # 分区并行匹配复选框
+        partitioned_checkbox = QCheckBox("并行匹配（按客户和产品分区，在多个进程中匹配）")
+        partitioned_checkbox.setChecked(self.is_partitioned_match_enabled())
+        partitioned_checkbox.stateChanged.connect(self._on_partitioned_match_changed)
+        performance_layout.addWidget(partitioned_checkbox)
+
+        partitioned_hint = QLabel(
+            f"使用全部CPU核心匹配，只在待匹配表达到{MIN_PARALLEL_ROWS // 10000}万行时启用，"
+            "行数较少时自动使用逐行匹配；同时启用批量匹配时使用批量匹配，"
+            "使用SQLite存储匹配原表时不适用"
+        )
+        partitioned_hint.setWordWrap(True)
+        partitioned_hint.setStyleSheet("color: #666666; font-size: 11px;")
+        performance_layout.addWidget(partitioned_hint)
+
+        # 增量分析复选框
+        incremental_checkbox = QCheckBox("增量分析（再次分析时只重新匹配修改过的行）")
+        incremental_checkbox.setChecked(self.is_incremental_enabled())
+        incremental_checkbox.stateChanged.connect(self._on_incremental_changed)
+        performance_layout.addWidget(incremental_checkbox)
+
+        incremental_hint = QLabel(
+            "启用后每次分析的结果保存在缓存目录中；匹配原表变化时自动完整分析，"
+            "结果另存为新工作簿时不适用"
+        )
+        incremental_hint.setWordWrap(True)
+        incremental_hint.setStyleSheet("color: #666666; font-size: 11px;")
+        performance_layout.addWidget(incremental_hint)
+
+        # 流水线复选框
+        pipeline_checkbox = QCheckBox("流水线处理（读取、匹配和写出同时进行）")
+        pipeline_checkbox.setChecked(self.is_pipeline_enabled())
+        pipeline_checkbox.stateChanged.connect(self._on_pipeline_changed)
+        performance_layout.addWidget(pipeline_checkbox)
+
+        pipeline_hint = QLabel(
+            "只用于结果另存为新工作簿：在后台线程中读取待匹配表和写出结果，"
+            "内存占用不随行数增加"
+        )
+        pipeline_hint.setWordWrap(True)
+        pipeline_hint.setStyleSheet("color: #666666; font-size: 11px;")
+        performance_layout.addWidget(pipeline_hint)
+
+        # 标准化进程数
+        workers_row = QHBoxLayout()
+        workers_row.addWidget(QLabel("标准化进程数："))
+        workers_spinbox = QSpinBox()
+        workers_spinbox.setRange(1, os.cpu_count() or 1)
+        workers_spinbox.setValue(self.get_normalize_workers())
+        workers_spinbox.valueChanged.connect(self._on_normalize_workers_changed)
+        workers_row.addWidget(workers_spinbox)
+        workers_row.addStretch(1)
+        performance_layout.addLayout(workers_row)
+
+        workers_hint = QLabel(
+            "大于1时在多个进程中并行标准化两个工作表，只在客户和产品名称大多互不相同时有收益"
+        )
+        workers_hint.setWordWrap(True)
+        workers_hint.setStyleSheet("color: #666666; font-size: 11px;")
+        performance_layout.addWidget(workers_hint)
+
+        return performance_group
+
     def _create_about_group(self) -> QGroupBox:
         """
         创建关于信息组
@@ -124,6 +306,131 @@ class SettingsTab(QWidget):
         # 发出信号通知外部
         self.logging_toggled.emit(enabled)
 
+    def _on_profiling_changed(self, state: int):
+        """
+        性能分析设置改变的处理函数
+
+        Args:
+            state: 复选框状态（Qt.Checked或Qt.Unchecked）
+        """
+        logging.info(f"下一次分析的性能分析已{'启用' if state else '禁用'}")
+
+    def _on_separate_output_changed(self, state: int):
+        """
+        单独输出设置改变的处理函数
+
+        Args:
+            state: 复选框状态（Qt.Checked或Qt.Unchecked）
+        """
+        enabled = bool(state)
+        self.settings.setValue('separate_output', enabled)
+        logging.info(f"结果单独输出已{'启用' if enabled else '禁用'}")
+
+    def _on_conditional_format_changed(self, state: int):
+        """
+        条件格式设置改变的处理函数
+
+        Args:
+            state: 复选框状态（Qt.Checked或Qt.Unchecked）
+        """
+        enabled = bool(state)
+        self.settings.setValue('conditional_format', enabled)
+        logging.info(f"条件格式标记颜色已{'启用' if enabled else '禁用'}")
+
+    def _on_index_cache_changed(self, state: int):
+        """
+        索引缓存设置改变的处理函数
+
+        Args:
+            state: 复选框状态（Qt.Checked或Qt.Unchecked）
+        """
+        enabled = bool(state)
+        self.settings.setValue('index_cache', enabled)
+        logging.info(f"匹配原表索引缓存已{'启用' if enabled else '禁用'}")
+
+    def _on_clear_index_cache(self):
+        """
+        清空索引缓存按钮的处理函数
+        """
+        ReferenceIndexCache().clear()
+        self._update_index_cache_label()
+
+    def _on_sqlite_reference_changed(self, state: int):
+        """
+        SQLite匹配原表设置改变的处理函数
+
+        Args:
+            state: 复选框状态（Qt.Checked或Qt.Unchecked）
+        """
+        enabled = bool(state)
+        self.settings.setValue('sqlite_reference', enabled)
+        logging.info(f"SQLite匹配原表已{'启用' if enabled else '禁用'}")
+
+    def _on_batch_match_changed(self, state: int):
+        """
+        批量匹配设置改变的处理函数
+
+        Args:
+            state: 复选框状态（Qt.Checked或Qt.Unchecked）
+        """
+        enabled = bool(state)
+        self.settings.setValue('batch_match', enabled)
+        logging.info(f"批量匹配已{'启用' if enabled else '禁用'}")
+
+    def _on_partitioned_match_changed(self, state: int):
+        """
+        并行匹配设置改变的处理函数
+
+        Args:
+            state: 复选框状态（Qt.Checked或Qt.Unchecked）
+        """
+        enabled = bool(state)
+        self.settings.setValue('partitioned_match', enabled)
+        logging.info(f"并行匹配已{'启用' if enabled else '禁用'}")
+
+    def _on_incremental_changed(self, state: int):
+        """
+        增量分析设置改变的处理函数
+
+        Args:
+            state: 复选框状态（Qt.Checked或Qt.Unchecked）
+        """
+        enabled = bool(state)
+        self.settings.setValue('incremental_analysis', enabled)
+        logging.info(f"增量分析已{'启用' if enabled else '禁用'}")
+
+    def _on_pipeline_changed(self, state: int):
+        """
+        流水线处理设置改变的处理函数
+
+        Args:
+            state: 复选框状态（Qt.Checked或Qt.Unchecked）
+        """
+        enabled = bool(state)
+        self.settings.setValue('pipeline', enabled)
+        logging.info(f"流水线处理已{'启用' if enabled else '禁用'}")
+
+    def _on_normalize_workers_changed(self, value: int):
+        """
+        标准化进程数改变的处理函数
+
+        Args:
+            value: 新的进程数
+        """
+        self.settings.setValue('normalize_workers', value)
+        logging.info(f"标准化进程数已设置为: {value}")
+
+    def _update_index_cache_label(self):
+        """
+        更新索引缓存位置和大小的显示
+        """
+        if self.index_cache_label is None:
+            return
+
+        cache = ReferenceIndexCache()
+        size_mb = cache.total_bytes() / (1024 * 1024)
+        self.index_cache_label.setText(f"缓存位置：{cache.cache_dir}（已使用 {size_mb:.1f} MB）")
+
     def _get_log_file_path(self) -> str:
         """
         获取日志文件的绝对路径
@@ -156,6 +463,109 @@ class SettingsTab(QWidget):
         """
         return self.settings.value('enable_logging', False, bool)
 
+    def is_profiling_enabled(self) -> bool:
+        """
+        获取下一次分析是否记录性能分析
+
+        Returns:
+            bool: 需要记录性能分析返回True，否则返回False
+        """
+        return self.profiling_checkbox is not None and self.profiling_checkbox.isChecked()
+
+    def set_profiling_enabled(self, enabled: bool):
+        """
+        设置下一次分析是否记录性能分析
+
+        Args:
+            enabled: 是否记录性能分析
+        """
+        if self.profiling_checkbox is not None:
+            self.profiling_checkbox.setChecked(enabled)
+
+    def is_separate_output_enabled(self) -> bool:
+        """
+        获取结果单独输出的启用状态
+
+        Returns:
+            bool: 结果另存为新工作簿返回True，写回原文件返回False
+        """
+        return self.settings.value('separate_output', False, bool)
+
+    def is_conditional_format_enabled(self) -> bool:
+        """
+        获取条件格式标记颜色的启用状态
+
+        Returns:
+            bool: 用状态列和条件格式标记颜色返回True，逐个设置单元格颜色返回False
+        """
+        return self.settings.value('conditional_format', False, bool)
+
+    def is_index_cache_enabled(self) -> bool:
+        """
+        获取匹配原表索引缓存的启用状态
+
+        默认关闭：缓存会把匹配原表中的客户、产品和供应商数据写入缓存目录，由用户自行启用。
+
+        Returns:
+            bool: 启用缓存返回True，否则返回False
+        """
+        return self.settings.value('index_cache', False, bool)
+
+    def is_sqlite_reference_enabled(self) -> bool:
+        """
+        获取SQLite匹配原表的启用状态
+
+        Returns:
+            bool: 匹配原表存入SQLite临时数据库返回True，保存在内存中返回False
+        """
+        return self.settings.value('sqlite_reference', False, bool)
+
+    def is_batch_match_enabled(self) -> bool:
+        """
+        获取批量匹配的启用状态
+
+        Returns:
+            bool: 启用批量匹配且已安装NumPy时返回True，否则返回False
+        """
+        return NUMPY_AVAILABLE and self.settings.value('batch_match', False, bool)
+
+    def is_partitioned_match_enabled(self) -> bool:
+        """
+        获取并行匹配的启用状态
+
+        Returns:
+            bool: 启用并行匹配返回True，否则返回False
+        """
+        return self.settings.value('partitioned_match', False, bool)
+
+    def is_incremental_enabled(self) -> bool:
+        """
+        获取增量分析的启用状态
+
+        Returns:
+            bool: 启用增量分析返回True，否则返回False
+        """
+        return self.settings.value('incremental_analysis', False, bool)
+
+    def is_pipeline_enabled(self) -> bool:
+        """
+        获取流水线处理的启用状态
+
+        Returns:
+            bool: 启用流水线处理返回True，否则返回False
+        """
+        return self.settings.value('pipeline', False, bool)
+
+    def get_normalize_workers(self) -> int:
+        """
+        获取标准化进程数
+
+        Returns:
+            int: 标准化使用的进程数，不超过CPU核心数
+        """
+        workers = self.settings.value('normalize_workers', 1, int)
+        return max(1, min(workers, os.cpu_count() or 1))
+
     def get_settings(self) -> QSettings:
         """
         获取设置对象